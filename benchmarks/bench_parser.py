@@ -0,0 +1,213 @@
+"""
+PostParser 회귀 / 성능 벤치마크
+- benchmarks/fixtures/*.html (저장해 둔 모바일 포스트 HTML)을 백엔드별로 파싱
+- 결과가 fixtures/expected/*.json (기대 출력)과 다르면 실패
+- 초당 포스트 수, 파싱 지연 p50/p99, 최대 메모리를 측정하고
+  기준값(baseline.json)보다 p50이 허용치 이상 느려지면 실패
+- 전체 디코딩 후 파싱(text)과 바이트 빠른 경로(bytes)를 함께 측정
+
+사용법:
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --rounds 50 --backends html.parser selectolax
+    python benchmarks/bench_parser.py --update-expected   # 파서 동작을 의도적으로 바꾼 뒤 기대 출력 갱신
+    python benchmarks/bench_parser.py --save-baseline     # 현재 속도를 기준값으로 저장 (머신마다 따로)
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from scraper.parser import PostParser  # noqa: E402
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCH_DIR, "fixtures")
+EXPECTED_DIR = os.path.join(FIXTURE_DIR, "expected")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+# 측정할 경로: text = 응답 전체를 디코딩한 뒤 파싱, bytes = 바이트 빠른 경로
+MODES = ("text", "bytes")
+
+# 기준값 대비 허용하는 p50 증가율 (0.25 = 25%)
+MAX_REGRESSION = 0.25
+
+
+def load_fixtures(fixture_dir: str = FIXTURE_DIR) -> dict:
+    """픽스처 HTML 원본 바이트 로드 ({파일명: bytes})"""
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "*.html"))):
+        with open(path, "rb") as f:
+            fixtures[os.path.basename(path)] = f.read()
+    return fixtures
+
+
+def _expected_path(name: str) -> str:
+    return os.path.join(EXPECTED_DIR, os.path.splitext(name)[0] + ".json")
+
+
+def to_expected(result: dict) -> dict:
+    """파싱 결과를 기대 출력 형식으로 (블록은 JSON 배열, blogId/logNo 제외)"""
+    data = {key: value for key, value in result.items() if key not in ("blogId", "logNo")}
+    return json.loads(json.dumps(data, ensure_ascii=False))
+
+
+def load_expected(fixtures: dict) -> dict:
+    """기대 출력 로드 ({파일명: dict}, 없는 픽스처는 제외)"""
+    expected = {}
+    for name in fixtures:
+        path = _expected_path(name)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                expected[name] = json.load(f)
+    return expected
+
+
+def save_expected(results: dict):
+    """기대 출력 저장"""
+    os.makedirs(EXPECTED_DIR, exist_ok=True)
+    for name, result in results.items():
+        with open(_expected_path(name), "w", encoding="utf-8") as f:
+            json.dump(to_expected(result), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+
+def parse_one(parser: PostParser, name: str, raw: bytes, mode: str = "text") -> dict:
+    """픽스처 하나 파싱"""
+    if mode == "bytes":
+        return parser.parse_mobile_post_bytes(raw, "utf-8", "sampleblog", name)
+    return parser.parse_mobile_post(raw.decode("utf-8", errors="replace"), "sampleblog", name)
+
+
+def parse_all(parser: PostParser, fixtures: dict, mode: str = "text") -> dict:
+    """픽스처 전체 파싱 ({파일명: 결과})"""
+    return {name: parse_one(parser, name, raw, mode) for name, raw in fixtures.items()}
+
+
+def percentile(samples: list, pct: float) -> float:
+    """백분위수 (nearest-rank)"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def bench_backend(backend: str, fixtures: dict, rounds: int, mode: str = "text") -> dict:
+    """
+    백엔드 하나 측정
+
+    Args:
+        backend: 파서 백엔드 이름
+        fixtures: {파일명: bytes}
+        rounds: 픽스처 전체를 반복 파싱할 횟수
+        mode: "text" 또는 "bytes"
+
+    Returns:
+        {"posts_per_sec", "p50_ms", "p99_ms", "peak_kb"}
+    """
+    parser = PostParser(backend)
+    parse_all(parser, fixtures, mode)  # 워밍업
+
+    samples = []
+    for _ in range(rounds):
+        for name, raw in fixtures.items():
+            started = time.perf_counter()
+            parse_one(parser, name, raw, mode)
+            samples.append(time.perf_counter() - started)
+
+    # 메모리는 한 번만 따로 측정 (tracemalloc이 속도 측정을 왜곡하지 않도록)
+    tracemalloc.start()
+    parse_all(parser, fixtures, mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "posts_per_sec": len(samples) / sum(samples),
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "peak_kb": peak / 1024,
+    }
+
+
+def load_baseline(path: str) -> dict:
+    """기준값 로드 ({"백엔드/경로": 측정값}, 파일이 없으면 빈 딕셔너리)"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="PostParser 회귀 / 성능 벤치마크")
+    arg_parser.add_argument("--rounds", type=int, default=20, help="반복 횟수 (기본: 20)")
+    arg_parser.add_argument("--backends", nargs="+", default=None,
+                            help="측정할 백엔드 (기본: 설치된 전체)")
+    arg_parser.add_argument("--update-expected", action="store_true",
+                            help="html.parser 결과로 기대 출력(fixtures/expected) 갱신")
+    arg_parser.add_argument("--baseline", default=BASELINE_PATH,
+                            help="비교할 기준값 파일 (기본: benchmarks/baseline.json, 없으면 비교 생략)")
+    arg_parser.add_argument("--save-baseline", action="store_true", help="이번 측정값을 기준값으로 저장")
+    arg_parser.add_argument("--max-regression", type=float, default=MAX_REGRESSION,
+                            help=f"허용하는 p50 증가율 (기본: {MAX_REGRESSION})")
+    args = arg_parser.parse_args(argv)
+
+    fixtures = load_fixtures()
+    if not fixtures:
+        print(f"[오류] 픽스처가 없습니다: {FIXTURE_DIR}")
+        return 1
+
+    if args.update_expected:
+        save_expected(parse_all(PostParser("html.parser"), fixtures))
+        print(f"기대 출력 {len(fixtures)}개 갱신: {EXPECTED_DIR}")
+
+    expected = load_expected(fixtures)
+    missing = [name for name in fixtures if name not in expected]
+    if missing:
+        print(f"[오류] 기대 출력이 없습니다: {', '.join(missing)} (--update-expected로 생성)")
+        return 1
+
+    backends = args.backends or PostParser.available_backends()
+    baseline = {} if args.save_baseline else load_baseline(args.baseline)
+    print(f"픽스처 {len(fixtures)}개, {args.rounds}회 반복"
+          + (f", 기준값 대비 p50 +{args.max_regression:.0%}까지 허용" if baseline else "") + "\n")
+
+    failures = 0
+    measured = {}
+
+    print(f"{'백엔드':<14}{'경로':<8}{'포스트/초':>10}{'p50(ms)':>10}{'p99(ms)':>10}{'최대 메모리(KB)':>16}  결과")
+    for backend in backends:
+        for mode in MODES:
+            try:
+                stats = bench_backend(backend, fixtures, args.rounds, mode)
+            except ValueError as e:
+                print(f"{backend:<14}  건너뜀 ({e})")
+                break
+
+            key = f"{backend}/{mode}"
+            measured[key] = stats
+            actual = parse_all(PostParser(backend), fixtures, mode)
+            diff = [name for name in fixtures if to_expected(actual[name]) != expected[name]]
+            notes = [f"출력 변경: {', '.join(diff)}"] if diff else []
+
+            base = baseline.get(key)
+            if base and stats["p50_ms"] > base["p50_ms"] * (1 + args.max_regression):
+                notes.append(f"느려짐: p50 {base['p50_ms']:.3f} → {stats['p50_ms']:.3f}ms")
+            failures += len(notes)
+
+            print(f"{backend:<14}{mode:<8}{stats['posts_per_sec']:>10.0f}{stats['p50_ms']:>10.3f}"
+                  f"{stats['p99_ms']:>10.3f}{stats['peak_kb']:>16.1f}  {'; '.join(notes) or '통과'}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(measured, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {args.baseline}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
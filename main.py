@@ -3,17 +3,25 @@
 
 사용법:
     python main.py
+    python main.py --batch                 # config/blogs.json 전체 일괄 수집
+    python main.py --batch "#IT·컴퓨터"    # 주제로 필터링해서 일괄 수집
 """
 
+import argparse
 import os
 import json
-from scraper import NaverBlogScraper
-from utils import save_posts_to_files
+import sys
+from scraper import BatchScraper, NaverBlogScraper
+from utils import save_posts_stream
+from utils.bloggers_cli import filter_by_topic, load_blogs
 
 # 설정 파일 경로
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), "config", ".last_search.json")
 OUTPUT_BASE = os.path.join(os.path.dirname(__file__), "output")
 
+# 본문 동시 요청 수 (호스트당 요청 간격은 delay로 유지됨)
+SCRAPE_WORKERS = 4
+
 
 def load_last_search():
     """마지막 검색 정보 불러오기"""
@@ -93,9 +101,12 @@ def main():
     print(f"   블로그 ID: {blog_id}")
     print()
 
-    # 검색 수 입력 (최소 1개, 최대 50개)
-    limit_input = input(">> 검색할 포스트 수 (1~50, 기본 10): ").strip()
-    if not limit_input:
+    # 검색 수 입력 (최소 1개, 최대 50개, "전체"면 블로그 전체 수집)
+    limit_input = input(">> 검색할 포스트 수 (1~50, 기본 10, 전체 수집은 '전체'): ").strip()
+    archive = limit_input.lower() in ("전체", "all")
+    if archive:
+        limit = None
+    elif not limit_input:
         limit = 10
     else:
         try:
@@ -104,7 +115,7 @@ def main():
                 print("   최소 1개로 설정합니다.")
                 limit = 1
             elif limit > 50:
-                print("   최대 50개로 제한됩니다.")
+                print("   최대 50개로 제한됩니다. (전체 수집은 '전체' 입력)")
                 limit = 50
         except ValueError:
             print("   잘못된 입력입니다. 기본값 10으로 설정합니다.")
@@ -112,27 +123,31 @@ def main():
 
     print()
     print("-" * 60)
-    print(f"블로그를 체크합니다... (ID: {blog_id}, 수량: {limit}개)")
+    print(f"블로그를 체크합니다... (ID: {blog_id}, 수량: {'전체' if archive else f'{limit}개'})")
     print("-" * 60)
     print()
 
     # 스크래퍼 초기화 및 실행 (delay 기본값 0.3초)
-    scraper = NaverBlogScraper(blog_id=blog_id)
-
-    posts = scraper.scrape_all(
-        limit=limit,
-        include_content=True,
-        include_images=True
-    )
+    scraper = NaverBlogScraper(blog_id=blog_id, workers=SCRAPE_WORKERS)
 
-    if not posts:
+    # 블로그 ID별 폴더에 포스트를 받는 대로 기록 (중단되어도 받은 포스트는 남음)
+    output_dir = get_blog_output_dir(blog_id)
+    if archive:
+        # 중단되면 다시 실행했을 때 받은 포스트부터 이어서 수집
+        posts = scraper.iter_archive(include_images=True)
+    else:
+        posts = scraper.iter_posts(
+            limit=limit,
+            include_content=True,
+            include_images=True,
+            incremental=True
+        )
+    result = save_posts_stream(posts, output_dir=output_dir, prefix=blog_id)
+
+    if not result["total"]:
         print("스크래핑된 포스트가 없습니다. 블로그 ID를 확인해주세요.")
         return
 
-    # 블로그 ID별 폴더에 저장
-    output_dir = get_blog_output_dir(blog_id)
-    result = save_posts_to_files(posts, output_dir=output_dir, prefix=blog_id)
-
     # 마지막 검색 정보 저장
     save_last_search(blog_id, output_dir)
 
@@ -145,5 +160,38 @@ def main():
     print()
 
 
+def run_batch(argv):
+    """config/blogs.json의 블로그들을 일괄 수집"""
+    parser = argparse.ArgumentParser(prog="main.py --batch", description="블로그 일괄 수집")
+    parser.add_argument("topic", nargs="?", default="all", help="주제 필터 (예: #IT·컴퓨터, 기본: all)")
+    parser.add_argument("--limit", type=int, default=10, help="블로그당 포스트 수 (1~50, 기본 10)")
+    parser.add_argument("--workers", type=int, default=16, help="본문 동시 요청 수 (기본 16)")
+    parser.add_argument("--global-rate", type=float, default=None, help="전체 초당 요청 수 상한")
+    parser.add_argument("--parser", default="html.parser",
+                        choices=["html.parser", "lxml", "selectolax", "auto"],
+                        help="본문 HTML 파서 (기본 html.parser, auto=설치된 것 중 가장 빠른 것)")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="본문 파싱 프로세스 수 (기본 0=요청 스레드에서 파싱)")
+    parser.add_argument("--parse-queue", type=int, default=None,
+                        help="파싱 대기열 크기 (기본 파싱 프로세스 수 x 4)")
+    args = parser.parse_args(argv)
+
+    blogs = load_blogs()
+    if args.topic != "all":
+        blogs = filter_by_topic(blogs, args.topic)
+    if not blogs:
+        print(f"'{args.topic}'에 해당하는 블로그가 없습니다.")
+        return
+
+    limit = min(max(args.limit, 1), 50)
+    batch = BatchScraper(list(blogs), workers=args.workers, global_rate=args.global_rate,
+                         output_base=OUTPUT_BASE, parser_backend=args.parser,
+                         parse_workers=args.parse_workers, parse_queue=args.parse_queue)
+    batch.run(limit=limit)
+
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        run_batch(sys.argv[2:])
+    else:
+        main()
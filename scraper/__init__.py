@@ -1,5 +1,30 @@
+from .async_blog_scraper import AsyncNaverBlogScraper, scrape_blogs_async
+from .autocomplete_crawler import AutocompleteCrawler, SuggestionTrie
+from .batch_scraper import BatchScraper
+from .blocks import Block, PostBlocks
 from .blog_scraper import NaverBlogScraper
+from .http_cache import HttpCache
+from .keyword_cache import KeywordCache
+from .parse_pool import ParsePool
 from .parser import PostParser
+from .post_store import PostStore
+from .rate_limiter import RateLimiter
 from .youtube_scraper import YouTubeScraper
 
-__all__ = ["NaverBlogScraper", "PostParser", "YouTubeScraper"]
+__all__ = [
+    "AsyncNaverBlogScraper",
+    "AutocompleteCrawler",
+    "BatchScraper",
+    "Block",
+    "HttpCache",
+    "KeywordCache",
+    "NaverBlogScraper",
+    "ParsePool",
+    "PostBlocks",
+    "PostParser",
+    "PostStore",
+    "RateLimiter",
+    "SuggestionTrie",
+    "YouTubeScraper",
+    "scrape_blogs_async",
+]
@@ -0,0 +1,85 @@
+"""
+Aho-Corasick 다중 패턴 매칭 모듈
+- 여러 패턴을 하나의 오토마톤으로 만들어 두고 텍스트를 한 번만 훑어 패턴별 등장 횟수 집계
+- 횟수는 패턴마다 str.count()와 같은 기준 (왼쪽부터, 겹치지 않게)
+"""
+
+from collections import deque
+from typing import Iterable, List
+
+
+class AhoCorasick:
+    """다중 패턴 매처 (만든 뒤에는 읽기 전용이므로 스레드 간 공유 가능)"""
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Args:
+            patterns: 찾을 패턴들 (빈 문자열은 무시, 같은 패턴이 여러 번 있으면 각각 집계)
+        """
+        self.patterns = list(patterns)
+        self._lengths = [len(p) for p in self.patterns]
+        self._alphabet = frozenset("".join(self.patterns))
+
+        # 트라이 (노드별 다음 글자 → 노드), 실패 링크, 노드에서 끝나는 패턴 번호
+        goto = [{}]
+        outputs = [[]]
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                child = goto[node].get(ch)
+                if child is None:
+                    child = len(goto)
+                    goto[node][ch] = child
+                    goto.append({})
+                    outputs.append([])
+                node = child
+            outputs[node].append(index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(ch, 0)
+                # 실패 링크 쪽(접미사)에서 끝나는 패턴도 함께 보고
+                outputs[child].extend(outputs[fail[child]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(out) for out in outputs]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def count(self, text: str) -> List[int]:
+        """
+        패턴별 등장 횟수 (patterns 순서, 각 패턴은 text.count(pattern)과 같은 값)
+
+        Args:
+            text: 검색할 텍스트
+        """
+        goto, fail, outputs, lengths = self._goto, self._fail, self._outputs, self._lengths
+        alphabet = self._alphabet
+        counts = [0] * len(self.patterns)
+        # 패턴별 마지막으로 센 위치 (겹치는 등장은 세지 않음)
+        last_end = [0] * len(self.patterns)
+
+        node = 0
+        for pos, ch in enumerate(text, 1):
+            if ch not in alphabet:
+                node = 0
+                continue
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for index in outputs[node]:
+                if pos - lengths[index] >= last_end[index]:
+                    counts[index] += 1
+                    last_end[index] = pos
+        return counts
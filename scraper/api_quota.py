@@ -0,0 +1,134 @@
+"""
+API 일일 할당량 모듈
+- 네이버 검색 API 하루 호출 수를 SQLite(output/.cache/api_quota.sqlite3)에 기록해 여러 프로세스가 함께 사용
+- 호출 전에 할당량을 차감하고, 남은 할당량이 없으면 요청하지 않음
+- 날짜는 한국 시간 기준 (네이버 할당량은 자정(KST)에 초기화)
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+try:
+    from .cache import CACHE_DIR
+except ImportError:
+    # python scraper/keyword_collector.py 로 직접 실행한 경우
+    from cache import CACHE_DIR
+
+KST = timezone(timedelta(hours=9))
+
+# 네이버 검색 API 기본 일일 호출 한도
+DEFAULT_DAILY_LIMIT = 25000
+
+
+class QuotaExceeded(Exception):
+    """오늘 할당량을 모두 사용함"""
+
+
+class ApiQuota:
+    """일일 API 호출 수 집계 (프로세스 간 공유, 스레드 안전)"""
+
+    def __init__(self, daily_limit: int = DEFAULT_DAILY_LIMIT,
+                 path: str = os.path.join(CACHE_DIR, "api_quota.sqlite3"), name: str = "naver_search"):
+        """
+        Args:
+            daily_limit: 하루 최대 호출 수
+            path: SQLite 파일 경로
+            name: 할당량 이름 (API별로 따로 집계)
+        """
+        self.daily_limit = daily_limit
+        self.path = path
+        self.name = name
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 다른 프로세스가 쓰는 중이면 잠시 기다림
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS usage ("
+            " name TEXT NOT NULL, day TEXT NOT NULL, calls INTEGER NOT NULL,"
+            " PRIMARY KEY (name, day))"
+        )
+
+    @staticmethod
+    def today() -> str:
+        """오늘 날짜 (KST, YYYY-MM-DD)"""
+        return datetime.now(KST).strftime("%Y-%m-%d")
+
+    def used(self) -> int:
+        """오늘 사용한 호출 수"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT calls FROM usage WHERE name = ? AND day = ?", (self.name, self.today())
+            ).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self) -> int:
+        """오늘 남은 호출 수"""
+        return max(0, self.daily_limit - self.used())
+
+    def try_acquire(self, calls: int = 1) -> bool:
+        """
+        호출 수 차감 (남은 할당량이 부족하면 차감하지 않음)
+
+        Args:
+            calls: 사용할 호출 수
+
+        Returns:
+            차감했으면 True
+        """
+        day = self.today()
+        with self._lock:
+            # 다른 프로세스와 동시에 차감해도 한도를 넘지 않도록 쓰기 잠금을 잡고 확인
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT calls FROM usage WHERE name = ? AND day = ?", (self.name, day)
+                ).fetchone()
+                used = row[0] if row else 0
+                if used + calls > self.daily_limit:
+                    return False
+                self._conn.execute(
+                    "INSERT INTO usage (name, day, calls) VALUES (?, ?, ?)"
+                    " ON CONFLICT (name, day) DO UPDATE SET calls = calls + excluded.calls",
+                    (self.name, day, calls),
+                )
+                return True
+            finally:
+                self._conn.execute("COMMIT")
+
+    def acquire(self, calls: int = 1):
+        """
+        호출 수 차감
+
+        Raises:
+            QuotaExceeded: 남은 할당량이 부족할 때
+        """
+        if not self.try_acquire(calls):
+            raise QuotaExceeded(f"오늘 API 할당량({self.daily_limit:,}회)을 모두 사용했습니다")
+
+    def exhaust(self):
+        """서버가 한도 초과를 알려 온 경우 - 오늘 남은 할당량을 0으로 기록"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO usage (name, day, calls) VALUES (?, ?, ?)"
+                " ON CONFLICT (name, day) DO UPDATE SET calls = MAX(calls, excluded.calls)",
+                (self.name, self.today(), self.daily_limit),
+            )
+
+    def summary(self) -> str:
+        """오늘 사용량 한 줄 요약"""
+        used = self.used()
+        return f"[할당량] 오늘 {used:,}/{self.daily_limit:,}회 사용 (남은 호출 {max(0, self.daily_limit - used):,}회)"
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
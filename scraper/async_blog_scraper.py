@@ -0,0 +1,368 @@
+"""
+네이버 블로그 비동기 스크래퍼 모듈
+- asyncio + aiohttp로 여러 블로그를 하나의 이벤트 루프에서 동시 수집
+- HTML 파싱(PostParser)은 executor에서 실행해 이벤트 루프를 막지 않음
+"""
+
+import asyncio
+import json
+from collections import Counter
+from concurrent.futures import Executor
+from typing import AsyncIterator, List, Optional
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+from .blog_scraper import BaseNaverBlogScraper
+from .parser import PostParser
+from .rate_limiter import RateLimiter
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+def create_session(limit: int = 1000, limit_per_host: int = 0, timeout: float = 10) -> "aiohttp.ClientSession":
+    """
+    여러 스크래퍼가 공유할 aiohttp 세션 생성
+
+    Args:
+        limit: 전체 동시 연결 수
+        limit_per_host: 호스트당 동시 연결 수 (0이면 제한 없음)
+        timeout: 요청 타임아웃 (초)
+    """
+    if not HAS_AIOHTTP:
+        raise ImportError("aiohttp가 설치되어 있지 않습니다. pip install aiohttp")
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout))
+
+
+class AsyncNaverBlogScraper(BaseNaverBlogScraper):
+    """
+    네이버 블로그 비동기 스크래퍼 (NaverBlogScraper와 같은 메서드/결과 형식)
+
+    사용 예:
+        async with AsyncNaverBlogScraper("blog_id") as scraper:
+            posts = await scraper.scrape_all(limit=10)
+    """
+
+    def __init__(self, blog_id: str, session: Optional["aiohttp.ClientSession"] = None,
+                 delay: float = 0.3, concurrency: int = 8,
+                 rate_limiter: Optional[RateLimiter] = None, executor: Optional[Executor] = None,
+                 retry_policy: Optional[RetryPolicy] = None, circuit_breaker: Optional[CircuitBreaker] = None,
+                 parser_backend: str = "html.parser"):
+        """
+        Args:
+            blog_id: 네이버 블로그 ID
+            session: 공유 aiohttp 세션 (None이면 async with 진입 시 생성)
+            delay: 호스트별 요청 간 딜레이 (초) - rate_limiter가 없을 때 사용
+            concurrency: 이 블로그에 대한 최대 동시 요청 수
+            rate_limiter: 호스트별 속도 제한기 (여러 블로그가 공유하면 전체 요청 간격 유지)
+            executor: 파싱용 executor (None이면 이벤트 루프 기본 스레드풀)
+            retry_policy: 일시적 오류 재시도 정책 (None이면 기본 정책)
+            circuit_breaker: 호스트별 서킷 브레이커 (여러 블로그가 공유)
+            parser_backend: 본문 HTML 파서 ("html.parser", "lxml", "selectolax", "auto")
+        """
+        super().__init__(blog_id)
+        self.session = session
+        self._own_session = session is None
+        self.delay = delay
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.rate_limiter = rate_limiter or RateLimiter.from_delay(delay)
+        self.executor = executor
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.parser = PostParser(parser_backend)
+
+    async def __aenter__(self):
+        if self.session is None:
+            self.session = create_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """직접 생성한 세션 정리"""
+        if self._own_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _fetch(self, url: str, headers: dict, encoding: Optional[str] = None, as_bytes: bool = False,
+                     with_encoding: bool = False):
+        """
+        속도 제한과 재시도를 적용한 GET 요청
+
+        Returns:
+            응답 본문 (as_bytes면 bytes, 아니면 str)
+            with_encoding이면 (본문, 응답 인코딩) - 인코딩은 헤더에 없으면 내용으로 추정
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: 재시도 후에도 요청 실패
+            CircuitOpenError: 서킷이 열려 있을 때 (aiohttp.ClientError로 감싸서 발생)
+        """
+        if self.session is None:
+            raise RuntimeError("세션이 없습니다. async with 블록 안에서 사용하세요.")
+        attempt = 0
+        while True:
+            try:
+                self.circuit_breaker.before_request(url)
+            except CircuitOpenError as e:
+                raise aiohttp.ClientError(str(e)) from e
+
+            retry_after = None
+            async with self.semaphore:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async(url)
+                try:
+                    async with self.session.get(url, headers=headers) as resp:
+                        if not self.retry_policy.is_retryable_status(resp.status):
+                            resp.raise_for_status()
+                            if as_bytes:
+                                body = await resp.read()
+                            else:
+                                body = await resp.text(encoding=encoding, errors="replace")
+                            self.circuit_breaker.record_success(url)
+                            if self.rate_limiter:
+                                self.rate_limiter.record_success(url)
+                            if with_encoding:
+                                return body, self._response_encoding(resp)
+                            return body
+                        error = aiohttp.ClientResponseError(
+                            resp.request_info, resp.history, status=resp.status, message=resp.reason or ""
+                        )
+                        retry_after = self.retry_policy.parse_retry_after(resp.headers.get("Retry-After"))
+                except aiohttp.ClientResponseError:
+                    # 재시도 대상이 아닌 상태 코드 (404 등)
+                    raise
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = e
+
+            self.circuit_breaker.record_failure(url)
+            if self.rate_limiter:
+                self.rate_limiter.record_error(url)
+            if attempt >= self.retry_policy.max_retries:
+                raise error
+            await asyncio.sleep(self.retry_policy.delay_for(attempt, retry_after))
+            attempt += 1
+
+    @staticmethod
+    def _response_encoding(resp: "aiohttp.ClientResponse") -> str:
+        """응답 인코딩 (NaverBlogScraper._response_encoding과 같은 기준, 본문을 읽은 뒤 호출)"""
+        try:
+            return resp.get_encoding()
+        except (RuntimeError, LookupError):
+            return resp.charset or "utf-8"
+
+    async def _parse_in_executor(self, func, *args):
+        """CPU 작업(파싱)을 executor에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def get_post_list(self, limit: Optional[int] = None) -> list:
+        """
+        RSS 피드에서 포스트 목록 가져오기
+
+        Args:
+            limit: 가져올 포스트 수 (None이면 전체)
+
+        Returns:
+            포스트 목록 (제목, 링크, logNo, 날짜, 요약)
+        """
+        try:
+            content = await self._fetch(self._rss_url(), self.DESKTOP_HEADERS, as_bytes=True)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"RSS 요청 실패 ({self.blog_id}): {e}")
+            return []
+
+        return await self._parse_in_executor(self._parse_rss, content, limit)
+
+    async def get_categories(self, use_cache: bool = True) -> list:
+        """
+        블로그 카테고리 목록 수집 (PostTitleListAsync API 사용)
+
+        Args:
+            use_cache: 캐시된 카테고리 트리 사용 여부 (CATEGORY_CACHE_TTL 이내일 때)
+
+        Returns:
+            카테고리 리스트: [{"no": "58", "name": "AI 바이브코딩", "count": 53, "parent_no": "0"}, ...]
+        """
+        if use_cache:
+            cached = self.category_cache.get(self.blog_id)
+            if cached is not None:
+                return cached
+
+        seen = set()
+        cat_counter = Counter()
+        cat_parents = {}
+
+        # 1) 포스트 목록에서 카테고리 번호 수집 (최대 10페이지)
+        async for posts in self._iter_title_list(max_pages=10):
+            self._tally_categories(posts, seen, cat_counter, cat_parents)
+
+        # 2) 카테고리명은 서로 독립적이므로 동시에 조회
+        cat_nos = self._category_nos_to_name(cat_counter, cat_parents)
+        names = await asyncio.gather(*(self._get_category_name(no) for no in cat_nos))
+        cat_names = dict(zip(cat_nos, names))
+
+        # 3) 결과 조합
+        categories = self._assemble_categories(cat_counter, cat_parents, cat_names)
+        if categories:
+            self.category_cache.set(self.blog_id, categories)
+        return categories
+
+    async def _get_category_name(self, category_no: str) -> str:
+        """PostList 페이지에서 카테고리명 조회 (실패 시 기본 이름)"""
+        try:
+            html = await self._fetch(self._category_url(category_no), self.DESKTOP_HEADERS, encoding="utf-8")
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return f"카테고리 {category_no}"
+        return self._parse_category_name(html, category_no)
+
+    async def get_posts_by_category(self, category_no: str) -> list:
+        """
+        특정 카테고리의 포스트 목록 수집
+
+        Args:
+            category_no: 카테고리 번호
+
+        Returns:
+            포스트 리스트: [{"logNo": "...", "title": "...", "addDate": "..."}, ...]
+        """
+        return [
+            self._title_list_entry(p)
+            async for post_list in self._iter_title_list(category_no, max_pages=19)
+            for p in post_list
+        ]
+
+    async def _fetch_title_page(self, page: int, category_no: Optional[str]) -> Optional[list]:
+        """PostTitleListAsync 한 페이지 (재시도 후에도 요청/파싱 실패 시 None)"""
+        try:
+            text = await self._fetch(self._title_list_url(page, category_no), self.DESKTOP_HEADERS)
+            return self._parse_title_list(text)
+        except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+            # 목록이 여기서 잘리므로 조용히 넘어가지 않고 알림
+            print(f"[경고] 포스트 목록 {page}페이지 요청 실패 - 이후 목록은 수집되지 않습니다: {e}")
+            return None
+
+    async def _iter_title_list(self, category_no: Optional[str] = None,
+                               max_pages: Optional[int] = None) -> AsyncIterator[list]:
+        """
+        PostTitleListAsync 페이지를 TITLE_LIST_PREFETCH개씩 동시에 미리 받아 차례로 반환
+
+        빈 페이지, 실패한 페이지, 새 logNo가 없는 페이지(마지막 페이지 반복)를 만나면 종료한다.
+
+        Args:
+            category_no: 카테고리 번호 (None이면 전체)
+            max_pages: 최대 페이지 수 (None이면 끝까지)
+
+        Yields:
+            페이지별 postList 항목 리스트 (이전 페이지와 중복된 logNo 제외)
+        """
+        seen = set()
+        page = 1
+        while max_pages is None or page <= max_pages:
+            last = page + self.TITLE_LIST_PREFETCH - 1
+            if max_pages is not None:
+                last = min(last, max_pages)
+            pages = await asyncio.gather(*(self._fetch_title_page(n, category_no)
+                                           for n in range(page, last + 1)))
+            for post_list in pages:
+                new_posts = []
+                for p in post_list or []:
+                    log_no = p.get("logNo", "")
+                    if log_no not in seen:
+                        seen.add(log_no)
+                        new_posts.append(p)
+                if not new_posts:
+                    return
+                yield new_posts
+            page = last + 1
+
+    async def get_post_content(self, log_no: str) -> Optional[dict]:
+        """
+        모바일 버전에서 포스트 본문 가져오기
+
+        Args:
+            log_no: 포스트 번호
+
+        Returns:
+            포스트 데이터 (제목, 본문, 이미지) 또는 None
+        """
+        try:
+            # 디코딩은 파서가 필요한 부분만 함
+            raw, encoding = await self._fetch(self._post_url(log_no), self.MOBILE_HEADERS,
+                                              as_bytes=True, with_encoding=True)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"포스트 요청 실패 ({self.blog_id}/{log_no}): {e}")
+            return None
+
+        return await self._parse_in_executor(self.parser.parse_mobile_post_bytes, raw, encoding,
+                                             self.blog_id, log_no)
+
+    async def scrape_all(self, limit: Optional[int] = None, include_content: bool = True,
+                         include_images: bool = False, include_blocks: bool = False) -> list:
+        """
+        전체 스크래핑 (목록 + 본문)
+
+        Args:
+            limit: 스크래핑할 포스트 수
+            include_content: 본문 포함 여부
+            include_images: 이미지 URL 포함 여부
+            include_blocks: 본문 블록 포함 여부
+
+        Returns:
+            전체 포스트 데이터 리스트 (RSS 순서 유지)
+        """
+        posts = await self.get_post_list(limit=limit)
+        if not include_content:
+            return posts
+
+        posts = [post for post in posts if post.get("logNo")]
+        contents = await asyncio.gather(*(self.get_post_content(p["logNo"]) for p in posts))
+        return [self._merge_post(post, content_data, include_images, include_blocks)
+                for post, content_data in zip(posts, contents)]
+
+
+async def scrape_blogs_async(blog_ids: List[str], limit: Optional[int] = None,
+                             include_content: bool = True, include_images: bool = False,
+                             delay: float = 0.3, concurrency_per_blog: int = 8,
+                             max_connections: int = 1000, executor: Optional[Executor] = None,
+                             parser_backend: str = "html.parser", include_blocks: bool = False) -> dict:
+    """
+    여러 블로그를 하나의 이벤트 루프에서 동시 수집
+
+    모든 블로그가 세션(커넥션 풀)과 속도 제한기를 공유하므로
+    m.blog.naver.com 등 같은 호스트에 대한 전체 요청 간격은 delay로 유지된다.
+
+    Args:
+        blog_ids: 블로그 ID 리스트
+        limit: 블로그당 스크래핑할 포스트 수
+        include_content: 본문 포함 여부
+        include_images: 이미지 URL 포함 여부
+        delay: 호스트별 요청 간 딜레이 (초)
+        concurrency_per_blog: 블로그당 최대 동시 요청 수
+        max_connections: 전체 동시 연결 수
+        executor: 파싱용 executor (None이면 기본 스레드풀)
+        parser_backend: 본문 HTML 파서 ("html.parser", "lxml", "selectolax", "auto")
+        include_blocks: 본문 블록 포함 여부
+
+    Returns:
+        {블로그ID: 포스트 리스트}
+    """
+    rate_limiter = RateLimiter.from_delay(delay)
+    circuit_breaker = CircuitBreaker()
+    async with create_session(limit=max_connections) as session:
+        scrapers = [
+            AsyncNaverBlogScraper(blog_id, session=session, delay=delay,
+                                  concurrency=concurrency_per_blog,
+                                  rate_limiter=rate_limiter, circuit_breaker=circuit_breaker,
+                                  executor=executor, parser_backend=parser_backend)
+            for blog_id in blog_ids
+        ]
+        results = await asyncio.gather(*(
+            s.scrape_all(limit=limit, include_content=include_content, include_images=include_images,
+                         include_blocks=include_blocks)
+            for s in scrapers
+        ))
+    return dict(zip(blog_ids, results))
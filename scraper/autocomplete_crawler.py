@@ -0,0 +1,190 @@
+"""
+자동완성 키워드 수집 모듈
+- 시드 뒤에 한글 초성 / 영문 글자를 붙여 자동완성을 조회하고, 결과가 꽉 찬 질의는 한 글자씩 더 구체화해 다시 조회
+  (예: "캠핑" → "캠핑 ㄱ" → "캠핑 가" → "캠핑 가ㅂ", "캠핑 a" → "캠핑 ab")
+- 수집한 키워드는 트라이에 저장해 중복을 제거하고, 새 키워드가 없는 질의는 더 구체화하지 않음
+- 조회는 스레드풀에서 동시에 (호스트별 속도 제한 / 영구 캐시는 조회 함수 쪽에서 적용)
+"""
+
+import heapq
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from typing import Callable, Iterable, Iterator, List, Optional
+
+# 호환용 한글 자모 초성 (유니코드 한글 음절 조합 순서)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+# 붙여 볼 초성 (된소리 제외)
+INITIALS = "ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎ"
+
+# 초성을 음절로 구체화할 때 쓰는 모음 (ㅏ ㅐ ㅓ ㅗ ㅜ ㅡ ㅣ, 음절 조합 순서의 번호)
+VOWELS = (0, 1, 4, 8, 13, 18, 20)
+
+LATIN = "abcdefghijklmnopqrstuvwxyz"
+
+
+def _syllable(initial: str, vowel: int) -> str:
+    """초성 + 모음 (받침 없음) 음절"""
+    return chr(0xAC00 + (CHOSEONG.index(initial) * 21 + vowel) * 28)
+
+
+def _is_syllable(ch: str) -> bool:
+    return "가" <= ch <= "힣"
+
+
+class SuggestionTrie:
+    """수집한 키워드 트라이 (공통 접두어는 한 번만 저장, 추가한 순서 유지)"""
+
+    def __init__(self):
+        self._root = {}
+        self._words = []
+
+    def add(self, word: str) -> bool:
+        """
+        키워드 추가
+
+        Returns:
+            새 키워드면 True (이미 있으면 False)
+        """
+        node = self._root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        if "" in node:
+            return False
+        # 빈 문자열 키 = 이 노드에서 끝나는 키워드가 있음 (한 글자 키만 자식으로 쓰므로 겹치지 않음)
+        node[""] = True
+        self._words.append(word)
+        return True
+
+    def _find(self, prefix: str) -> Optional[dict]:
+        node = self._root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, word: str) -> bool:
+        node = self._find(word)
+        return node is not None and "" in node
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._words)
+
+    def with_prefix(self, prefix: str) -> List[str]:
+        """접두어로 시작하는 키워드 (사전 순)"""
+        node = self._find(prefix)
+        if node is None:
+            return []
+        words = []
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if "" in node:
+                words.append(word)
+            for ch, child in node.items():
+                if ch:
+                    stack.append((child, word + ch))
+        return sorted(words)
+
+
+class AutocompleteCrawler:
+    """자동완성 키워드 동시 수집기"""
+
+    # 자동완성 한 번에 돌아오는 최대 키워드 수 (이보다 적으면 더 구체화해도 새 키워드가 없음)
+    PAGE_SIZE = 10
+
+    def __init__(self, fetch: Callable[[str], List[str]], executor: Executor,
+                 max_depth: int = 3, max_queries: int = 500, window: int = 10,
+                 hangul: bool = True, latin: bool = True):
+        """
+        Args:
+            fetch: 질의 → 자동완성 키워드 리스트 (실패하면 빈 리스트)
+            executor: 조회에 쓸 스레드풀
+            max_depth: 시드에서 구체화할 최대 단계 수 (1이면 시드 + 한 글자까지만)
+            max_queries: 최대 조회 수 (시드 포함)
+            window: 동시에 요청해 둘 조회 수
+            hangul: 한글 초성 / 음절로 확장
+            latin: 영문 글자로 확장
+        """
+        self.fetch = fetch
+        self.executor = executor
+        self.max_depth = max_depth
+        self.max_queries = max_queries
+        self.window = max(1, window)
+        self.hangul = hangul
+        self.latin = latin
+        self.trie = SuggestionTrie()
+        self.queries = 0
+        # 결과가 모자라거나 새 키워드가 없어 구체화하지 않은 질의 수
+        self.pruned = 0
+
+    def crawl(self, seeds: Iterable[str]) -> List[str]:
+        """
+        시드에서 자동완성 키워드 수집 (너비 우선, 얕은 질의부터)
+
+        Args:
+            seeds: 시작 키워드들
+
+        Returns:
+            찾은 키워드 (찾은 순서, 시드는 자동완성에 나온 경우에만 포함)
+        """
+        # (단계, 경로) 순서로 조회 - 응답이 도착한 순서와 관계없이 같은 시드면 같은 순서로 질의
+        # (경로 = 시드 번호부터 각 단계의 구체화 번호, 한도에 걸려도 다음 실행에서 캐시된 질의부터 다시 씀)
+        frontier = [(0, (i,), seed) for i, seed in enumerate(dict.fromkeys(s.strip() for s in seeds)) if seed]
+        heapq.heapify(frontier)
+        in_flight = {}
+
+        while frontier or in_flight:
+            while frontier and len(in_flight) < self.window and self.queries < self.max_queries:
+                depth, path, query = heapq.heappop(frontier)
+                in_flight[self.executor.submit(self.fetch, query)] = (depth, path, query)
+                self.queries += 1
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                depth, path, query = in_flight.pop(future)
+                suggestions = future.result()
+                new = [s for s in suggestions if self.trie.add(s)]
+                if depth >= self.max_depth:
+                    continue
+                # 결과가 한 페이지보다 적으면 이 질의로 나올 키워드는 모두 나온 것
+                if len(suggestions) < self.PAGE_SIZE or not new:
+                    self.pruned += 1
+                    continue
+                for i, child in enumerate(self.refinements(query, depth)):
+                    heapq.heappush(frontier, (depth + 1, path + (i,), child))
+
+        return list(self.trie)
+
+    def refinements(self, query: str, depth: int) -> List[str]:
+        """
+        질의를 한 글자 더 구체화한 질의들
+
+        - 시드: 띄어쓰기 후 초성 / 영문 글자 ("캠핑 ㄱ", "캠핑 a")
+        - 초성으로 끝남: 그 초성의 음절로 ("캠핑 ㄱ" → "캠핑 가", "캠핑 고" ...)
+        - 음절로 끝남: 다음 글자 초성 ("캠핑 가" → "캠핑 가ㄴ" ...)
+        - 영문으로 끝남: 다음 영문 글자 ("캠핑 a" → "캠핑 ab" ...)
+        """
+        letters = (INITIALS if self.hangul else "") + (LATIN if self.latin else "")
+        if depth == 0:
+            return [f"{query} {ch}" for ch in letters]
+
+        last = query[-1]
+        if last in CHOSEONG:
+            return [query[:-1] + _syllable(last, vowel) for vowel in VOWELS]
+        if _is_syllable(last) and self.hangul:
+            return [query + ch for ch in INITIALS]
+        if last in LATIN and self.latin:
+            return [query + ch for ch in LATIN]
+        return []
+
+    def summary(self) -> str:
+        """수집 결과 한 줄 요약"""
+        return (f"[자동완성 수집] 조회 {self.queries:,}회, 키워드 {len(self.trie):,}개 "
+                f"(새 키워드가 없어 구체화하지 않은 질의 {self.pruned:,}개)")
+
@@ -0,0 +1,132 @@
+"""
+여러 블로그 일괄 스크래핑 모듈
+- 모든 블로그가 하나의 스레드풀, 커넥션 풀, 속도 제한기를 공유
+- 블로그별 결과는 output/{blog_id}/에 저장
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
+from utils.helpers import save_posts_stream
+
+from .blog_scraper import NaverBlogScraper
+from .http_cache import HttpCache
+from .http_client import create_http_session
+from .parse_pool import ParsePool
+from .rate_limiter import RateLimiter
+from .retry import CircuitBreaker, RetryPolicy
+
+# 출력 기본 경로 (프로젝트 루트 기준)
+OUTPUT_BASE = os.path.join(os.path.dirname(__file__), "..", "output")
+
+
+class BatchScraper:
+    """여러 블로그를 하나의 작업 풀로 수집하는 스크래퍼"""
+
+    def __init__(self, blog_ids: List[str], workers: int = 16, blog_workers: int = 8,
+                 delay: float = 0.3, global_rate: Optional[float] = None,
+                 output_base: str = OUTPUT_BASE, parser_backend: str = "html.parser",
+                 parse_workers: int = 0, parse_queue: Optional[int] = None):
+        """
+        Args:
+            blog_ids: 수집할 블로그 ID 리스트
+            workers: 본문 요청 스레드 수 (모든 블로그 공유)
+            blog_workers: 동시에 진행할 블로그 수 (목록 요청과 파일 저장 담당)
+            delay: 호스트별 요청 간 딜레이 (초)
+            global_rate: 전체 초당 요청 수 상한 (None이면 호스트별 제한만 적용)
+            output_base: 블로그별 출력 폴더의 상위 폴더
+            parser_backend: 본문 HTML 파서 ("html.parser", "lxml", "selectolax", "auto")
+            parse_workers: 본문 파싱 프로세스 수 (0이면 요청 스레드에서 파싱)
+            parse_queue: 파싱 대기열 크기 (None이면 parse_workers * 4)
+        """
+        self.blog_ids = list(dict.fromkeys(blog_ids))
+        self.workers = max(1, workers)
+        self.blog_workers = max(1, min(blog_workers, len(self.blog_ids) or 1))
+        self.delay = delay
+        self.output_base = output_base
+        self.parser_backend = parser_backend
+        self.parse_workers = max(0, parse_workers)
+        self.parse_queue = parse_queue
+
+        per_host_rate = 1.0 / delay if delay and delay > 0 else float("inf")
+        self.rate_limiter = RateLimiter(rate=per_host_rate, global_rate=global_rate)
+        # 장애 중인 호스트는 모든 블로그에서 함께 차단
+        self.retry_policy = RetryPolicy()
+        self.circuit_breaker = CircuitBreaker()
+
+        # 모든 블로그가 공유하는 커넥션 풀 (본문 스레드 + 목록 스레드 수만큼)
+        self.session = create_http_session(pool_size=self.workers + self.blog_workers)
+        # RSS 조건부 요청 캐시도 공유 (캐시 폴더 정리가 블로그마다 돌지 않도록)
+        self.http_cache = HttpCache()
+
+    def _scrape_blog(self, blog_id: str, executor: ThreadPoolExecutor, parse_pool: Optional[ParsePool],
+                     limit: Optional[int], include_images: bool, incremental: bool) -> dict:
+        """블로그 하나를 수집해 저장 (본문 요청은 공유 executor, 파싱은 공유 parse_pool 사용)"""
+        scraper = NaverBlogScraper(
+            blog_id,
+            delay=self.delay,
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            circuit_breaker=self.circuit_breaker,
+            session=self.session,
+            executor=executor,
+            verbose=False,
+            parser_backend=self.parser_backend,
+            parse_pool=parse_pool,
+            http_cache=self.http_cache,
+        )
+        output_dir = os.path.join(self.output_base, blog_id)
+        posts = scraper.iter_posts(limit=limit, include_content=True,
+                                   include_images=include_images, incremental=incremental)
+        return save_posts_stream(posts, output_dir=output_dir, prefix=blog_id)
+
+    def run(self, limit: Optional[int] = 10, include_images: bool = True,
+            incremental: bool = True) -> Dict[str, dict]:
+        """
+        전체 블로그 수집
+
+        Args:
+            limit: 블로그당 스크래핑할 포스트 수
+            include_images: 이미지 URL 포함 여부
+            incremental: 바뀌지 않은 포스트는 저장본 사용
+
+        Returns:
+            {블로그ID: 저장 결과 정보} (실패한 블로그는 {"error": 메시지})
+        """
+        total = len(self.blog_ids)
+        results = {}
+        started = time.monotonic()
+        print(f"[일괄 수집] 블로그 {total}개 (본문 동시 {self.workers}개, 블로그 동시 {self.blog_workers}개)")
+
+        parse_pool = None
+        if self.parse_workers:
+            parse_pool = ParsePool(workers=self.parse_workers, queue_depth=self.parse_queue,
+                                   backend=self.parser_backend)
+
+        with parse_pool or nullcontext(), \
+                ThreadPoolExecutor(max_workers=self.workers) as fetch_pool, \
+                ThreadPoolExecutor(max_workers=self.blog_workers) as blog_pool:
+            futures = {
+                blog_pool.submit(self._scrape_blog, blog_id, fetch_pool, parse_pool,
+                                 limit, include_images, incremental): blog_id
+                for blog_id in self.blog_ids
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                blog_id = futures[future]
+                try:
+                    result = future.result()
+                    print(f"  [{done}/{total}] {blog_id}: {result['total']}개")
+                except Exception as e:
+                    result = {"error": str(e)}
+                    print(f"  [{done}/{total}] {blog_id}: 실패 ({e})")
+                results[blog_id] = result
+
+        elapsed = time.monotonic() - started
+        post_count = sum(r.get("total", 0) for r in results.values())
+        print(f"[일괄 수집 완료] 포스트 {post_count}개, {elapsed:.1f}초")
+        if parse_pool:
+            print(parse_pool.report())
+        return results
@@ -0,0 +1,107 @@
+"""
+포스트 블록 모델
+- 본문을 SmartEditor 컴포넌트(se-component) 단위의 순서 있는 블록으로 표현
+- 블록은 가벼운 NamedTuple (JSON으로는 [type, text, images, link] 배열로 저장)
+- 평문 본문, 소제목 수, 이미지 밀도 등은 블록에서 필요할 때 계산 (HTML 재파싱 불필요)
+"""
+
+from functools import cached_property
+from typing import Iterable, List, NamedTuple, Tuple
+
+# se-component 클래스 → 블록 종류
+COMPONENT_TYPES = {
+    "se-text": "paragraph",
+    "se-sectionTitle": "heading",
+    "se-documentTitle": "title",
+    "se-quotation": "quote",
+    "se-image": "image",
+    "se-imageStrip": "image",
+    "se-imageGroup": "image",
+    "se-sticker": "image",
+    "se-oglink": "link",
+    "se-oembed": "embed",
+    "se-video": "video",
+    "se-table": "table",
+    "se-code": "code",
+    "se-horizontalLine": "divider",
+    "se-placesMap": "map",
+    "se-map": "map",
+    "se-file": "file",
+}
+
+# 컴포넌트 밖 본문 텍스트 (구 에디터 글 등)
+TEXT = "text"
+
+# 텍스트가 주인 블록 (빈 줄만 있어도 본문 줄바꿈을 유지)
+TEXT_TYPES = frozenset({TEXT, "paragraph", "heading", "title", "quote"})
+
+
+class Block(NamedTuple):
+    """본문 블록 하나"""
+
+    type: str
+    text: str = ""
+    images: Tuple[str, ...] = ()
+    link: str = ""
+
+
+class PostBlocks(list):
+    """
+    순서 있는 블록 리스트 (list 그대로 JSON 저장 가능)
+
+    파생 값은 처음 읽을 때 한 번만 계산한다 (만든 뒤 수정하지 않는 것을 전제).
+    """
+
+    @classmethod
+    def from_json(cls, data: Iterable) -> "PostBlocks":
+        """JSON에서 읽은 [type, text, images, link] 배열들을 블록으로 복원"""
+        return cls(
+            Block(item[0], item[1], tuple(item[2]), item[3]) if not isinstance(item, Block) else item
+            for item in data or []
+        )
+
+    @cached_property
+    def text(self) -> str:
+        """평문 본문 (블록 텍스트를 줄바꿈으로 연결)"""
+        return "\n".join(block.text for block in self if block.text or block.type in TEXT_TYPES)
+
+    @cached_property
+    def images(self) -> List[str]:
+        """본문 순서대로 이미지 URL"""
+        return [url for block in self for url in block.images]
+
+    @cached_property
+    def headings(self) -> List[str]:
+        """소제목 텍스트"""
+        return [block.text for block in self if block.type == "heading"]
+
+    @property
+    def heading_count(self) -> int:
+        """소제목 수"""
+        return len(self.headings)
+
+    @property
+    def image_count(self) -> int:
+        """이미지 수"""
+        return len(self.images)
+
+    @cached_property
+    def char_count(self) -> int:
+        """공백 제외 글자 수"""
+        return sum(len("".join(block.text.split())) for block in self)
+
+    @property
+    def image_density(self) -> float:
+        """1000자당 이미지 수 (글자가 없으면 0)"""
+        if not self.char_count:
+            return 0.0
+        return self.image_count / self.char_count * 1000
+
+    def count_type(self, block_type: str) -> int:
+        """
+        종류별 블록 수
+
+        Args:
+            block_type: 블록 종류 ("paragraph", "image" 등)
+        """
+        return sum(1 for block in self if block.type == block_type)
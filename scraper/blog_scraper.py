@@ -4,19 +4,29 @@
 - 모바일 버전으로 본문 추출
 """
 
+import os
 import requests
 import xml.etree.ElementTree as ET
 import time
 import re
 import json
 from collections import Counter
-from typing import Optional
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Iterator, Optional
 from urllib.parse import unquote
+from utils.helpers import JsonlWriter, iter_jsonl
+from .cache import CACHE_DIR, JsonFileCache
+from .http_cache import HttpCache
+from .http_client import DEFAULT_POOL_SIZE, create_http_session, get_shared_session
+from .parse_pool import ParsePool
 from .parser import PostParser
+from .post_store import PostStore
+from .rate_limiter import RateLimiter
+from .retry import CircuitBreaker, RetryPolicy
 
 
-class NaverBlogScraper:
-    """네이버 블로그 스크래퍼"""
+class BaseNaverBlogScraper:
+    """네이버 블로그 스크래퍼 공통부 (URL 생성, 응답 파싱) - 동기/비동기 스크래퍼가 공유"""
 
     # User-Agent 헤더
     DESKTOP_HEADERS = {
@@ -27,40 +37,42 @@ class NaverBlogScraper:
         "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
     }
 
-    def __init__(self, blog_id: str, delay: float = 0.3):
+    # 카테고리 트리 캐시 유효 시간 (초) - 카테고리 구성은 자주 바뀌지 않음
+    CATEGORY_CACHE_TTL = 24 * 60 * 60
+
+    # 카테고리명 동시 조회 수
+    CATEGORY_WORKERS = 4
+
+    # PostTitleListAsync 페이지 동시 선조회 수
+    TITLE_LIST_PREFETCH = 4
+
+    def __init__(self, blog_id: str):
         """
         Args:
             blog_id: 네이버 블로그 ID
-            delay: 요청 간 딜레이 (초) - 기본 0.3초
         """
         self.blog_id = blog_id
-        self.delay = delay
-        self.parser = PostParser()
-        # 연결 재사용을 위한 Session
-        self.session = requests.Session()
+        self.category_cache = JsonFileCache("categories", ttl=self.CATEGORY_CACHE_TTL)
 
-    def get_post_list(self, limit: Optional[int] = None) -> list:
+    def _rss_url(self) -> str:
+        """RSS 피드 URL"""
+        return f"https://rss.blog.naver.com/{self.blog_id}.xml"
+
+    @staticmethod
+    def _parse_rss(content: bytes, limit: Optional[int] = None) -> list:
         """
-        RSS 피드에서 포스트 목록 가져오기
+        RSS XML을 포스트 목록으로 변환
 
         Args:
+            content: RSS 응답 바이트
             limit: 가져올 포스트 수 (None이면 전체)
 
         Returns:
             포스트 목록 (제목, 링크, logNo, 날짜, 요약)
         """
-        url = f"https://rss.blog.naver.com/{self.blog_id}.xml"
-
-        try:
-            response = self.session.get(url, headers=self.DESKTOP_HEADERS, timeout=10)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            print(f"RSS 요청 실패: {e}")
-            return []
-
         # XML 파싱
         try:
-            root = ET.fromstring(response.content)
+            root = ET.fromstring(content)
         except ET.ParseError as e:
             print(f"XML 파싱 실패: {e}")
             return []
@@ -111,69 +123,54 @@ class NaverBlogScraper:
 
         return posts
 
-    def get_categories(self) -> list:
-        """
-        블로그 카테고리 목록 수집 (PostTitleListAsync API 사용)
-
-        Returns:
-            카테고리 리스트: [{"no": "58", "name": "AI 바이브코딩", "count": 53, "parent_no": "0"}, ...]
-        """
-        seen = set()
-        cat_counter = Counter()
-        cat_parents = {}
-
-        # 1) 포스트 목록에서 카테고리 번호 수집 (최대 10페이지)
-        for page in range(1, 11):
-            url = (
-                f"https://blog.naver.com/PostTitleListAsync.naver"
-                f"?blogId={self.blog_id}&currentPage={page}&countPerPage=30"
-            )
-            try:
-                resp = self.session.get(url, headers=self.DESKTOP_HEADERS, timeout=10)
-                text = re.sub(r'(?<!\\)\\(?!["\\/bfnrtu])', r'\\\\', resp.text.strip())
-                data = json.loads(text)
-                posts = data.get("postList", [])
-                if not posts:
-                    break
-                for p in posts:
-                    log_no = p.get("logNo", "")
-                    if log_no in seen:
-                        continue
-                    seen.add(log_no)
-                    cat_no = str(p.get("categoryNo", "0"))
-                    parent_no = str(p.get("parentCategoryNo", "0"))
-                    cat_counter[cat_no] += 1
-                    if cat_no not in cat_parents:
-                        cat_parents[cat_no] = parent_no
-            except (requests.RequestException, json.JSONDecodeError):
-                break
-            time.sleep(self.delay)
-
-        # 2) 각 카테고리의 이름 수집
-        cat_names = {}
-        for cat_no in cat_counter:
-            url = (
-                f"https://blog.naver.com/PostList.naver"
-                f"?blogId={self.blog_id}&categoryNo={cat_no}&from=postList"
-            )
-            try:
-                resp = self.session.get(url, headers=self.DESKTOP_HEADERS, timeout=10)
-                resp.encoding = "utf-8"
-                title_match = re.search(r"<title>([^<]+)</title>", resp.text)
-                if title_match:
-                    raw = title_match.group(1).strip()
-                    # 형식: "카테고리명 : 블로그명 : 네이버 블로그"
-                    parts = re.split(r"\s*[,:]\s*", raw)
-                    cat_names[cat_no] = parts[0] if parts else raw
-                else:
-                    cat_names[cat_no] = f"카테고리 {cat_no}"
-            except requests.RequestException:
-                cat_names[cat_no] = f"카테고리 {cat_no}"
-            time.sleep(self.delay)
-
-        # 3) 결과 조합
+    def _title_list_url(self, page: int, category_no: Optional[str] = None) -> str:
+        """PostTitleListAsync 페이지 URL"""
+        category = f"&categoryNo={category_no}" if category_no is not None else ""
+        return (
+            f"https://blog.naver.com/PostTitleListAsync.naver"
+            f"?blogId={self.blog_id}{category}"
+            f"&currentPage={page}&countPerPage=30"
+        )
+
+    def _category_url(self, category_no: str) -> str:
+        """카테고리 PostList 페이지 URL"""
+        return (
+            f"https://blog.naver.com/PostList.naver"
+            f"?blogId={self.blog_id}&categoryNo={category_no}&from=postList"
+        )
+
+    @staticmethod
+    def _tally_categories(posts: list, seen: set, cat_counter: Counter, cat_parents: dict):
+        """PostTitleListAsync 항목을 카테고리별로 집계"""
+        for p in posts:
+            log_no = p.get("logNo", "")
+            if log_no in seen:
+                continue
+            seen.add(log_no)
+            cat_no = str(p.get("categoryNo", "0"))
+            parent_no = str(p.get("parentCategoryNo", "0"))
+            cat_counter[cat_no] += 1
+            if cat_no not in cat_parents:
+                cat_parents[cat_no] = parent_no
+
+    @staticmethod
+    def _missing_parents(cat_counter: Counter, cat_parents: dict) -> list:
+        """자체 포스트가 없어 집계되지 않은 부모 카테고리 번호"""
+        missing = {
+            parent_no for cat_no, parent_no in cat_parents.items()
+            if parent_no != cat_no and parent_no != "0" and parent_no not in cat_counter
+        }
+        return sorted(missing)
+
+    @classmethod
+    def _category_nos_to_name(cls, cat_counter: Counter, cat_parents: dict) -> list:
+        """이름을 조회해야 하는 카테고리 번호 (집계된 카테고리 + 누락된 부모)"""
+        return list(cat_counter) + cls._missing_parents(cat_counter, cat_parents)
+
+    @classmethod
+    def _assemble_categories(cls, cat_counter: Counter, cat_parents: dict, cat_names: dict) -> list:
+        """집계 결과와 카테고리명을 카테고리 리스트로 조합"""
         categories = []
-        collected_nos = set()
         for cat_no, count in cat_counter.most_common():
             categories.append({
                 "no": cat_no,
@@ -181,41 +178,242 @@ class NaverBlogScraper:
                 "count": count,
                 "parent_no": cat_parents.get(cat_no, "0"),
             })
-            collected_nos.add(cat_no)
-
-        # 4) 누락된 부모 카테고리 보완 (자체 포스트가 없는 부모)
-        missing_parents = set()
-        for cat_no, parent_no in cat_parents.items():
-            if parent_no != cat_no and parent_no != "0" and parent_no not in collected_nos:
-                missing_parents.add(parent_no)
-
-        for parent_no in missing_parents:
-            url = (
-                f"https://blog.naver.com/PostList.naver"
-                f"?blogId={self.blog_id}&categoryNo={parent_no}&from=postList"
-            )
-            try:
-                resp = self.session.get(url, headers=self.DESKTOP_HEADERS, timeout=10)
-                resp.encoding = "utf-8"
-                title_match = re.search(r"<title>([^<]+)</title>", resp.text)
-                if title_match:
-                    raw = title_match.group(1).strip()
-                    parts = re.split(r"\s*[,:]\s*", raw)
-                    name = parts[0] if parts else raw
-                else:
-                    name = f"카테고리 {parent_no}"
-            except requests.RequestException:
-                name = f"카테고리 {parent_no}"
-            time.sleep(self.delay)
+
+        # 누락된 부모 카테고리 보완 (자체 포스트가 없는 부모)
+        for parent_no in cls._missing_parents(cat_counter, cat_parents):
             categories.append({
                 "no": parent_no,
-                "name": name,
+                "name": cat_names.get(parent_no, f"카테고리 {parent_no}"),
                 "count": 0,
                 "parent_no": parent_no,
             })
 
         return categories
 
+    @staticmethod
+    def _parse_title_list(text: str) -> list:
+        """
+        PostTitleListAsync 응답에서 postList 추출
+
+        Raises:
+            json.JSONDecodeError: JSON 형식이 아닐 때
+        """
+        # 응답에 JSON 규격에 맞지 않는 역슬래시 이스케이프가 섞여 있어 보정 후 파싱
+        text = re.sub(r'(?<!\\)\\(?!["\\/bfnrtu])', r'\\\\', text.strip())
+        data = json.loads(text)
+        return data.get("postList", [])
+
+    @staticmethod
+    def _title_list_entry(p: dict) -> dict:
+        """PostTitleListAsync 항목을 포스트 정보로 변환"""
+        return {
+            "logNo": p.get("logNo", ""),
+            "title": unquote(p.get("title", "").replace("+", " ")),
+            "addDate": p.get("addDate", ""),
+        }
+
+    @staticmethod
+    def _parse_category_name(html: str, category_no: str) -> str:
+        """PostList 페이지 <title>에서 카테고리명 추출"""
+        title_match = re.search(r"<title>([^<]+)</title>", html)
+        if not title_match:
+            return f"카테고리 {category_no}"
+        raw = title_match.group(1).strip()
+        # 형식: "카테고리명 : 블로그명 : 네이버 블로그"
+        parts = re.split(r"\s*[,:]\s*", raw)
+        return parts[0] if parts else raw
+
+    def _post_url(self, log_no: str) -> str:
+        """모바일 포스트 URL"""
+        return f"https://m.blog.naver.com/{self.blog_id}/{log_no}"
+
+    @staticmethod
+    def _merge_post(post: dict, content_data: Optional[dict], include_images: bool,
+                    include_blocks: bool = False) -> dict:
+        """RSS 정보와 본문 정보 병합"""
+        if not content_data:
+            return post
+        merged = {
+            **post,
+            "content": content_data.get("content", "")
+        }
+        if include_images:
+            merged["images"] = content_data.get("images", [])
+        if include_blocks:
+            merged["blocks"] = content_data.get("blocks", [])
+        return merged
+
+
+class NaverBlogScraper(BaseNaverBlogScraper):
+    """네이버 블로그 스크래퍼"""
+
+    def __init__(self, blog_id: str, delay: float = 0.3, workers: int = 1,
+                 rate_limiter: Optional[RateLimiter] = None, use_http_cache: bool = True,
+                 session: Optional[requests.Session] = None, executor: Optional[Executor] = None,
+                 verbose: bool = True, retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None, parser_backend: str = "html.parser",
+                 parse_pool: Optional[ParsePool] = None, http_cache: Optional[HttpCache] = None):
+        """
+        Args:
+            blog_id: 네이버 블로그 ID
+            delay: 요청 간 딜레이 (초) - 기본 0.3초
+            workers: 본문 동시 요청 수 (1이면 순차 수집)
+            rate_limiter: 호스트별 속도 제한기 (None이면 delay 기준으로 생성)
+            use_http_cache: RSS 피드 ETag / Last-Modified 조건부 요청 캐시 사용 여부
+            session: 사용할 Session (None이면 get_shared_session())
+            executor: 본문 요청에 쓸 공유 스레드풀 (지정하면 workers 대신 사용)
+            verbose: 진행 상황 출력 여부
+            retry_policy: 일시적 오류 재시도 정책 (None이면 기본 정책)
+            circuit_breaker: 호스트별 서킷 브레이커 (여러 블로그를 수집할 때 공유)
+            parser_backend: 본문 HTML 파서 ("html.parser", "lxml", "selectolax", "auto")
+            parse_pool: 본문 파싱을 맡길 프로세스 풀 (None이면 요청 스레드에서 파싱)
+            http_cache: 여러 블로그가 공유할 조건부 요청 캐시 (None이면 use_http_cache에 따라 새로 생성)
+        """
+        super().__init__(blog_id)
+        self.delay = delay
+        self.workers = max(1, workers)
+        self.executor = executor
+        self.verbose = verbose
+        self.parser = PostParser(parser_backend)
+        self.parse_pool = parse_pool
+        # 동시 요청 시에도 호스트당 delay 간격을 지키도록 토큰 버킷 사용
+        self.rate_limiter = rate_limiter or RateLimiter.from_delay(delay)
+        # 429 / 5xx / 연결 오류는 백오프 후 재시도, 계속 실패하는 호스트는 잠시 차단
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        # 연결 재사용을 위한 Session (기본은 프로세스 공유 커넥션 풀, 워커가 더 많으면 전용 풀)
+        if session is None:
+            if self.workers > DEFAULT_POOL_SIZE:
+                session = create_http_session(pool_size=self.workers)
+            else:
+                session = get_shared_session()
+        self.session = session
+        # 변경 없는 RSS 피드(304)는 디스크 캐시에서 재사용 (본문 페이지는 저장하지 않음)
+        if http_cache is None and use_http_cache:
+            http_cache = HttpCache()
+        self.http_cache = http_cache
+
+    def _log(self, message: str):
+        """진행 상황 출력 (verbose일 때만)"""
+        if self.verbose:
+            print(message)
+
+    def _get(self, url: str, headers: dict, timeout: float = 10, conditional: bool = False) -> requests.Response:
+        """
+        속도 제한, 재시도를 적용한 GET 요청
+
+        Args:
+            conditional: 조건부 요청 캐시(http_cache) 사용 - 자주 다시 받는 URL(RSS 피드)에만 사용
+
+        Raises:
+            requests.RequestException: 재시도 후에도 실패했거나 서킷이 열려 있을 때
+                (재시도 대상 상태 코드로 끝나면 HTTPError)
+        """
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_request(url)
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+
+            retry_after = None
+            try:
+                if conditional and self.http_cache:
+                    response = self.http_cache.get(self.session, url, headers=headers, timeout=timeout)
+                else:
+                    response = self.session.get(url, headers=headers, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            else:
+                if not self.retry_policy.is_retryable_status(response.status_code):
+                    self.circuit_breaker.record_success(url)
+                    if self.rate_limiter:
+                        self.rate_limiter.record_success(url)
+                    return response
+                error = requests.HTTPError(f"{response.status_code} Error: {url}", response=response)
+                retry_after = self.retry_policy.parse_retry_after(response.headers.get("Retry-After"))
+
+            self.circuit_breaker.record_failure(url)
+            if self.rate_limiter:
+                self.rate_limiter.record_error(url)
+            if attempt >= self.retry_policy.max_retries:
+                raise error
+            time.sleep(self.retry_policy.delay_for(attempt, retry_after))
+            attempt += 1
+
+    def get_post_list(self, limit: Optional[int] = None) -> list:
+        """
+        RSS 피드에서 포스트 목록 가져오기
+
+        Args:
+            limit: 가져올 포스트 수 (None이면 전체)
+
+        Returns:
+            포스트 목록 (제목, 링크, logNo, 날짜, 요약)
+        """
+        url = self._rss_url()
+
+        try:
+            response = self._get(url, self.DESKTOP_HEADERS, conditional=True)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"RSS 요청 실패: {e}")
+            return []
+
+        # 피드가 바뀌지 않았으면(304) 지난번 파싱 결과를 그대로 사용
+        if getattr(response, "from_cache", False):
+            cached_posts = self.http_cache.get_derived(url, "posts")
+            if cached_posts is not None:
+                return cached_posts[:limit] if limit else cached_posts
+
+        posts = self._parse_rss(response.content)
+        if self.http_cache and posts:
+            self.http_cache.set_derived(url, "posts", posts)
+        return posts[:limit] if limit else posts
+
+    def get_categories(self, use_cache: bool = True) -> list:
+        """
+        블로그 카테고리 목록 수집 (PostTitleListAsync API 사용)
+
+        Args:
+            use_cache: 캐시된 카테고리 트리 사용 여부 (CATEGORY_CACHE_TTL 이내일 때)
+
+        Returns:
+            카테고리 리스트: [{"no": "58", "name": "AI 바이브코딩", "count": 53, "parent_no": "0"}, ...]
+        """
+        if use_cache:
+            cached = self.category_cache.get(self.blog_id)
+            if cached is not None:
+                return cached
+
+        seen = set()
+        cat_counter = Counter()
+        cat_parents = {}
+
+        # 1) 포스트 목록에서 카테고리 번호 수집 (최대 10페이지)
+        for posts in self._iter_title_list(max_pages=10):
+            self._tally_categories(posts, seen, cat_counter, cat_parents)
+
+        # 2) 각 카테고리 + 누락된 부모 카테고리의 이름을 동시에 수집
+        cat_nos = self._category_nos_to_name(cat_counter, cat_parents)
+        with ThreadPoolExecutor(max_workers=max(self.workers, self.CATEGORY_WORKERS)) as executor:
+            cat_names = dict(zip(cat_nos, executor.map(self._get_category_name, cat_nos)))
+
+        # 3) 결과 조합
+        categories = self._assemble_categories(cat_counter, cat_parents, cat_names)
+        if categories:
+            self.category_cache.set(self.blog_id, categories)
+        return categories
+
+    def _get_category_name(self, category_no: str) -> str:
+        """PostList 페이지에서 카테고리명 조회 (실패 시 기본 이름)"""
+        try:
+            resp = self._get(self._category_url(category_no), self.DESKTOP_HEADERS)
+            resp.raise_for_status()
+            resp.encoding = "utf-8"
+            return self._parse_category_name(resp.text, category_no)
+        except requests.RequestException:
+            return f"카테고리 {category_no}"
+
     def get_posts_by_category(self, category_no: str) -> list:
         """
         특정 카테고리의 포스트 목록 수집
@@ -226,39 +424,82 @@ class NaverBlogScraper:
         Returns:
             포스트 리스트: [{"logNo": "...", "title": "...", "addDate": "..."}, ...]
         """
-        seen = set()
-        posts = []
+        return [
+            self._title_list_entry(p)
+            for post_list in self._iter_title_list(category_no, max_pages=19)
+            for p in post_list
+        ]
 
-        for page in range(1, 20):
-            url = (
-                f"https://blog.naver.com/PostTitleListAsync.naver"
-                f"?blogId={self.blog_id}&categoryNo={category_no}"
-                f"&currentPage={page}&countPerPage=30"
-            )
-            try:
-                resp = self.session.get(url, headers=self.DESKTOP_HEADERS, timeout=10)
-                text = re.sub(r'(?<!\\)\\(?!["\\/bfnrtu])', r'\\\\', resp.text.strip())
-                data = json.loads(text)
-                post_list = data.get("postList", [])
-                if not post_list:
-                    break
-                for p in post_list:
-                    log_no = p.get("logNo", "")
-                    if log_no in seen:
-                        continue
-                    seen.add(log_no)
-                    title = unquote(p.get("title", "").replace("+", " "))
-                    posts.append({
-                        "logNo": log_no,
-                        "title": title,
-                        "addDate": p.get("addDate", ""),
-                    })
-            except (requests.RequestException, json.JSONDecodeError):
-                break
-            time.sleep(self.delay)
+    def get_archive_post_list(self, category_no: Optional[str] = None) -> list:
+        """
+        RSS 50개 제한 없이 블로그 전체 포스트 목록 수집 (PostTitleListAsync 전체 페이지)
+
+        Args:
+            category_no: 카테고리 번호 (None이면 전체 카테고리)
 
+        Returns:
+            포스트 목록 (제목, 링크, logNo, 날짜) - RSS 목록과 같은 키 구성
+        """
+        posts = []
+        for post_list in self._iter_title_list(category_no):
+            for p in post_list:
+                entry = self._title_list_entry(p)
+                posts.append({
+                    "title": entry["title"],
+                    "link": f"https://blog.naver.com/{self.blog_id}/{entry['logNo']}",
+                    "logNo": entry["logNo"],
+                    "pubDate": "",
+                    "addDate": entry["addDate"],
+                    "description": "",
+                })
+            self._log(f"      목록 {len(posts)}개 확인...")
         return posts
 
+    def _fetch_title_page(self, page: int, category_no: Optional[str]) -> Optional[list]:
+        """PostTitleListAsync 한 페이지 (재시도 후에도 요청/파싱 실패 시 None)"""
+        try:
+            resp = self._get(self._title_list_url(page, category_no), self.DESKTOP_HEADERS)
+            resp.raise_for_status()
+            return self._parse_title_list(resp.text)
+        except (requests.RequestException, json.JSONDecodeError) as e:
+            # 목록이 여기서 잘리므로 조용히 넘어가지 않고 알림
+            print(f"[경고] 포스트 목록 {page}페이지 요청 실패 - 이후 목록은 수집되지 않습니다: {e}")
+            return None
+
+    def _iter_title_list(self, category_no: Optional[str] = None,
+                         max_pages: Optional[int] = None) -> Iterator[list]:
+        """
+        PostTitleListAsync 페이지를 TITLE_LIST_PREFETCH개씩 동시에 미리 받아 차례로 반환
+
+        빈 페이지, 실패한 페이지, 새 logNo가 없는 페이지(마지막 페이지 반복)를 만나면 종료한다.
+
+        Args:
+            category_no: 카테고리 번호 (None이면 전체)
+            max_pages: 최대 페이지 수 (None이면 끝까지)
+
+        Yields:
+            페이지별 postList 항목 리스트 (이전 페이지와 중복된 logNo 제외)
+        """
+        seen = set()
+        page = 1
+        with ThreadPoolExecutor(max_workers=self.TITLE_LIST_PREFETCH) as executor:
+            while max_pages is None or page <= max_pages:
+                last = page + self.TITLE_LIST_PREFETCH - 1
+                if max_pages is not None:
+                    last = min(last, max_pages)
+                pages = range(page, last + 1)
+                for post_list in executor.map(lambda n: self._fetch_title_page(n, category_no), pages):
+                    new_posts = []
+                    for p in post_list or []:
+                        log_no = p.get("logNo", "")
+                        if log_no not in seen:
+                            seen.add(log_no)
+                            new_posts.append(p)
+                    if not new_posts:
+                        return
+                    yield new_posts
+                page = last + 1
+
     def get_post_content(self, log_no: str) -> Optional[dict]:
         """
         모바일 버전에서 포스트 본문 가져오기
@@ -269,18 +510,52 @@ class NaverBlogScraper:
         Returns:
             포스트 데이터 (제목, 본문, 이미지) 또는 None
         """
-        url = f"https://m.blog.naver.com/{self.blog_id}/{log_no}"
+        return self._get_post_content(log_no, self.parse_pool)
+
+    def _get_post_content(self, log_no: str, parse_pool: Optional[ParsePool]) -> Optional[dict]:
+        """get_post_content() 본체 (parse_pool이 있으면 프로세스 풀에서 파싱)"""
+        response = self._fetch_post(log_no, parse_pool)
+        if response is None:
+            return None
+        encoding = self._response_encoding(response)
+        if parse_pool:
+            return parse_pool.parse(response.content, encoding, self.blog_id, log_no)
+        return self.parser.parse_mobile_post_bytes(response.content, encoding, self.blog_id, log_no)
+
+    def _fetch_post(self, log_no: str, parse_pool: Optional[ParsePool] = None) -> Optional[requests.Response]:
+        """모바일 포스트 페이지 요청 (실패 시 None, parse_pool이 있으면 요청 단계 처리량 기록)"""
+        url = self._post_url(log_no)
+        started = time.monotonic()
 
         try:
-            response = self.session.get(url, headers=self.MOBILE_HEADERS, timeout=10)
+            response = self._get(url, self.MOBILE_HEADERS)
             response.raise_for_status()
         except requests.RequestException as e:
             print(f"포스트 요청 실패 ({log_no}): {e}")
             return None
 
-        return self.parser.parse_mobile_post(response.text, self.blog_id, log_no)
-
-    def scrape_all(self, limit: Optional[int] = None, include_content: bool = True, include_images: bool = False) -> list:
+        if parse_pool:
+            parse_pool.fetch_stats.record(time.monotonic() - started, len(response.content))
+        return response
+
+    def _submit_post_content(self, log_no: str, parse_pool: ParsePool) -> Future:
+        """포스트를 받아 파싱 대기열에 넣고 파싱 완료를 기다리지 않고 반환"""
+        response = self._fetch_post(log_no, parse_pool)
+        if response is None:
+            failed = Future()
+            failed.set_result(None)
+            return failed
+        return parse_pool.submit(response.content, self._response_encoding(response), self.blog_id, log_no)
+
+    @staticmethod
+    def _response_encoding(response: requests.Response) -> str:
+        """response.text와 같은 인코딩 (헤더에 없으면 내용으로 추정)"""
+        return response.encoding or response.apparent_encoding or "utf-8"
+
+    def scrape_all(self, limit: Optional[int] = None, include_content: bool = True,
+                   include_images: bool = False, workers: Optional[int] = None,
+                   incremental: bool = False, parse_workers: Optional[int] = None,
+                   include_blocks: bool = False) -> list:
         """
         전체 스크래핑 (목록 + 본문)
 
@@ -288,43 +563,168 @@ class NaverBlogScraper:
             limit: 스크래핑할 포스트 수
             include_content: 본문 포함 여부
             include_images: 이미지 URL 포함 여부
+            workers: 본문 동시 요청 수 (None이면 생성자 설정 사용)
+            incremental: 지난 실행의 저장본(PostStore)에 있고 바뀌지 않은 포스트는 본문을 다시 받지 않음
+            parse_workers: 본문 파싱 프로세스 수 (parse_pool이 없을 때 이번 수집 동안만 풀 생성, None이면 스레드에서 파싱)
+            include_blocks: 본문 블록(소제목/문단/이미지/링크 등 순서 있는 구조) 포함 여부
 
         Returns:
-            전체 포스트 데이터 리스트
+            전체 포스트 데이터 리스트 (RSS 순서 유지)
+        """
+        return list(self.iter_posts(limit=limit, include_content=include_content,
+                                    include_images=include_images, workers=workers,
+                                    incremental=incremental, parse_workers=parse_workers,
+                                    include_blocks=include_blocks))
+
+    def iter_posts(self, limit: Optional[int] = None, include_content: bool = True,
+                   include_images: bool = False, workers: Optional[int] = None,
+                   incremental: bool = False, parse_workers: Optional[int] = None,
+                   include_blocks: bool = False) -> Iterator[dict]:
+        """
+        포스트를 수집되는 대로 하나씩 반환 (scrape_all의 스트리밍 버전)
+
+        Args:
+            scrape_all()과 동일
+
+        Yields:
+            RSS 정보와 본문이 병합된 포스트 (RSS 순서 유지)
         """
-        print(f"[1/2] 포스트 목록 가져오는 중...")
+        self._log("[1/2] 포스트 목록 가져오는 중...")
         posts = self.get_post_list(limit=limit)
-        print(f"      {len(posts)}개 포스트 발견")
+        self._log(f"      {len(posts)}개 포스트 발견")
 
         if not include_content:
-            return posts
+            yield from posts
+            return
+
+        workers = max(1, workers or self.workers)
+        self._log("[2/2] 포스트 본문 가져오는 중..." + (f" (동시 {workers}개)" if workers > 1 else ""))
+
+        posts = [post for post in posts if post.get("logNo")]
+        store = PostStore(self.blog_id) if incremental else None
+        stored = {}
+        if store:
+            for post in posts:
+                unchanged = store.get_unchanged(post, include_images, include_blocks)
+                if unchanged:
+                    stored[post["logNo"]] = unchanged
+            self._log(f"      변경 없는 {len(stored)}개는 저장본 사용, {len(posts) - len(stored)}개 새로 수집")
+
+        to_fetch = [post for post in posts if post["logNo"] not in stored]
+        parse_pool = self.parse_pool
+        own_pool = None
+        if parse_pool is None and parse_workers and to_fetch:
+            parse_pool = own_pool = ParsePool(workers=parse_workers, backend=self.parser.backend)
+        fetched = self._iter_fetch(to_fetch, include_images, workers, parse_pool, include_blocks)
+        try:
+            for post in posts:
+                if post["logNo"] in stored:
+                    yield stored[post["logNo"]]
+                    continue
+                merged = next(fetched)
+                if store:
+                    store.put(merged)
+                yield merged
+        finally:
+            # 중간에 중단되어도 그때까지 받은 본문은 저장소에 남김
+            fetched.close()
+            if store:
+                store.save()
+            if own_pool:
+                own_pool.close()
+                self._log(own_pool.report())
+
+    def iter_archive(self, include_images: bool = False, workers: Optional[int] = None,
+                     resume: bool = True, checkpoint_path: Optional[str] = None,
+                     include_blocks: bool = False) -> Iterator[dict]:
+        """
+        블로그 전체 포스트 수집 (RSS 50개 제한 없음, 중단 후 이어받기 지원)
 
-        print(f"[2/2] 포스트 본문 가져오는 중...")
-        results = []
+        본문을 받은 포스트는 체크포인트(JSONL)에 바로 기록되므로, 중단 후 다시 실행하면
+        체크포인트의 포스트를 먼저 돌려주고 남은 포스트만 새로 받는다.
 
-        for i, post in enumerate(posts, 1):
-            log_no = post.get("logNo")
-            if not log_no:
-                continue
+        Args:
+            include_images: 이미지 URL 포함 여부
+            workers: 본문 동시 요청 수 (None이면 생성자 설정 사용)
+            resume: 기존 체크포인트에서 이어받기 (False면 처음부터)
+            checkpoint_path: 체크포인트 경로 (기본: output/.cache/archive/{blog_id}.jsonl)
+            include_blocks: 본문 블록 포함 여부
 
-            print(f"      [{i}/{len(posts)}] {post['title'][:30]}...")
+        Yields:
+            RSS 정보와 본문이 병합된 포스트
+        """
+        checkpoint_path = checkpoint_path or os.path.join(CACHE_DIR, "archive", f"{self.blog_id}.jsonl")
+        if not resume and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        done = set()
+        if os.path.exists(checkpoint_path):
+            done = {post.get("logNo") for post in iter_jsonl(checkpoint_path)}
+
+        self._log("[1/2] 전체 포스트 목록 가져오는 중...")
+        posts = [post for post in self.get_archive_post_list() if post.get("logNo")]
+        remaining = [post for post in posts if post["logNo"] not in done]
+        self._log(f"      {len(posts)}개 포스트 발견 (이전에 받은 {len(posts) - len(remaining)}개 제외)")
+
+        # 이전 실행에서 받은 포스트
+        if done:
+            yield from iter_jsonl(checkpoint_path)
+
+        workers = max(1, workers or self.workers)
+        self._log("[2/2] 포스트 본문 가져오는 중..." + (f" (동시 {workers}개)" if workers > 1 else ""))
+        fetched = self._iter_fetch(remaining, include_images, workers, self.parse_pool, include_blocks)
+        with JsonlWriter(checkpoint_path, append=True) as checkpoint:
+            try:
+                for merged in fetched:
+                    # 본문을 받지 못한 포스트는 다음 실행에서 다시 시도
+                    if "content" in merged:
+                        checkpoint.write(merged)
+                    yield merged
+            finally:
+                fetched.close()
+
+    def _iter_fetch(self, posts: list, include_images: bool, workers: int,
+                    parse_pool: Optional[ParsePool] = None, include_blocks: bool = False) -> Iterator[dict]:
+        """
+        포스트 본문을 받아 RSS 정보와 병합
 
-            content_data = self.get_post_content(log_no)
+        Args:
+            posts: logNo가 있는 RSS 포스트 리스트
+            include_images: 이미지 URL 포함 여부
+            workers: 동시 요청 수 (공유 executor가 있으면 무시)
+            parse_pool: 파싱 프로세스 풀 (있으면 요청 스레드는 받은 바이트를 넘기고 바로 다음 요청 진행)
+            include_blocks: 본문 블록 포함 여부
 
-            if content_data:
-                # RSS 정보와 본문 정보 병합
-                merged = {
-                    **post,
-                    "content": content_data.get("content", "")
-                }
-                if include_images:
-                    merged["images"] = content_data.get("images", [])
-                results.append(merged)
+        Yields:
+            병합된 포스트 (입력 순서 유지)
+        """
+        if self.executor is not None or workers > 1:
+            # 요청 간격은 rate_limiter가 호스트별로 보장하므로 sleep 없이 동시 요청
+            executor = self.executor or ThreadPoolExecutor(max_workers=workers)
+            log_nos = [p["logNo"] for p in posts]
+            if parse_pool:
+                contents = executor.map(self._submit_post_content, log_nos, [parse_pool] * len(log_nos))
             else:
-                results.append(post)
+                contents = executor.map(self.get_post_content, log_nos)
+            try:
+                for i, (post, content_data) in enumerate(zip(posts, contents), 1):
+                    if parse_pool:
+                        content_data = content_data.result()
+                    self._log(f"      [{i}/{len(posts)}] {post['title'][:30]}...")
+                    yield self._merge_post(post, content_data, include_images, include_blocks)
+            finally:
+                # 소비가 중단되면 아직 시작하지 않은 요청은 취소
+                contents.close()
+                if executor is not self.executor:
+                    executor.shutdown(wait=True)
+            return
+
+        for i, post in enumerate(posts, 1):
+            self._log(f"      [{i}/{len(posts)}] {post['title'][:30]}...")
+
+            content_data = self._get_post_content(post["logNo"], parse_pool)
+            yield self._merge_post(post, content_data, include_images, include_blocks)
 
             # 딜레이
             if i < len(posts):
                 time.sleep(self.delay)
-
-        return results
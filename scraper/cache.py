@@ -0,0 +1,66 @@
+"""
+파일 캐시 모듈
+- output/.cache/ 아래에 JSON으로 저장하고 TTL이 지나면 무효화
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Optional
+
+# 캐시 기본 경로 (프로젝트 루트 기준)
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "output", ".cache")
+
+
+class JsonFileCache:
+    """키별 JSON 파일 캐시 (TTL 지원)"""
+
+    def __init__(self, namespace: str, ttl: Optional[float] = None, cache_dir: str = CACHE_DIR):
+        """
+        Args:
+            namespace: 캐시 종류 (하위 폴더명)
+            ttl: 유효 시간 (초, None이면 만료 없음)
+            cache_dir: 캐시 루트 폴더
+        """
+        self.ttl = ttl
+        self.directory = os.path.join(cache_dir, namespace)
+
+    def path(self, key: str) -> str:
+        """키에 해당하는 파일 경로 (파일명에 쓸 수 없는 문자는 _로 치환)"""
+        safe_key = re.sub(r'[<>:"/\\|?*]', "_", key)
+        return os.path.join(self.directory, f"{safe_key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시된 값 조회
+
+        Returns:
+            저장된 값 (없거나 만료되었으면 None)
+        """
+        try:
+            with open(self.path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if self.ttl is not None and time.time() - entry.get("saved_at", 0) > self.ttl:
+            return None
+        return entry.get("data")
+
+    def set(self, key: str, data: Any):
+        """값 저장 (임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 기존 캐시 보존)"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "data": data}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str):
+        """캐시 삭제"""
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,215 @@
+"""
+HTTP 조건부 요청 캐시 모듈
+- 응답의 ETag / Last-Modified를 저장해 두고 다음 요청에 If-None-Match / If-Modified-Since 전송
+- 304 Not Modified면 디스크에 저장된 본문으로 응답 재구성
+- 요청한 쪽이 고른 URL(RSS 피드 등)만 저장하고, 오래 쓰지 않은 항목 / 크기 한도를 넘는 항목은 정리
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .cache import CACHE_DIR
+
+# 캐시된 응답에 다시 붙여 줄 헤더
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class HttpCache:
+    """ETag / Last-Modified 기반 조건부 GET 캐시 (디스크 저장)"""
+
+    # 마지막으로 쓴 뒤 이 시간이 지난 항목은 삭제 (초)
+    DEFAULT_MAX_AGE = 30 * 24 * 3600
+    # 캐시 전체 최대 크기 (바이트, 넘으면 오래 안 쓴 항목부터 삭제)
+    DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+    # 정리(prune) 주기 - 새로 저장한 응답 수
+    PRUNE_EVERY = 100
+
+    def __init__(self, cache_dir: str = os.path.join(CACHE_DIR, "http"),
+                 max_age: float = DEFAULT_MAX_AGE, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: 캐시 저장 폴더
+            max_age: 마지막으로 쓴 뒤 보관할 시간 (초)
+            max_bytes: 캐시 전체 최대 크기 (바이트)
+        """
+        self.directory = cache_dir
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._stores = 0
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str) -> tuple:
+        """URL별 (메타 파일, 본문 파일) 경로"""
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key[:2], key)
+        return f"{base}.json", f"{base}.body"
+
+    def _load_meta(self, url: str) -> Optional[dict]:
+        """저장된 메타 정보 (없거나 다른 URL이면 None)"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if meta.get("url") != url or not os.path.exists(body_path):
+            return None
+        return meta
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        """임시 파일에 쓴 뒤 교체"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _save_meta(self, url: str, meta: dict):
+        """메타 정보 저장"""
+        meta_path, _ = self._paths(url)
+        self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    def get(self, session: requests.Session, url: str, headers: Optional[dict] = None,
+            timeout: float = 10) -> requests.Response:
+        """
+        조건부 GET 요청
+
+        Args:
+            session: 요청에 사용할 세션
+            url: 요청 URL
+            headers: 요청 헤더
+            timeout: 타임아웃 (초)
+
+        Returns:
+            응답 객체 (304면 캐시 본문으로 재구성한 200 응답, from_cache 속성으로 구분)
+        """
+        meta = self._load_meta(url)
+        request_headers = dict(headers or {})
+        if meta:
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = session.get(url, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and meta:
+            return self._cached_response(url, meta, response)
+
+        response.from_cache = False
+        if response.status_code == 200:
+            self._store(url, response)
+        return response
+
+    def _cached_response(self, url: str, meta: dict, not_modified: requests.Response) -> requests.Response:
+        """304 응답을 캐시 본문으로 채운 200 응답으로 변환"""
+        meta_path, body_path = self._paths(url)
+        with open(body_path, "rb") as f:
+            body = f.read()
+        # 메타 파일 수정 시각 = 마지막으로 쓴 시각 (정리 기준)
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+
+        cached = requests.Response()
+        cached.status_code = 200
+        cached._content = body
+        cached.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        cached.encoding = meta.get("encoding")
+        cached.url = url
+        cached.request = not_modified.request
+        cached.elapsed = not_modified.elapsed
+        cached.from_cache = True
+        return cached
+
+    def _store(self, url: str, response: requests.Response):
+        """검증자(ETag / Last-Modified)가 있는 응답만 저장"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        _, body_path = self._paths(url)
+        self._write_atomic(body_path, response.content)
+        self._save_meta(url, {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": response.encoding,
+            "headers": {k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers},
+            "derived": {},
+        })
+
+        # 처음 저장할 때와 PRUNE_EVERY번 저장할 때마다 정리
+        with self._lock:
+            prune = self._stores % self.PRUNE_EVERY == 0
+            self._stores += 1
+        if prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        오래 쓰지 않은 항목을 지우고, 전체 크기가 한도를 넘으면 오래 안 쓴 항목부터 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                meta_path = os.path.join(root, name)
+                body_path = meta_path[:-len(".json")] + ".body"
+                try:
+                    used = os.path.getmtime(meta_path)
+                    size = os.path.getsize(meta_path)
+                    if os.path.exists(body_path):
+                        size += os.path.getsize(body_path)
+                except OSError:
+                    continue
+                entries.append((used, size, meta_path, body_path))
+
+        entries.sort()
+        total = sum(size for _, size, _, _ in entries)
+        expire_before = time.time() - self.max_age
+        removed = 0
+        for used, size, meta_path, body_path in entries:
+            if used >= expire_before and total <= self.max_bytes:
+                break
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+        return removed
+
+    def get_derived(self, url: str, name: str) -> Optional[Any]:
+        """
+        캐시된 응답에서 만들어 둔 가공 데이터 조회 (예: 파싱된 RSS 포스트 목록)
+
+        응답이 새로 저장되면 가공 데이터도 함께 비워지므로 항상 현재 본문과 일치한다.
+        """
+        meta = self._load_meta(url)
+        if not meta:
+            return None
+        return meta.get("derived", {}).get(name)
+
+    def set_derived(self, url: str, name: str, data: Any):
+        """캐시된 응답에 가공 데이터 저장 (캐시된 응답이 없으면 무시)"""
+        meta = self._load_meta(url)
+        if not meta:
+            return
+        meta.setdefault("derived", {})[name] = data
+        self._save_meta(url, meta)
@@ -0,0 +1,50 @@
+"""
+공유 HTTP 클라이언트 모듈
+- 스크래퍼와 키워드 수집기가 하나의 커넥션 풀(keep-alive)을 함께 사용
+- 매 요청마다 TCP/TLS 연결을 새로 맺지 않도록 호스트별 연결을 재사용
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+# 호스트별 유지할 연결 수 (동시 요청 수보다 작으면 연결이 버려졌다 다시 맺어짐)
+DEFAULT_POOL_SIZE = 32
+
+# 연결 풀을 유지할 호스트 수 (blog, m.blog, rss.blog, openapi, ac.search 등)
+DEFAULT_POOL_HOSTS = 16
+
+_shared_session: Optional[requests.Session] = None
+_shared_lock = threading.Lock()
+
+
+def create_http_session(pool_size: int = DEFAULT_POOL_SIZE, pool_hosts: int = DEFAULT_POOL_HOSTS) -> requests.Session:
+    """
+    커넥션 풀 크기를 지정한 Session 생성
+
+    Args:
+        pool_size: 호스트당 최대 유지 연결 수
+        pool_hosts: 연결 풀을 유지할 호스트 수
+
+    Returns:
+        gzip/deflate(설치되어 있으면 br) 압축을 요청하는 keep-alive Session
+    """
+    session = requests.Session()
+    # 재시도는 RetryPolicy가 담당하므로 어댑터 재시도는 끔
+    adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(make_headers(keep_alive=True, accept_encoding=True))
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """프로세스 전체가 공유하는 Session (처음 호출 시 생성)"""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = create_http_session()
+        return _shared_session
@@ -0,0 +1,171 @@
+"""
+키워드 분석 캐시 모듈
+- 네이버 API 조회 결과(문서 수, 블로그 제목, 뉴스 수, 자동완성)를 output/.cache/keywords.sqlite3 에 저장
+- 데이터 종류별로 유효 시간(TTL)을 따로 두고, 항목 수가 한도를 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+- 종류별 적중/실패 횟수 집계
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+try:
+    from .cache import CACHE_DIR
+except ImportError:
+    # python scraper/keyword_collector.py 로 직접 실행한 경우
+    from cache import CACHE_DIR
+
+# 데이터 종류별 기본 유효 시간 (초)
+DEFAULT_TTLS = {
+    "docs": 24 * 3600,          # 문서 수는 하루 사이에 거의 변하지 않음
+    "titles": 24 * 3600,
+    "recent": 6 * 3600,         # 최근 30일 글 수
+    "news": 3 * 3600,           # 뉴스는 빨리 바뀜
+    "autocomplete": 7 * 24 * 3600,
+}
+
+
+class KeywordCache:
+    """키워드 조회 결과 SQLite 캐시 (스레드 안전)"""
+
+    # 최대 보관 항목 수
+    DEFAULT_MAX_ENTRIES = 50000
+
+    def __init__(self, path: str = os.path.join(CACHE_DIR, "keywords.sqlite3"),
+                 ttls: Optional[Dict[str, float]] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            path: SQLite 파일 경로
+            ttls: 종류별 유효 시간 (초, 지정한 종류만 기본값을 덮어씀)
+            max_entries: 최대 보관 항목 수 (넘으면 가장 오래 안 쓴 항목부터 삭제)
+        """
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max(1, max_entries)
+        self.hits = Counter()
+        self.misses = Counter()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+            " saved_at REAL NOT NULL, used_at REAL NOT NULL,"
+            " PRIMARY KEY (kind, key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_used_at ON entries (used_at)")
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """
+        캐시된 값 조회
+
+        Args:
+            kind: 데이터 종류 ("docs", "titles", "recent", "news", "autocomplete")
+            key: 키워드 (조회 조건이 있으면 함께 포함)
+
+        Returns:
+            저장된 값 (없거나 만료되었으면 None)
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, saved_at FROM entries WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+            ttl = self.ttls.get(kind)
+            if row is None or (ttl is not None and now - row[1] > ttl):
+                self.misses[kind] += 1
+                return None
+            self._conn.execute("UPDATE entries SET used_at = ? WHERE kind = ? AND key = ?", (now, kind, key))
+            self.hits[kind] += 1
+        return json.loads(row[0])
+
+    def set(self, kind: str, key: str, value: Any):
+        """값 저장 (한도를 넘으면 오래 안 쓴 항목 삭제)"""
+        now = time.time()
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            # 다른 프로세스도 같은 파일에 쓰므로 항목 수는 쓰기 잠금을 잡은 채 파일에서 셈
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    "UPDATE entries SET value = ?, saved_at = ?, used_at = ? WHERE kind = ? AND key = ?",
+                    (data, now, now, kind, key),
+                )
+                if not cursor.rowcount:
+                    self._conn.execute(
+                        "INSERT INTO entries (kind, key, value, saved_at, used_at) VALUES (?, ?, ?, ?, ?)",
+                        (kind, key, data, now, now),
+                    )
+                    count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+                    if count > self.max_entries:
+                        self._evict(count)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _evict(self, count: int):
+        """가장 오래 안 쓴 항목부터 한도의 90%까지 삭제 (매 저장마다 지우지 않도록 여유를 둠)"""
+        excess = count - int(self.max_entries * 0.9)
+        self._conn.execute(
+            "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY used_at LIMIT ?)",
+            (excess,),
+        )
+
+    def purge_expired(self) -> int:
+        """
+        만료된 항목 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for kind, ttl in self.ttls.items():
+                if ttl is not None:
+                    removed += self._conn.execute(
+                        "DELETE FROM entries WHERE kind = ? AND saved_at < ?", (kind, now - ttl)
+                    ).rowcount
+        return removed
+
+    def clear(self, kind: Optional[str] = None):
+        """캐시 비우기 (kind를 지정하면 해당 종류만)"""
+        with self._lock:
+            if kind is None:
+                self._conn.execute("DELETE FROM entries")
+            else:
+                self._conn.execute("DELETE FROM entries WHERE kind = ?", (kind,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def summary(self) -> str:
+        """적중/실패 요약 (종류별)"""
+        kinds = sorted(set(self.hits) | set(self.misses))
+        if not kinds:
+            return "[키워드 캐시] 조회 없음"
+        total_hits = sum(self.hits.values())
+        total = total_hits + sum(self.misses.values())
+        parts = [f"{kind} {self.hits[kind]}/{self.hits[kind] + self.misses[kind]}" for kind in kinds]
+        return (f"[키워드 캐시] 적중 {total_hits}/{total} ({total_hits / total:.0%}) - "
+                + ", ".join(parts) + f", 저장 {len(self)}개")
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
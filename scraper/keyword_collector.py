@@ -8,19 +8,52 @@
 - 경쟁도/최신성 분석
 """
 
-import requests
-import urllib.parse
-import re
+import heapq
 import json
 import os
-import time
+import re
+import sys
+import threading
+import urllib.parse
+from collections import OrderedDict
+from contextlib import closing
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from collections import Counter
-from typing import List, Dict, Optional, Tuple
+from itertools import count
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+try:
+    from .aho_corasick import AhoCorasick
+    from .api_quota import DEFAULT_DAILY_LIMIT, ApiQuota, QuotaExceeded
+    from .autocomplete_crawler import AutocompleteCrawler
+    from .cache import CACHE_DIR
+    from .http_client import get_shared_session
+    from .keyword_cache import KeywordCache
+    from .phrase_miner import PhraseMiner
+    from .rate_limiter import RateLimiter
+except ImportError:
+    # python scraper/keyword_collector.py 로 직접 실행한 경우
+    from aho_corasick import AhoCorasick
+    from api_quota import DEFAULT_DAILY_LIMIT, ApiQuota, QuotaExceeded
+    from autocomplete_crawler import AutocompleteCrawler
+    from cache import CACHE_DIR
+    from http_client import get_shared_session
+    from keyword_cache import KeywordCache
+    from phrase_miner import PhraseMiner
+    from rate_limiter import RateLimiter
+    # utils 패키지는 저장소 루트에 있음
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from utils.helpers import JsonlWriter, iter_jsonl
 
 # 설정 파일 경로
 CONFIG_FILE = "config/keyword_config.json"
 
+# 키워드 파일 대량 분석 체크포인트 기본 위치 (파일 이름별 JSONL)
+CHECKPOINT_DIR = os.path.join(CACHE_DIR, "keyword_runs")
+
 
 def load_config() -> Dict:
     """설정 파일 로드"""
@@ -50,6 +83,9 @@ class KeywordCollector:
         '있는', '없는', '하고', '되고', '된', '할', '될', '인', '적', '다음', '에서', '까지', '부터', '으로서'
     }
 
+    # 제목 / 요약 구문 추출기 (조사 분리, 2~4단어, 2개 이상 글에 나온 구문)
+    PHRASE_MINER = PhraseMiner(min_n=2, max_n=4, min_count=2, stop_words=STOP_WORDS)
+
     # 검색 의도 패턴
     INTENT_PATTERNS = {
         "정보/프로필": ["프로필", "누구", "나이", "학력", "약력", "경력", "인물"],
@@ -62,15 +98,40 @@ class KeywordCollector:
         "감상/분석": ["줄거리", "결말", "해석", "분석", "정리", "요약", "스포"]
     }
 
-    def __init__(self, client_id: str = None, client_secret: str = None):
+    # 검색 의도 패턴 매처 (프로세스당 한 번 생성, 설정이 바뀌면 reload_intent_patterns())
+    _intent_matcher = None
+    _intent_lock = threading.Lock()
+
+    # 호스트당 초당 요청 수 / 연속 허용 요청 수 (네이버 검색 API는 초당 10회 제한)
+    API_RATE = 10.0
+    API_BURST = 5.0
+
+    # 동시 요청 수
+    DEFAULT_WORKERS = 5
+
+    # 실행 중 기억해 둘 검색 API 응답 수 (오래된 것부터 버림)
+    API_MEMO_SIZE = 256
+
+    def __init__(self, client_id: str = None, client_secret: str = None,
+                 session: Optional[requests.Session] = None, rate_limiter: Optional[RateLimiter] = None,
+                 workers: int = DEFAULT_WORKERS, executor: Optional[Executor] = None,
+                 use_cache: bool = True, cache: Optional[KeywordCache] = None,
+                 quota: Optional[ApiQuota] = None):
         """
         Args:
             client_id: 네이버 검색 API Client ID
             client_secret: 네이버 검색 API Client Secret
+            session: 요청에 사용할 Session (None이면 스크래퍼와 공유하는 커넥션 풀)
+            rate_limiter: 호스트별 속도 제한기 (None이면 API_RATE 기준으로 생성)
+            workers: 동시 요청 수 (executor가 없을 때 만드는 스레드풀 크기)
+            executor: 조회 요청에 쓸 공유 스레드풀
+            use_cache: 조회 결과 영구 캐시 사용 여부 (output/.cache/keywords.sqlite3)
+            cache: 사용할 캐시 (None이면 기본 경로에 생성)
+            quota: 검색 API 일일 할당량 (None이면 설정 파일의 NAVER_API_DAILY_LIMIT, 기본 25,000회)
         """
+        config = load_config()
         # 설정 파일에서 로드
         if client_id is None or client_secret is None:
-            config = load_config()
             client_id = client_id or config.get("NAVER_BLOG_CLIENT_ID", "")
             client_secret = client_secret or config.get("NAVER_BLOG_CLIENT_SECRET", "")
 
@@ -79,6 +140,150 @@ class KeywordCollector:
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
+        # keep-alive 커넥션 풀 재사용 (키워드마다 TCP/TLS 연결을 새로 맺지 않음)
+        self.session = session or get_shared_session()
+        # 동시에 조회해도 호스트당 API_RATE를 넘지 않도록 토큰 버킷으로 간격 유지
+        self.rate_limiter = rate_limiter or RateLimiter(rate=self.API_RATE, burst=self.API_BURST)
+        self.workers = max(1, workers)
+        self.executor = executor
+        self._own_executor = None
+        # 검색 API 응답 기억 ((endpoint, 키워드, 파라미터) → Future, 진행 중인 조회도 포함)
+        self._api_results = OrderedDict()
+        # 키워드별 블로그 문서 수 (어떤 블로그 검색 응답에든 total이 들어 있음)
+        self._blog_totals = {}
+        self._api_lock = threading.Lock()
+        self.api_calls = 0
+        # 지난 실행에서 조회한 결과는 종류별 TTL 동안 API를 다시 호출하지 않고 재사용
+        self._own_cache = None
+        if cache is None and use_cache:
+            cache = self._own_cache = KeywordCache()
+        self.cache = cache
+        # 하루 호출 수는 프로세스 간에 공유되는 파일에 기록 (한도를 넘으면 요청하지 않음)
+        self._own_quota = None
+        if quota is None:
+            quota = self._own_quota = ApiQuota(config.get("NAVER_API_DAILY_LIMIT", DEFAULT_DAILY_LIMIT))
+        self.quota = quota
+        # 할당량이 부족해 조회하지 못한 키워드 (collect_keywords 실행마다 갱신)
+        self.deferred = []
+        # 검색 API 조회 중 할당량 초과를 만난 키워드 (analyze_file이 결과를 기록할지 판단)
+        self._quota_misses = set()
+
+    def _cache_get(self, kind: str, key: str):
+        """영구 캐시 조회 (캐시를 쓰지 않으면 None)"""
+        return self.cache.get(kind, key) if self.cache is not None else None
+
+    def _cache_set(self, kind: str, key: str, value):
+        """영구 캐시 저장 (성공한 조회 결과만 저장)"""
+        if self.cache is not None:
+            self.cache.set(kind, key, value)
+
+    def _get(self, url: str, headers: dict, timeout: float) -> requests.Response:
+        """속도 제한을 적용한 GET 요청 (실패 시 requests 예외)"""
+        self.rate_limiter.acquire(url)
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 429 or response.status_code >= 500:
+            self.rate_limiter.record_error(url)
+        else:
+            self.rate_limiter.record_success(url)
+        response.raise_for_status()
+        return response
+
+    def _api_get(self, endpoint: str, keyword: str, timeout: float = 10, **params) -> dict:
+        """
+        검색 API 조회 (같은 조회는 실행 중 한 번만 요청)
+
+        - 응답은 (endpoint, 키워드, 파라미터) 단위로 기억해 두고 다시 요청하지 않음
+        - 같은 조회가 이미 진행 중이면 새로 요청하지 않고 그 응답을 함께 기다림
+        - 실패한 조회는 기억하지 않음 (다음 호출에서 다시 요청)
+
+        Args:
+            endpoint: 검색 API 종류 ("blog", "news")
+            keyword: 검색어
+            timeout: 요청 타임아웃 (초)
+            **params: display, sort 등 추가 파라미터
+
+        Returns:
+            응답 JSON
+
+        Raises:
+            requests.RequestException: 요청 실패
+            QuotaExceeded: 오늘 할당량을 모두 사용함
+        """
+        key = (endpoint, keyword, tuple(sorted(params.items())))
+        with self._api_lock:
+            future = self._api_results.get(key)
+            owner = future is None
+            if owner:
+                future = self._api_results[key] = Future()
+                while len(self._api_results) > self.API_MEMO_SIZE:
+                    self._api_results.popitem(last=False)
+            else:
+                self._api_results.move_to_end(key)
+
+        if owner:
+            query = urllib.parse.urlencode({"query": keyword, **params}, quote_via=urllib.parse.quote)
+            url = f"https://openapi.naver.com/v1/search/{endpoint}?{query}"
+            try:
+                self.quota.acquire()
+                with self._api_lock:
+                    self.api_calls += 1
+                data = self._get(url, headers=self._get_api_headers(), timeout=timeout).json()
+            except Exception as e:
+                if self._is_quota_error(e):
+                    # 다른 곳에서 할당량을 써 버린 경우 - 오늘은 더 요청하지 않음
+                    self.quota.exhaust()
+                    e = QuotaExceeded(f"네이버 API 일일 할당량 초과 ({e})")
+                with self._api_lock:
+                    if self._api_results.get(key) is future:
+                        del self._api_results[key]
+                    if isinstance(e, QuotaExceeded):
+                        self._quota_misses.add(keyword)
+                future.set_exception(e)
+            else:
+                if endpoint == "blog":
+                    with self._api_lock:
+                        self._blog_totals[keyword] = data.get("total", 0)
+                    self._cache_set("docs", keyword, data.get("total", 0))
+                future.set_result(data)
+        return future.result()
+
+    @staticmethod
+    def _is_quota_error(error: Exception) -> bool:
+        """네이버 API의 일일 한도 초과 응답인지 (429 + errorCode 010)"""
+        response = getattr(error, "response", None)
+        if response is None or response.status_code != 429:
+            return False
+        try:
+            return response.json().get("errorCode") == "010"
+        except ValueError:
+            return False
+
+    def _executor(self) -> Executor:
+        """조회 요청용 스레드풀 (공유 executor가 없으면 처음 호출 시 생성)"""
+        if self.executor is not None:
+            return self.executor
+        if self._own_executor is None:
+            self._own_executor = ThreadPoolExecutor(max_workers=self.workers)
+        return self._own_executor
+
+    def close(self):
+        """직접 만든 스레드풀 / 캐시 종료"""
+        if self._own_executor is not None:
+            self._own_executor.shutdown(wait=True)
+            self._own_executor = None
+        if self._own_cache is not None:
+            self._own_cache.close()
+            self._own_cache = None
+            self.cache = None
+        if self._own_quota is not None:
+            self._own_quota.close()
+            self._own_quota = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def _get_api_headers(self) -> dict:
         """API 요청 헤더 생성"""
@@ -91,7 +296,7 @@ class KeywordCollector:
         """API 키가 설정되어 있는지 확인"""
         return bool(self.client_id and self.client_secret)
 
-    def get_document_count(self, keyword: str) -> int:
+    def get_document_count(self, keyword: str) -> Optional[int]:
         """
         키워드의 블로그 문서 수 조회
 
@@ -99,23 +304,33 @@ class KeywordCollector:
             keyword: 검색할 키워드
 
         Returns:
-            블로그 문서 총 개수
+            블로그 문서 총 개수 (조회 실패 / 할당량 초과면 None - 0건과 구분)
         """
         if not self.is_configured():
             print("[오류] API 키가 설정되지 않았습니다.")
-            return 0
+            return None
 
-        try:
-            enc_text = urllib.parse.quote(keyword)
-            url = f"https://openapi.naver.com/v1/search/blog?query={enc_text}&display=1"
+        total = self._known_document_count(keyword)
+        if total is not None:
+            return total
 
-            response = requests.get(url, headers=self._get_api_headers(), timeout=5)
-            response.raise_for_status()
-            data = response.json()
+        try:
+            data = self._api_get("blog", keyword, timeout=5, display=1)
             return data.get("total", 0)
+        except QuotaExceeded:
+            # 할당량 초과는 collect_keywords가 보류 목록으로 한 번에 알림
+            return None
         except Exception as e:
             print(f"[오류] 문서 수 조회 실패 ({keyword}): {e}")
-            return 0
+            return None
+
+    def _known_document_count(self, keyword: str) -> Optional[int]:
+        """API를 호출하지 않고 알 수 있는 문서 수 (이번 실행의 블로그 검색 응답 또는 영구 캐시)"""
+        with self._api_lock:
+            total = self._blog_totals.get(keyword)
+        if total is None:
+            total = self._cache_get("docs", keyword)
+        return total
 
     def get_blog_titles(self, keyword: str, display: int = 50) -> List[Dict]:
         """
@@ -131,13 +346,13 @@ class KeywordCollector:
         if not self.is_configured():
             return []
 
-        try:
-            enc_text = urllib.parse.quote(keyword)
-            url = f"https://openapi.naver.com/v1/search/blog?query={enc_text}&display={display}&sort=sim"
+        cache_key = f"{keyword}\t{display}"
+        cached = self._cache_get("titles", cache_key)
+        if cached is not None:
+            return cached
 
-            response = requests.get(url, headers=self._get_api_headers(), timeout=10)
-            response.raise_for_status()
-            data = response.json()
+        try:
+            data = self._api_get("blog", keyword, display=display, sort="sim")
 
             results = []
             for item in data.get("items", []):
@@ -149,7 +364,10 @@ class KeywordCollector:
                     "link": item.get("link", ""),
                     "description": item.get("description", "").replace("<b>", "").replace("</b>", "")
                 })
+            self._cache_set("titles", cache_key, results)
             return results
+        except QuotaExceeded:
+            return []
         except Exception as e:
             print(f"[오류] 블로그 제목 조회 실패 ({keyword}): {e}")
             return []
@@ -165,12 +383,15 @@ class KeywordCollector:
         Returns:
             자동완성 키워드 리스트
         """
+        cached = self._cache_get("autocomplete", keyword)
+        if cached is not None:
+            return cached[:limit]
+
         try:
             enc_text = urllib.parse.quote(keyword)
             url = f"https://ac.search.naver.com/nx/ac?q={enc_text}&con=1&frm=nv&ans=2&r_format=json&r_enc=UTF-8&r_unicode=0&t_koreng=1&run=2&rev=4&q_enc=UTF-8"
 
-            response = requests.get(url, headers=self.headers, timeout=5)
-            response.raise_for_status()
+            response = self._get(url, headers=self.headers, timeout=5)
             data = response.json()
 
             suggestions = []
@@ -180,44 +401,55 @@ class KeywordCollector:
                     if isinstance(item, list) and len(item) > 0:
                         suggestions.append(item[0])
 
+            self._cache_set("autocomplete", keyword, suggestions)
             return suggestions[:limit]
+        except QuotaExceeded:
+            return []
         except Exception as e:
             print(f"[오류] 자동완성 조회 실패 ({keyword}): {e}")
             return []
 
-    def extract_keywords_from_titles(self, base_keyword: str, titles: List[Dict]) -> List[str]:
+    def crawl_autocomplete(self, seeds: Iterable[str], max_depth: int = 3, max_queries: int = 500,
+                           hangul: bool = True, latin: bool = True) -> List[str]:
         """
-        블로그 제목에서 연관 키워드 추출
+        자동완성을 글자 단위로 넓혀 가며 키워드 수집 ("캠핑 ㄱ", "캠핑 가", "캠핑 a" ...)
+
+        조회는 스레드풀에서 동시에 하되 호스트별 속도 제한을 따르고,
+        응답은 영구 캐시에 저장되어 다시 수집할 때 이미 조회한 질의는 요청하지 않음
 
         Args:
-            base_keyword: 기본 키워드
-            titles: get_blog_titles() 결과
+            seeds: 시작 키워드들
+            max_depth: 시드에서 구체화할 최대 단계 수
+            max_queries: 최대 조회 수
+            hangul: 한글 초성 / 음절로 확장
+            latin: 영문 글자로 확장
 
         Returns:
-            "기본키워드 + 추출단어" 조합 리스트
+            찾은 키워드 (찾은 순서)
         """
-        base_words = set(re.split(r'[,\s·|:\-\[\]()]+', base_keyword.lower()))
-        base_words = {w.strip() for w in base_words if len(w.strip()) >= 2}
-
-        word_counter = Counter()
-
-        for item in titles:
-            title = item.get("title", "")
-            title_clean = title.replace(base_keyword, '')
-            words = re.split(r'[,\s·|:\-\[\]()「」『』【】]+', title_clean)
+        crawler = AutocompleteCrawler(
+            lambda query: self.get_autocomplete_keywords(query, limit=AutocompleteCrawler.PAGE_SIZE),
+            self._executor(), max_depth=max_depth, max_queries=max_queries,
+            window=max(2, self.workers), hangul=hangul, latin=latin,
+        )
+        keywords = crawler.crawl(seeds)
+        print(crawler.summary())
+        return keywords
 
-            for word in words:
-                word = word.strip()
-                if len(word) >= 2 and word not in self.STOP_WORDS and word.lower() not in base_words:
-                    word_counter[word] += 1
+    def extract_keywords_from_titles(self, base_keyword: str, titles: List[Dict]) -> List[str]:
+        """
+        블로그 제목 / 요약에서 연관 키워드 추출 (조사를 뗀 2~4단어 구문, 자주 나온 순)
 
-        extracted = []
-        for word, count in word_counter.most_common(30):
-            if count >= 2 and len(extracted) < 15:
-                combined = f"{base_keyword} {word}"
-                extracted.append(combined)
+        Args:
+            base_keyword: 기본 키워드
+            titles: get_blog_titles() 결과
 
-        return extracted
+        Returns:
+            "기본키워드 + 추출구문" 조합 리스트
+        """
+        texts = [item.get("title", "") for item in titles] + [item.get("description", "") for item in titles]
+        phrases = self.PHRASE_MINER.mine(texts, exclude=[base_keyword], limit=15)
+        return [f"{base_keyword} {phrase}" for phrase, _ in phrases]
 
     def get_recent_blog_count(self, keyword: str, days: int = 30) -> int:
         """
@@ -233,13 +465,13 @@ class KeywordCollector:
         if not self.is_configured():
             return 0
 
-        try:
-            enc_text = urllib.parse.quote(keyword)
-            url = f"https://openapi.naver.com/v1/search/blog?query={enc_text}&display=100&sort=date"
+        cache_key = f"{keyword}\t{days}"
+        cached = self._cache_get("recent", cache_key)
+        if cached is not None:
+            return cached
 
-            response = requests.get(url, headers=self._get_api_headers(), timeout=10)
-            response.raise_for_status()
-            data = response.json()
+        try:
+            data = self._api_get("blog", keyword, display=100, sort="date")
 
             cutoff_date = datetime.now() - timedelta(days=days)
             recent_count = 0
@@ -254,7 +486,10 @@ class KeywordCollector:
                     except:
                         pass
 
+            self._cache_set("recent", cache_key, recent_count)
             return recent_count
+        except QuotaExceeded:
+            return 0
         except Exception as e:
             print(f"[오류] 최근 블로그 수 조회 실패 ({keyword}): {e}")
             return 0
@@ -273,13 +508,13 @@ class KeywordCollector:
         if not self.is_configured():
             return {"total": 0, "recent": 0}
 
-        try:
-            enc_text = urllib.parse.quote(keyword)
-            url = f"https://openapi.naver.com/v1/search/news?query={enc_text}&display=100&sort=date"
+        cache_key = f"{keyword}\t{days}"
+        cached = self._cache_get("news", cache_key)
+        if cached is not None:
+            return cached
 
-            response = requests.get(url, headers=self._get_api_headers(), timeout=10)
-            response.raise_for_status()
-            data = response.json()
+        try:
+            data = self._api_get("news", keyword, display=100, sort="date")
 
             total = data.get("total", 0)
             cutoff_date = datetime.now() - timedelta(days=days)
@@ -297,7 +532,10 @@ class KeywordCollector:
                     except:
                         pass
 
+            self._cache_set("news", cache_key, {"total": total, "recent": recent_news})
             return {"total": total, "recent": recent_news}
+        except QuotaExceeded:
+            return {"total": 0, "recent": 0}
         except Exception as e:
             print(f"[오류] 뉴스 수 조회 실패 ({keyword}): {e}")
             return {"total": 0, "recent": 0}
@@ -315,20 +553,61 @@ class KeywordCollector:
         """
         title_text = ' '.join([t.get("title", "") for t in titles]).lower()
 
-        intent_counts = {k: 0 for k in self.INTENT_PATTERNS.keys()}
-
-        for intent, patterns in self.INTENT_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in title_text:
-                    intent_counts[intent] += title_text.count(pattern)
+        # 모든 의도의 패턴을 한 번에 훑어 집계 (패턴별 횟수는 str.count와 동일)
+        intents, pattern_intents, matcher = self._get_intent_matcher()
+        intent_counts = {k: 0 for k in intents}
+        for intent, hits in zip(pattern_intents, matcher.count(title_text)):
+            intent_counts[intent] += hits
 
         sorted_intents = sorted(intent_counts.items(), key=lambda x: x[1], reverse=True)
         return [(k, v) for k, v in sorted_intents if v > 0][:3]
 
+    @classmethod
+    def intent_patterns(cls) -> Dict[str, List[str]]:
+        """
+        검색 의도 패턴 (기본 INTENT_PATTERNS + 설정 파일의 INTENT_PATTERNS)
+
+        설정 파일 예: "INTENT_PATTERNS": {"후기/리뷰": ["내돈내산"], "육아": ["아기", "이유식"]}
+        기존 의도에는 패턴이 추가되고, 새 의도는 새로 생긴다.
+        """
+        patterns = {intent: list(items) for intent, items in cls.INTENT_PATTERNS.items()}
+        for intent, extra in (load_config().get("INTENT_PATTERNS") or {}).items():
+            merged = patterns.setdefault(intent, [])
+            for pattern in extra:
+                pattern = pattern.strip().lower()
+                if pattern and pattern not in merged:
+                    merged.append(pattern)
+        return patterns
+
+    @classmethod
+    def reload_intent_patterns(cls):
+        """설정 파일의 패턴을 다시 읽어 검색 의도 매처 재생성"""
+        with cls._intent_lock:
+            cls._intent_matcher = cls._build_intent_matcher()
+
+    @classmethod
+    def _get_intent_matcher(cls) -> Tuple[List[str], List[str], AhoCorasick]:
+        """(의도 목록, 패턴별 의도, 매처) - 처음 호출할 때 생성"""
+        matcher = cls._intent_matcher
+        if matcher is None:
+            with cls._intent_lock:
+                if cls._intent_matcher is None:
+                    cls._intent_matcher = cls._build_intent_matcher()
+                matcher = cls._intent_matcher
+        return matcher
+
+    @classmethod
+    def _build_intent_matcher(cls) -> Tuple[List[str], List[str], AhoCorasick]:
+        """전체 의도 패턴으로 매처 생성"""
+        patterns = cls.intent_patterns()
+        pattern_intents = [intent for intent, items in patterns.items() for _ in items]
+        matcher = AhoCorasick(pattern for items in patterns.values() for pattern in items)
+        return list(patterns), pattern_intents, matcher
+
     def analyze_keyword(self, keyword: str, analyze_competition: bool = True,
                        analyze_recency: bool = True, analyze_intent: bool = True) -> Dict:
         """
-        키워드 종합 분석
+        키워드 종합 분석 (필요한 조회를 동시에 요청)
 
         Args:
             keyword: 분석할 키워드
@@ -339,6 +618,141 @@ class KeywordCollector:
         Returns:
             종합 분석 결과
         """
+        lookups = self._submit_lookups(keyword, analyze_competition, analyze_recency)
+        return self._build_analysis(keyword, lookups, analyze_intent)
+
+    def analyze_keywords(self, keywords: Iterable[str], analyze_competition: bool = True,
+                         analyze_recency: bool = True, analyze_intent: bool = True) -> List[Dict]:
+        """
+        여러 키워드 종합 분석 (iter_analysis 결과를 리스트로)
+
+        Args:
+            keywords: 분석할 키워드들
+            나머지는 analyze_keyword()와 동일
+
+        Returns:
+            키워드 순서대로 분석 결과 리스트
+        """
+        return list(self.iter_analysis(keywords, analyze_competition, analyze_recency, analyze_intent))
+
+    def iter_analysis(self, keywords: Iterable[str], analyze_competition: bool = True,
+                      analyze_recency: bool = True, analyze_intent: bool = True) -> Iterator[Dict]:
+        """
+        여러 키워드를 파이프라인으로 분석 (앞 키워드 결과를 기다리는 동안 다음 키워드 조회를 미리 요청)
+
+        Args:
+            analyze_keywords()와 동일
+
+        Yields:
+            키워드 순서대로 분석 결과
+        """
+        # 동시에 조회 중인 키워드 수 (스레드풀이 쉬지 않을 만큼만 미리 요청)
+        window = max(2, self.workers)
+        pending = []
+        keywords = iter(keywords)
+        try:
+            while True:
+                for keyword in keywords:
+                    pending.append((keyword, self._submit_lookups(keyword, analyze_competition, analyze_recency)))
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    return
+                keyword, lookups = pending.pop(0)
+                yield self._build_analysis(keyword, lookups, analyze_intent)
+        finally:
+            # 소비가 중단되면 아직 시작하지 않은 조회는 취소
+            for _, lookups in pending:
+                for future in lookups.values():
+                    future.cancel()
+
+    def analyze_file(self, path: str, checkpoint_path: str, resume: bool = True,
+                     analyze_competition: bool = True, analyze_recency: bool = True,
+                     analyze_intent: bool = True) -> Dict:
+        """
+        키워드 파일 대량 분석 (결과를 체크포인트 JSONL에 한 줄씩 이어 씀)
+
+        - 파일은 한 줄씩 읽으면서 바로 조회 요청 (수천 줄이어도 키워드 목록을 미리 만들지 않음)
+        - 체크포인트에 이미 있는 키워드는 다시 조회하지 않음 (중단된 실행을 이어서 진행)
+        - 할당량이 바닥나면 멈춤 - 문서 수를 조회하지 못한 키워드는 기록하지 않아 다음 실행에서 다시 분석
+
+        Args:
+            path: 키워드 파일 (iter_keyword_file 형식)
+            checkpoint_path: 분석 결과를 이어 쓸 JSONL 경로
+            resume: False면 기존 체크포인트를 지우고 처음부터 분석
+            나머지는 analyze_keyword()와 동일
+
+        Returns:
+            {"analyzed": 이번에 분석한 수, "skipped": 체크포인트에 있어 건너뛴 수,
+             "deferred": 기록하지 못한 키워드, "stopped": 할당량 소진으로 멈췄는지 여부}
+        """
+        done = set()
+        if os.path.exists(checkpoint_path):
+            if resume:
+                done = {record["keyword"] for record in iter_jsonl(checkpoint_path) if "keyword" in record}
+            else:
+                os.remove(checkpoint_path)
+
+        summary = {"analyzed": 0, "skipped": 0, "deferred": [], "stopped": False}
+        seen = set()
+        with self._api_lock:
+            self._quota_misses.clear()
+
+        def pending_keywords():
+            for keyword in iter_keyword_file(path):
+                if keyword in seen:
+                    continue
+                seen.add(keyword)
+                if keyword in done:
+                    summary["skipped"] += 1
+                    continue
+                yield keyword
+
+        if done:
+            print(f"[대량 분석] 체크포인트에서 {len(done):,}개 키워드 결과를 이어받음: {checkpoint_path}")
+
+        analyses = self.iter_analysis(pending_keywords(), analyze_competition,
+                                      analyze_recency, analyze_intent)
+        with JsonlWriter(checkpoint_path, append=True) as writer, closing(analyses):
+            # 멈추면 바로 닫아 미리 요청해 둔 조회 중 아직 시작하지 않은 것을 취소
+            for result in analyses:
+                keyword = result["keyword"]
+                with self._api_lock:
+                    quota_hit = keyword in self._quota_misses
+                    self._quota_misses.discard(keyword)
+                # 조회 중 할당량 초과를 만난 결과는 일부 값이 빠져 있으므로 기록하지 않음
+                # (성공한 조회는 영구 캐시에 남아 있어 다음 실행에서 API를 다시 쓰지 않음)
+                if result["docs"] is None or quota_hit:
+                    summary["deferred"].append(keyword)
+                else:
+                    writer.write(result)
+                    summary["analyzed"] += 1
+                    print(f"  [{len(done) + summary['analyzed']:,}] '{keyword}' "
+                          f"문서 {result['docs']:,}개 {result['rating']}")
+                # 할당량 초과를 실제로 만났으면 남은 키워드는 다음 실행으로 넘김
+                if quota_hit:
+                    summary["stopped"] = True
+                    break
+
+        return summary
+
+    def _submit_lookups(self, keyword: str, analyze_competition: bool,
+                        analyze_recency: bool) -> Dict[str, Future]:
+        """키워드 분석에 필요한 조회 요청 (서로 독립이므로 한꺼번에 스레드풀에 넣음)"""
+        executor = self._executor()
+        # 문서 수는 제목 조회 응답의 total로 알 수 있으므로 따로 요청하지 않음 (_build_analysis)
+        lookups = {
+            "titles": executor.submit(self.get_blog_titles, keyword, 50),
+            "autocomplete": executor.submit(self.get_autocomplete_keywords, keyword),
+        }
+        if analyze_competition:
+            lookups["recent_blogs"] = executor.submit(self.get_recent_blog_count, keyword, 30)
+        if analyze_recency:
+            lookups["news"] = executor.submit(self.get_news_count, keyword, 7)
+        return lookups
+
+    def _build_analysis(self, keyword: str, lookups: Dict[str, Future], analyze_intent: bool) -> Dict:
+        """조회 결과로 종합 분석 결과 구성"""
         result = {
             "keyword": keyword,
             "docs": 0,
@@ -350,13 +764,17 @@ class KeywordCollector:
             "related_keywords": []
         }
 
-        # 문서 수 조회
+        # 블로그 제목 수집 (연관 키워드 및 의도 분석용)
+        titles = lookups["titles"].result()
+
+        # 문서 수 (제목 조회 응답의 total, 제목 조회가 실패했을 때만 따로 요청)
         result["docs"] = self.get_document_count(keyword)
-        time.sleep(0.1)
 
         # 골든 키워드 판별
         docs = result["docs"]
-        if docs < 5000:
+        if docs is None:
+            result["rating"] = "확인 불가 (문서 수 조회 실패)"
+        elif docs < 5000:
             result["is_golden"] = True
             result["rating"] = "⭐⭐⭐ 매우 좋음 (저경쟁 블루오션)"
         elif docs < 10000:
@@ -367,13 +785,9 @@ class KeywordCollector:
         else:
             result["rating"] = "경쟁 있음 (레드오션)"
 
-        # 블로그 제목 수집 (연관 키워드 및 의도 분석용)
-        titles = self.get_blog_titles(keyword, display=50)
-        time.sleep(0.1)
-
         # 경쟁도 분석
-        if analyze_competition:
-            recent_blogs = self.get_recent_blog_count(keyword, days=30)
+        if "recent_blogs" in lookups:
+            recent_blogs = lookups["recent_blogs"].result()
             if recent_blogs < 10:
                 comp_rating = "🟢 매우 낮음 (바로 진입!)"
             elif recent_blogs < 30:
@@ -387,11 +801,10 @@ class KeywordCollector:
                 "recent_30days": recent_blogs,
                 "rating": comp_rating
             }
-            time.sleep(0.1)
 
         # 최신성 분석
-        if analyze_recency:
-            news_data = self.get_news_count(keyword, days=7)
+        if "news" in lookups:
+            news_data = lookups["news"].result()
             if news_data["recent"] > 10:
                 news_rating = "🔥 핫이슈 (신속히 작성!)"
             elif news_data["recent"] > 5:
@@ -406,16 +819,15 @@ class KeywordCollector:
                 "news_recent_7days": news_data["recent"],
                 "rating": news_rating
             }
-            time.sleep(0.1)
 
         # 검색 의도 분석
         if analyze_intent and titles:
             result["intent"] = self.analyze_search_intent(keyword, titles)
 
         # 연관 키워드 추출
+        autocomplete = lookups["autocomplete"].result()
         if titles:
             extracted = self.extract_keywords_from_titles(keyword, titles)
-            autocomplete = self.get_autocomplete_keywords(keyword)
 
             all_related = []
             seen = set()
@@ -429,54 +841,50 @@ class KeywordCollector:
         return result
 
     def collect_keywords(self, seed_keywords: List[str], max_keywords: int = 100,
-                        golden_threshold: int = 10000) -> List[Dict]:
+                        golden_threshold: int = 10000, max_depth: int = 1) -> List[Dict]:
         """
         시드 키워드에서 연관 키워드까지 수집
 
         Args:
             seed_keywords: 시작 키워드 리스트
-            max_keywords: 최대 수집할 키워드 수
+            max_keywords: 최대 수집할 키워드 수 (시드 포함)
             golden_threshold: 골든 키워드 기준 문서 수
+            max_depth: 확장 단계 수 (1이면 시드만 확장, 2면 시드에서 찾은 키워드도 확장)
 
         Returns:
-            수집된 키워드 분석 결과 리스트
+            수집된 키워드 분석 결과 리스트 (할당량이 부족해 보류한 키워드는 self.deferred)
         """
-        all_keywords = list(seed_keywords)
-        searched = set()
         results = []
 
-        print(f"[키워드 수집] 시드 키워드 {len(seed_keywords)}개에서 시작...")
-
-        for seed in seed_keywords:
-            if seed in searched:
+        print(f"[키워드 수집] 시드 키워드 {len(seed_keywords)}개에서 시작..."
+              + (f" (최대 {max_depth}단계 확장)" if max_depth > 1 else ""))
+
+        seeds = list(dict.fromkeys(seed_keywords))
+        discovered = self._expand_keywords(seeds, max_keywords, max_depth)
+        targets = list(discovered)
+
+        print(f"[키워드 수집] 총 {len(targets)}개 키워드 발견, 분석 시작...")
+
+        # 시드(앞쪽)부터 남은 할당량 안에서만 조회 (모자라면 나머지는 0건으로 채우지 않고 보류)
+        counts, to_query, deferred = self._plan_document_counts(targets)
+        if deferred:
+            print(f"[할당량] 남은 API 호출 {self.quota.remaining():,}회 - "
+                  f"{len(targets)}개 중 {len(deferred)}개는 이번 실행에서 보류")
+
+        # 문서 수는 동시에 조회 (속도는 rate_limiter가 제한)
+        doc_counts = self._executor().map(self.get_document_count, to_query)
+        for i, (keyword, docs) in enumerate(zip(to_query, doc_counts)):
+            print(f"  [{i+1}/{len(to_query)}] '{keyword}' 분석 완료")
+            counts[keyword] = docs
+
+        planned_deferred = set(deferred)
+        for keyword in targets:
+            docs = counts.get(keyword)
+            if docs is None:
+                # 조회 중 할당량 초과 / 오류 - 0건(골든 키워드)으로 잘못 평가하지 않도록 보류
+                if keyword not in planned_deferred:
+                    deferred.append(keyword)
                 continue
-            searched.add(seed)
-
-            print(f"  → '{seed}' 연관 키워드 추출 중...")
-
-            titles = self.get_blog_titles(seed, display=50)
-            if titles:
-                extracted = self.extract_keywords_from_titles(seed, titles)
-                for kw in extracted:
-                    if kw not in all_keywords:
-                        all_keywords.append(kw)
-
-            autocomplete = self.get_autocomplete_keywords(seed)
-            for kw in autocomplete:
-                if kw not in all_keywords:
-                    all_keywords.append(kw)
-
-            time.sleep(0.2)
-
-        print(f"[키워드 수집] 총 {len(all_keywords)}개 키워드 발견, 분석 시작...")
-
-        for i, keyword in enumerate(all_keywords[:max_keywords]):
-            if keyword in searched and keyword not in seed_keywords:
-                continue
-
-            print(f"  [{i+1}/{min(len(all_keywords), max_keywords)}] '{keyword}' 분석 중...")
-
-            docs = self.get_document_count(keyword)
 
             is_golden = docs <= golden_threshold
             if docs < 5000:
@@ -492,21 +900,170 @@ class KeywordCollector:
                 "keyword": keyword,
                 "docs": docs,
                 "is_golden": is_golden,
-                "rating": rating
+                "rating": rating,
+                "depth": discovered[keyword]
             })
 
-            time.sleep(0.1)
-
         results.sort(key=lambda x: x["docs"])
 
         golden_count = sum(1 for r in results if r["is_golden"])
         print(f"\n[완료] 총 {len(results)}개 키워드 분석, 골든 키워드 {golden_count}개")
+        self.deferred = deferred
+        if deferred:
+            print(f"[보류] {len(deferred)}개 키워드는 문서 수를 조회하지 못해 결과에서 뺐습니다 "
+                  f"(할당량이 초기화되는 자정(KST) 이후 다시 실행): "
+                  + ", ".join(deferred[:10]) + (" 외" if len(deferred) > 10 else ""))
+        if self.cache is not None:
+            print(self.cache.summary())
+        print(self.quota.summary())
 
         return results
 
+    def _expand_keywords(self, seeds: List[str], max_keywords: int, max_depth: int) -> Dict[str, int]:
+        """
+        깊이 제한 너비 우선 확장 (같은 단계 안에서는 유망한 키워드부터)
+
+        frontier는 (단계, 부모 안에서의 순위, 부모 문서 수) 순 우선순위 큐로, 자동완성 상위 /
+        경쟁이 적은 부모에서 나온 키워드를 먼저 확장한다. 확장은 workers개씩 동시에 진행하고
+        max_keywords를 채우거나 남은 할당량이 찾은 키워드의 문서 수 조회분만 남으면 멈춘다.
 
-def save_results(results: List[Dict], keyword: str, output_dir: str = "output"):
-    """결과를 JSON 파일로 저장"""
+        Args:
+            seeds: 시드 키워드 (중복 제거된 순서)
+            max_keywords: 최대 수집 키워드 수
+            max_depth: 확장 단계 수
+
+        Returns:
+            {키워드: 단계} (시드는 0단계, 찾은 순서 유지)
+        """
+        discovered = {}
+        frontier = []
+        seq = count()
+        for seed in seeds[:max_keywords]:
+            discovered[seed] = 0
+            heapq.heappush(frontier, (0, 0, 0, next(seq), seed))
+
+        executor = self._executor()
+        running = {}
+        expanded = 0
+        while frontier or running:
+            while (frontier and len(running) < self.workers and len(discovered) < max_keywords
+                   and max_depth > 0 and self._expansion_budget(len(discovered) - expanded) > 0):
+                depth, _, _, _, keyword = heapq.heappop(frontier)
+                running[executor.submit(self._expand_keyword, keyword)] = (keyword, depth)
+                expanded += 1
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                keyword, depth = running.pop(future)
+                children = future.result()
+                parent_docs = self._known_document_count(keyword)
+                if parent_docs is None:
+                    parent_docs = float("inf")
+                # 찾은 키워드마다 문서 수 조회 1회가 필요하므로 남은 할당량만큼만 추가
+                room = self._expansion_budget(len(discovered) - expanded) - len(running)
+                added = 0
+                for rank, child in enumerate(children):
+                    if len(discovered) >= max_keywords or added >= room:
+                        break
+                    if child in discovered:
+                        continue
+                    discovered[child] = depth + 1
+                    added += 1
+                    if depth + 1 < max_depth:
+                        heapq.heappush(frontier, (depth + 1, rank, parent_docs, next(seq), child))
+                print(f"  → [{depth + 1}단계] '{keyword}' 확장: 새 키워드 {added}개 (누적 {len(discovered)}개)")
+
+        return discovered
+
+    def _expansion_budget(self, unexpanded: int) -> int:
+        """확장에 더 쓸 수 있는 호출 수 (확장하지 않은 키워드의 문서 수 조회분은 남겨 둠)"""
+        return self.quota.remaining() - unexpanded
+
+    def _expand_keyword(self, keyword: str) -> List[str]:
+        """키워드 하나의 연관 키워드 (자동완성 순위 → 블로그 제목 추출 순, 중복 제외)"""
+        autocomplete = self.get_autocomplete_keywords(keyword)
+        titles = self.get_blog_titles(keyword, display=50)
+        extracted = self.extract_keywords_from_titles(keyword, titles) if titles else []
+        return list(dict.fromkeys(autocomplete + extracted))
+
+    def _plan_document_counts(self, keywords: List[str]) -> Tuple[Dict[str, int], List[str], List[str]]:
+        """
+        문서 수 조회 계획 (남은 할당량을 앞 키워드부터 배정)
+
+        Args:
+            keywords: 우선순위 순서의 키워드 리스트
+
+        Returns:
+            (이미 아는 문서 수, API로 조회할 키워드, 할당량이 모자라 보류할 키워드)
+        """
+        known = {}
+        to_query = []
+        deferred = []
+        budget = self.quota.remaining()
+        for keyword in keywords:
+            total = self._known_document_count(keyword)
+            if total is not None:
+                known[keyword] = total
+            elif budget > 0:
+                to_query.append(keyword)
+                budget -= 1
+            else:
+                deferred.append(keyword)
+        return known, to_query, deferred
+
+
+def iter_keyword_file(path: str) -> Iterator[str]:
+    """
+    키워드 파일을 한 줄씩 읽기
+
+    한 줄에 키워드 하나 (쉼표로 여러 개도 가능), 빈 줄과 #으로 시작하는 줄은 무시
+    """
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            for keyword in line.split(","):
+                keyword = keyword.strip()
+                if keyword:
+                    yield keyword
+
+
+def default_checkpoint_path(path: str) -> str:
+    """키워드 파일의 기본 체크포인트 경로 (output/.cache/keyword_runs/<파일 이름>.jsonl)"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(CHECKPOINT_DIR, f"{name}.jsonl")
+
+
+def save_checkpoint_results(checkpoint_path: str, keyword: str, output_dir: str = "output",
+                            deferred: Optional[List[str]] = None) -> str:
+    """
+    체크포인트 JSONL로 최종 keywords_*.json 생성 (문서 수 적은 순)
+
+    Args:
+        checkpoint_path: analyze_file()이 기록한 JSONL
+        keyword: 결과 파일 이름에 쓸 이름 (seed_keyword)
+        output_dir: 저장 폴더
+        deferred: 기록하지 못한 키워드
+
+    Returns:
+        저장한 파일 경로
+    """
+    # 같은 키워드가 여러 번 기록되어 있으면 마지막 결과 사용
+    results = {}
+    if os.path.exists(checkpoint_path):
+        for record in iter_jsonl(checkpoint_path):
+            if "keyword" in record:
+                results[record["keyword"]] = record
+    results = sorted(results.values(), key=lambda r: r["docs"])
+    return save_results(results, keyword, output_dir, deferred=deferred)
+
+
+def save_results(results: List[Dict], keyword: str, output_dir: str = "output",
+                 deferred: Optional[List[str]] = None):
+    """결과를 JSON 파일로 저장 (deferred: 할당량 부족으로 보류한 키워드)"""
     os.makedirs(output_dir, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -520,6 +1077,8 @@ def save_results(results: List[Dict], keyword: str, output_dir: str = "output"):
         "golden_count": sum(1 for r in results if r.get("is_golden")),
         "keywords": results
     }
+    if deferred:
+        output["deferred_keywords"] = deferred
 
     with open(filename, "w", encoding="utf-8") as f:
         json.dump(output, f, indent=2, ensure_ascii=False)
@@ -528,14 +1087,86 @@ def save_results(results: List[Dict], keyword: str, output_dir: str = "output"):
     return filename
 
 
+def bulk_main(argv: Optional[List[str]] = None) -> int:
+    """
+    키워드 파일 대량 분석 CLI (입력을 묻지 않음)
+
+    사용법:
+        python scraper/keyword_collector.py --file keywords.txt
+        python scraper/keyword_collector.py --file keywords.txt --workers 8 --no-intent
+        python scraper/keyword_collector.py --file keywords.txt --fresh   # 체크포인트 무시하고 처음부터
+
+    Returns:
+        종료 코드 (0: 전체 완료, 1: 오류, 2: 할당량 소진으로 중단 - 다시 실행하면 이어서 분석)
+    """
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(
+        prog="keyword_collector.py",
+        description="키워드 파일 대량 분석 (결과를 체크포인트에 기록하며 진행, 중단되면 이어서 실행)",
+    )
+    arg_parser.add_argument("--file", required=True,
+                            help="키워드 파일 (한 줄에 하나, 빈 줄과 #으로 시작하는 줄은 무시)")
+    arg_parser.add_argument("--checkpoint", default=None,
+                            help="체크포인트 JSONL 경로 (기본: output/.cache/keyword_runs/<파일 이름>.jsonl)")
+    arg_parser.add_argument("--fresh", action="store_true", help="기존 체크포인트를 지우고 처음부터 분석")
+    arg_parser.add_argument("--workers", type=int, default=KeywordCollector.DEFAULT_WORKERS,
+                            help=f"동시 요청 수 (기본: {KeywordCollector.DEFAULT_WORKERS}, "
+                                 f"속도는 초당 {KeywordCollector.API_RATE:.0f}회로 제한)")
+    arg_parser.add_argument("--output-dir", default="output", help="최종 결과 폴더 (기본: output)")
+    arg_parser.add_argument("--no-competition", action="store_true", help="경쟁도(최근 30일 글 수) 분석 생략")
+    arg_parser.add_argument("--no-recency", action="store_true", help="최신성(뉴스 수) 분석 생략")
+    arg_parser.add_argument("--no-intent", action="store_true", help="검색 의도 분석 생략")
+    args = arg_parser.parse_args(argv)
+
+    if not os.path.exists(args.file):
+        print(f"[오류] 키워드 파일이 없습니다: {args.file}")
+        return 1
+
+    checkpoint = args.checkpoint or default_checkpoint_path(args.file)
+    name = os.path.splitext(os.path.basename(args.file))[0]
+
+    with KeywordCollector(workers=args.workers) as collector:
+        if not collector.is_configured():
+            print(f"[오류] 네이버 검색 API 키가 없습니다. {CONFIG_FILE}에 "
+                  "NAVER_BLOG_CLIENT_ID / NAVER_BLOG_CLIENT_SECRET을 설정하거나 대화형 모드로 한 번 실행하세요.")
+            return 1
+
+        print(f"[대량 분석] {args.file} → {checkpoint}")
+        summary = collector.analyze_file(
+            args.file, checkpoint, resume=not args.fresh,
+            analyze_competition=not args.no_competition,
+            analyze_recency=not args.no_recency,
+            analyze_intent=not args.no_intent,
+        )
+
+        print(f"\n[대량 분석] 이번 실행 {summary['analyzed']:,}개 분석, "
+              f"체크포인트에 있어 건너뜀 {summary['skipped']:,}개")
+        if summary["stopped"]:
+            print("[할당량] 오늘 API 할당량을 모두 사용해 중단했습니다. "
+                  "자정(KST) 이후 같은 명령으로 다시 실행하면 남은 키워드부터 이어서 분석합니다.")
+        elif summary["deferred"]:
+            print(f"[보류] {len(summary['deferred'])}개 키워드는 문서 수를 조회하지 못해 기록하지 않았습니다 "
+                  "(다시 실행하면 이 키워드만 다시 분석): "
+                  + ", ".join(summary["deferred"][:10]) + (" 외" if len(summary["deferred"]) > 10 else ""))
+        if collector.cache is not None:
+            print(collector.cache.summary())
+        print(collector.quota.summary())
+
+    save_checkpoint_results(checkpoint, name, args.output_dir, deferred=summary["deferred"])
+    return 2 if summary["stopped"] else 0
+
+
 # CLI 실행
 if __name__ == "__main__":
-    import sys
+    # 인자가 있으면 키워드 파일 대량 분석 (python scraper/keyword_collector.py --file keywords.txt)
+    if len(sys.argv) > 1:
+        sys.exit(bulk_main())
 
     config = load_config()
-    collector = KeywordCollector()
 
-    if not collector.is_configured():
+    # 키 확인만 할 때는 캐시 / 할당량 파일을 열지 않도록 설정에서 바로 확인
+    if not (config.get("NAVER_BLOG_CLIENT_ID") and config.get("NAVER_BLOG_CLIENT_SECRET")):
         print("=" * 50)
         print("네이버 검색 API 키가 필요합니다.")
         print("=" * 50)
@@ -551,7 +1182,6 @@ if __name__ == "__main__":
             config["NAVER_BLOG_CLIENT_ID"] = client_id
             config["NAVER_BLOG_CLIENT_SECRET"] = client_secret
             save_config(config)
-            collector = KeywordCollector(client_id, client_secret)
             print("\n[저장 완료] API 키가 저장되었습니다.")
         else:
             print("[오류] API 키를 입력해주세요.")
@@ -571,7 +1201,13 @@ if __name__ == "__main__":
     max_count = input("최대 수집 키워드 수 [기본: 50]: ").strip()
     max_count = int(max_count) if max_count.isdigit() else 50
 
-    results = collector.collect_keywords(keywords, max_keywords=max_count)
+    max_depth = input("확장 단계 수 [기본: 1]: ").strip()
+    max_depth = int(max_depth) if max_depth.isdigit() else 1
+
+    # 캐시 / 할당량 SQLite 연결은 끝나면(중단되어도) 닫음
+    with KeywordCollector() as collector:
+        results = collector.collect_keywords(keywords, max_keywords=max_count, max_depth=max_depth)
+        deferred = collector.deferred
 
     print("\n" + "=" * 50)
     print("골든 키워드 TOP 10")
@@ -581,4 +1217,4 @@ if __name__ == "__main__":
     for i, r in enumerate(golden, 1):
         print(f"{i}. {r['keyword']} - 문서 {r['docs']:,}개 {r['rating']}")
 
-    save_results(results, keywords[0])
+    save_results(results, keywords[0], deferred=deferred)
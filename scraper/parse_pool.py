@@ -0,0 +1,177 @@
+"""
+프로세스 풀 파싱 모듈
+- 본문 HTML 파싱(CPU 작업)을 별도 프로세스에서 실행해 요청 스레드가 GIL에 묶이지 않게 함
+- 요청 스레드는 받은 원본 바이트를 제한된 크기의 대기열에 넣고 바로 다음 요청으로 넘어감
+  (대기열이 차면 파싱이 따라올 때까지 요청을 잠시 멈춤)
+- 요청 / 파싱 단계별 처리량 집계
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from .parser import PostParser
+
+# 작업 프로세스마다 하나씩 만드는 파서
+_worker_parser: Optional[PostParser] = None
+
+
+def _init_worker(backend: str):
+    """작업 프로세스 초기화 (파서 생성)"""
+    global _worker_parser
+    _worker_parser = PostParser(backend)
+
+
+def _parse_in_worker(raw: bytes, encoding: str, blog_id: str, log_no: str) -> tuple:
+    """작업 프로세스에서 디코딩 + 파싱 (결과, 걸린 시간)"""
+    started = time.perf_counter()
+    result = _worker_parser.parse_mobile_post_bytes(raw, encoding, blog_id, log_no)
+    return result, time.perf_counter() - started
+
+
+class StageStats:
+    """파이프라인 단계 하나의 처리량 집계 (스레드 안전)"""
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: 단계 이름 (출력용)
+        """
+        self.name = name
+        self.count = 0
+        self.bytes = 0
+        self.busy = 0.0
+        self._first = None
+        self._last = None
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, nbytes: int = 0):
+        """
+        항목 하나 처리 기록
+
+        Args:
+            seconds: 처리에 걸린 시간 (초)
+            nbytes: 처리한 바이트 수
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.count += 1
+            self.bytes += nbytes
+            self.busy += seconds
+            if self._first is None:
+                self._first = now - seconds
+            self._last = now
+
+    @property
+    def elapsed(self) -> float:
+        """첫 항목 시작부터 마지막 항목 완료까지 (초)"""
+        if self._first is None:
+            return 0.0
+        return self._last - self._first
+
+    def summary(self) -> str:
+        """한 줄 요약"""
+        if not self.count:
+            return f"{self.name}: 0개"
+        rate = self.count / self.elapsed if self.elapsed > 0 else float("inf")
+        line = f"{self.name}: {self.count}개, {rate:.1f}개/초 (평균 {self.busy / self.count * 1000:.1f}ms)"
+        if self.bytes:
+            line += f", {self.bytes / 1024 / 1024:.1f}MB"
+        return line
+
+
+class ParsePool:
+    """
+    본문 파싱 전용 프로세스 풀
+
+    사용 예:
+        with ParsePool(workers=4) as pool:
+            scraper = NaverBlogScraper("blog_id", workers=8, parse_pool=pool)
+            posts = scraper.scrape_all(limit=50)
+            print(pool.report())
+    """
+
+    def __init__(self, workers: Optional[int] = None, queue_depth: Optional[int] = None,
+                 backend: str = "html.parser"):
+        """
+        Args:
+            workers: 파싱 프로세스 수 (None이면 CPU 코어 수)
+            queue_depth: 파싱 대기열 크기 (None이면 workers * 4) - 가득 차면 submit()이 대기
+            backend: 파서 백엔드 (PostParser 참고)
+        """
+        PostParser(backend)  # 잘못된 백엔드는 프로세스를 띄우기 전에 알림
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.queue_depth = max(1, queue_depth or self.workers * 4)
+        self.backend = backend
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                             initargs=(backend,))
+        self._slots = threading.BoundedSemaphore(self.queue_depth)
+
+        self.fetch_stats = StageStats("요청")
+        self.parse_stats = StageStats("파싱")
+        self.queue_wait = 0.0
+        self._lock = threading.Lock()
+
+    def submit(self, raw: bytes, encoding: Optional[str], blog_id: str, log_no: str) -> Future:
+        """
+        원본 HTML 바이트를 파싱 대기열에 넣기 (대기열이 가득 차면 자리가 날 때까지 대기)
+
+        Args:
+            raw: 응답 본문 바이트
+            encoding: 응답 인코딩 (None이면 UTF-8)
+            blog_id: 블로그 ID
+            log_no: 포스트 번호
+
+        Returns:
+            파싱 결과(parse_mobile_post와 같은 딕셔너리)를 돌려줄 Future
+        """
+        started = time.monotonic()
+        self._slots.acquire()
+        with self._lock:
+            self.queue_wait += time.monotonic() - started
+
+        result = Future()
+        try:
+            job = self._executor.submit(_parse_in_worker, raw, encoding or "utf-8", blog_id, log_no)
+        except BaseException:
+            self._slots.release()
+            raise
+        job.add_done_callback(lambda done: self._on_parsed(done, result))
+        return result
+
+    def parse(self, raw: bytes, encoding: Optional[str], blog_id: str, log_no: str) -> dict:
+        """submit() 후 결과까지 기다림"""
+        return self.submit(raw, encoding, blog_id, log_no).result()
+
+    def _on_parsed(self, job: Future, result: Future):
+        self._slots.release()
+        error = job.exception()
+        if error is not None:
+            result.set_exception(error)
+            return
+        parsed, seconds = job.result()
+        self.parse_stats.record(seconds)
+        result.set_result(parsed)
+
+    def report(self) -> str:
+        """단계별 처리량 요약"""
+        lines = [
+            f"[파이프라인] 파싱 프로세스 {self.workers}개, 대기열 {self.queue_depth}",
+            f"  {self.fetch_stats.summary()}",
+            f"  {self.parse_stats.summary()}",
+        ]
+        if self.queue_wait >= 0.1:
+            lines.append(f"  대기열이 차서 요청 스레드가 기다린 시간 (합계): {self.queue_wait:.1f}초")
+        return "\n".join(lines)
+
+    def close(self):
+        """진행 중인 파싱을 마치고 프로세스 종료"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
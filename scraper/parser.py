@@ -1,17 +1,399 @@
 """
 HTML 파싱 모듈
 - 모바일 버전 포스트 본문 파싱
+- 문서를 한 번만 훑으며 제목 / 본문 / 이미지를 함께 수집 (se-main-container를 다 읽으면 중단)
+- 파서 백엔드 선택 가능 (html.parser / lxml / selectolax) - 어느 백엔드든 같은 결과 반환
+- 원본 바이트에서 제목과 se-main-container 부분만 잘라 파싱하는 빠른 경로 (못 찾으면 전체 파싱)
 """
 
+import codecs
+import html as html_lib
 import re
-from bs4 import BeautifulSoup
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .blocks import COMPONENT_TYPES, TEXT, TEXT_TYPES, Block, PostBlocks
+
+try:
+    from lxml import etree as lxml_etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    try:
+        # selectolax 1.0 이전 버전
+        from selectolax.parser import HTMLParser as SelectolaxParser
+        HAS_SELECTOLAX = True
+    except ImportError:
+        HAS_SELECTOLAX = False
+
+# 본문 컨테이너 (우선순위 순): (속성, 값)
+CONTENT_CONTAINERS = (
+    ("class", "se-main-container"),
+    ("class", "post_ct"),
+    ("id", "postViewArea"),
+    ("class", "__se_component_area"),
+)
+
+# 컨테이너가 없을 때 본문으로 모을 텍스트 요소의 class
+TEXT_CLASS_PATTERN = re.compile(r"se-text|se_textarea")
+
+# 텍스트로 치지 않는 태그 (스크립트, 스타일 등)
+NON_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+# 빠른 경로: 원본 바이트에서 찾을 제목 / 본문 컨테이너 시작 태그
+TITLE_BYTES_PATTERN = re.compile(rb"<title\b[^>]*>.*?</title\s*>", re.IGNORECASE | re.DOTALL)
+MAIN_CONTAINER_BYTES_PATTERN = re.compile(
+    rb"<div\b[^>]*?\bclass\s*=\s*[\"']?[^\"'>]*?(?<![\w-])se-main-container(?![\w-])[^>]*>",
+    re.IGNORECASE,
+)
+# 컨테이너 끝을 찾을 때 세는 태그 (주석, script/style 안의 "<div"는 태그가 아니므로 통째로 건너뜀)
+DIV_SCAN_PATTERN = re.compile(
+    rb"<!--.*?-->|<(script|style)\b.*?</\1\s*>|(?P<open><div(?=[\s/>])[^>]*>)|</div\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+# 단순 개수 세기로는 끝을 잘못 찾을 수 있는 경우 (주석 / script / style, 대문자 DIV, <div/>)
+DIV_COUNT_UNSAFE_PATTERN = re.compile(
+    rb"<!--|<(?i:script|style)\b|</?(?!div)(?i:div)\b|<div\b[^>]*/>",
+)
+
+# 닫는 태그가 없는 태그
+VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link", "menuitem",
+    "meta", "param", "source", "track", "wbr", "basefont", "bgsound", "command", "frame",
+    "image", "isindex", "nextid", "spacer",
+})
+
+
+class _StopParsing(Exception):
+    """본문을 다 모아 나머지 문서를 읽을 필요가 없을 때 파싱 중단"""
+
+
+class _TextSink:
+    """요소 하나의 텍스트 수집 버퍼"""
+
+    __slots__ = ("strings",)
+
+    def __init__(self):
+        self.strings = []
+
+    def add_text(self, text: str):
+        self.strings.append(text)
+
+
+class _BlockBuilder:
+    """본문 컨테이너의 텍스트 / 이미지를 se-component 단위 블록으로 모으는 버퍼"""
+
+    __slots__ = ("blocks", "has_text", "in_component", "_type", "_strings", "_images", "_link")
+
+    def __init__(self):
+        self.blocks = []
+        self.has_text = False
+        self.in_component = False
+        self._reset(TEXT)
+
+    def _reset(self, block_type: str):
+        self._type = block_type
+        self._strings = []
+        self._images = []
+        self._link = ""
+
+    def _emit(self):
+        if not (self._strings or self._images or self._link):
+            return
+        block_type = self._type
+        if not self._strings and block_type in TEXT_TYPES:
+            # 텍스트 없이 이미지만 있는 텍스트 컴포넌트는 이미지 블록으로
+            block_type = "image"
+        text = PostParser._clean_content("\n".join(self._strings))
+        self.blocks.append(Block(block_type, text, tuple(self._images), self._link))
+
+    def add_text(self, text: str):
+        self._strings.append(text)
+        self.has_text = True
+
+    def add_image(self, src: str):
+        if self.in_component:
+            self._images.append(src)
+            return
+        # 컴포넌트 밖 이미지는 앞뒤 텍스트를 나누는 독립 블록
+        self._emit()
+        self.blocks.append(Block("image", "", (src,)))
+        self._reset(TEXT)
+
+    def add_link(self, href: str):
+        if self.in_component and self._type == "link" and not self._link:
+            self._link = href
+
+    def open_component(self, block_type: str):
+        self._emit()
+        self._reset(block_type)
+        self.in_component = True
+
+    def close_component(self):
+        self._emit()
+        self._reset(TEXT)
+        self.in_component = False
+
+    def finish(self) -> PostBlocks:
+        self._emit()
+        self._reset(TEXT)
+        self.in_component = False
+        return PostBlocks(self.blocks)
+
+
+class _PostCollector:
+    """
+    파싱 이벤트(start / end / data)를 받아 제목, 본문 블록, 이미지를 한 번에 수집
+
+    문서 순서대로 한 번만 지나가며, 열려 있는 수집 대상 요소(제목, 본문 컨테이너,
+    se-text 요소)마다 텍스트를 쌓는다. 본문 컨테이너 안은 se-component 단위 블록으로
+    나눈다. 최우선 컨테이너(se-main-container)가 닫히면 더 볼 것이 없으므로
+    _StopParsing으로 나머지 문서(추천 글, 스크립트 등)를 건너뛴다.
+    """
+
+    def __init__(self):
+        self.title: Optional[_TextSink] = None
+        self.containers: Dict[int, _BlockBuilder] = {}
+        self.text_elems: List[_TextSink] = []
+        self.page_images: List[str] = []
+        # 열린 요소 스택: (태그, 이 요소에서 시작한 수집 버퍼들, 텍스트 제외 여부, 이 요소에서 시작한 컴포넌트)
+        self._stack = []
+        self._active = []
+        self._active_containers: List[_BlockBuilder] = []
+        self._skip_depth = 0
+        self._pending = []
+
+    # --- 이벤트 ---
+
+    def start(self, tag: str, attrs: dict):
+        self._flush()
+
+        sinks = []
+        if tag == "title" and self.title is None:
+            self.title = _TextSink()
+            sinks.append(self.title)
+        if tag == "div":
+            for priority, (attr, value) in enumerate(CONTENT_CONTAINERS):
+                if priority not in self.containers and self._attr_matches(attrs, attr, value):
+                    container = _BlockBuilder()
+                    self.containers[priority] = container
+                    self._active_containers.append(container)
+                    sinks.append(container)
+        class_attr = attrs.get("class")
+        components = []
+        if class_attr:
+            if TEXT_CLASS_PATTERN.search(class_attr):
+                text_elem = _TextSink()
+                self.text_elems.append(text_elem)
+                sinks.append(text_elem)
+            if self._active_containers and "se-component" in class_attr:
+                classes = class_attr.split()
+                if "se-component" in classes:
+                    block_type = next((COMPONENT_TYPES[c] for c in classes if c in COMPONENT_TYPES), "other")
+                    for container in self._active_containers:
+                        if not container.in_component:
+                            container.open_component(block_type)
+                            components.append(container)
+        if tag == "img":
+            src = attrs.get("src") or attrs.get("data-src")
+            if src and PostParser._is_image_url(src):
+                src = PostParser._original_image_url(src)
+                self.page_images.append(src)
+                for container in self._active_containers:
+                    container.add_image(src)
+        elif tag == "a" and attrs.get("href"):
+            for container in self._active_containers:
+                container.add_link(attrs["href"])
+
+        if tag in VOID_TAGS:
+            return
+        self._active.extend(sinks)
+        skip = tag in NON_TEXT_TAGS
+        if skip:
+            self._skip_depth += 1
+        self._stack.append((tag, sinks, skip, components))
+
+    def end(self, tag: str):
+        self._flush()
+        # 짝이 맞는 가장 가까운 열린 태그까지 닫음 (없으면 무시)
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                break
+        else:
+            return
+        while len(self._stack) > index:
+            _, sinks, skip, components = self._stack.pop()
+            if skip:
+                self._skip_depth -= 1
+            for container in components:
+                container.close_component()
+            for sink in sinks:
+                self._active.remove(sink)
+                if sink in self._active_containers:
+                    self._active_containers.remove(sink)
+            if sinks and self._is_done():
+                raise _StopParsing()
+
+    def data(self, text: str):
+        self._pending.append(text)
+
+    def boundary(self):
+        """주석 / 선언 등 텍스트를 끊는 노드"""
+        self._flush()
+
+    def close(self):
+        self._flush()
+
+    # --- 결과 ---
+
+    def result(self) -> dict:
+        """수집 결과 {"title", "content", "images", "blocks"}"""
+        title = PostParser._clean_title("".join(self.title.strings)) if self.title else ""
+
+        container = None
+        for priority in range(len(CONTENT_CONTAINERS)):
+            container = self.containers.get(priority)
+            if container is not None:
+                break
+
+        blocks = container.finish() if container else PostBlocks()
+        # 본문 컨테이너가 있으면 그 안의 이미지만 (프로필 등 페이지 장식 제외)
+        images = blocks.images if container else self.page_images
+        if not (container and container.has_text) and self.text_elems:
+            blocks = PostParser._fallback_blocks("".join(e.strings) for e in self.text_elems)
+
+        return PostParser._post_result(title, blocks, images)
+
+    # --- 내부 ---
+
+    @staticmethod
+    def _attr_matches(attrs: dict, attr: str, value: str) -> bool:
+        attr_value = attrs.get(attr)
+        if attr_value is None:
+            return False
+        if attr == "class":
+            return value in attr_value.split()
+        return attr_value == value
+
+    def _flush(self):
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending = []
+        if self._skip_depth:
+            return
+        text = text.strip()
+        if text:
+            for sink in self._active:
+                sink.add_text(text)
+
+    def _is_done(self) -> bool:
+        """제목과 최우선 컨테이너 본문을 다 모았는지"""
+        main = self.containers.get(0)
+        return (
+            main is not None and main not in self._active and main.has_text
+            and self.title is not None and self.title not in self._active
+        )
+
+
+class _StreamingHTMLParser(HTMLParser):
+    """표준 라이브러리 HTMLParser 이벤트를 _PostCollector로 전달 (트리를 만들지 않음)"""
+
+    def __init__(self, collector: _PostCollector):
+        super().__init__(convert_charrefs=False)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag, {k: ("" if v is None else v) for k, v in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        self.collector.end(tag)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
+    def handle_entityref(self, name):
+        character = html_lib.unescape(f"&{name};")
+        # 모르는 엔티티는 "&이름" 그대로 둠
+        self.collector.data(character if character != f"&{name};" else f"&{name}")
+
+    def handle_charref(self, name):
+        self.collector.data(html_lib.unescape(f"&#{name};"))
+
+    def handle_comment(self, data):
+        self.collector.boundary()
+
+    def handle_decl(self, decl):
+        self.collector.boundary()
+
+    def handle_pi(self, data):
+        self.collector.boundary()
+
+    def unknown_decl(self, data):
+        self.collector.boundary()
+        if data.upper().startswith("CDATA["):
+            self.collector.data(data[len("CDATA["):])
+            self.collector.boundary()
+
+
+class _LxmlTarget:
+    """lxml 파서 target 이벤트를 _PostCollector로 전달 (트리를 만들지 않음)"""
+
+    def __init__(self, collector: _PostCollector):
+        self.collector = collector
+
+    def start(self, tag, attrib):
+        self.collector.start(tag, dict(attrib))
+
+    def end(self, tag):
+        self.collector.end(tag)
+
+    def data(self, data):
+        self.collector.data(data)
+
+    def comment(self, text):
+        self.collector.boundary()
+
+    def close(self):
+        self.collector.close()
 
 
 class PostParser:
     """네이버 블로그 포스트 HTML 파서"""
 
-    @staticmethod
-    def parse_mobile_post(html: str, blog_id: str, log_no: str) -> dict:
+    # 지원 백엔드 (빠른 순서: selectolax > lxml > html.parser)
+    BACKENDS = ("html.parser", "lxml", "selectolax")
+
+    def __init__(self, backend: str = "html.parser"):
+        """
+        Args:
+            backend: 파서 백엔드 ("html.parser", "lxml", "selectolax", "auto"=설치된 것 중 가장 빠른 것)
+        """
+        available = self.available_backends()
+        if backend == "auto":
+            backend = available[-1]
+        if backend not in self.BACKENDS:
+            raise ValueError(f"지원하지 않는 파서 백엔드입니다: {backend} (지원: {', '.join(self.BACKENDS)})")
+        if backend not in available:
+            raise ValueError(f"'{backend}' 백엔드를 쓰려면 패키지를 설치하세요: pip install {backend}")
+        self.backend = backend
+
+    @classmethod
+    def available_backends(cls) -> List[str]:
+        """설치되어 있어 사용 가능한 백엔드 (느린 것 → 빠른 것)"""
+        installed = {"html.parser": True, "lxml": HAS_LXML, "selectolax": HAS_SELECTOLAX}
+        return [name for name in cls.BACKENDS if installed[name]]
+
+    def parse_mobile_post(self, html: str, blog_id: str, log_no: str) -> dict:
         """
         모바일 버전 포스트 HTML 파싱
 
@@ -23,77 +405,271 @@ class PostParser:
         Returns:
             파싱된 포스트 데이터 딕셔너리
         """
-        soup = BeautifulSoup(html, "html.parser")
+        if self.backend == "selectolax":
+            extracted = self._extract_with_selectolax(html)
+        else:
+            extracted = self._extract_streaming(html)
 
-        result = {
+        return {
             "blogId": blog_id,
             "logNo": log_no,
-            "title": "",
-            "content": "",
-            "images": []
+            **extracted
+        }
+
+    def parse_mobile_post_bytes(self, raw: bytes, encoding: Optional[str], blog_id: str, log_no: str) -> dict:
+        """
+        응답 바이트를 그대로 받아 파싱 (parse_mobile_post와 같은 결과)
+
+        UTF-8 문서면 제목과 se-main-container 부분만 잘라 디코딩 / 파싱하고,
+        컨테이너가 없거나 본문이 비어 있으면 전체 문서를 파싱한다.
+
+        Args:
+            raw: 응답 본문 바이트
+            encoding: 응답 인코딩 (None이면 UTF-8)
+            blog_id: 블로그 ID
+            log_no: 포스트 번호
+
+        Returns:
+            파싱된 포스트 데이터 딕셔너리
+        """
+        encoding = encoding or "utf-8"
+        if self._is_utf8(encoding):
+            sliced = self._slice_post_bytes(raw)
+            if sliced is not None:
+                result = self.parse_mobile_post(sliced.decode("utf-8", errors="replace"), blog_id, log_no)
+                if result["content"]:
+                    return result
+        return self.parse_mobile_post(raw.decode(encoding, errors="replace"), blog_id, log_no)
+
+    @staticmethod
+    def _is_utf8(encoding: str) -> bool:
+        try:
+            return codecs.lookup(encoding).name == "utf-8"
+        except LookupError:
+            return False
+
+    @staticmethod
+    def _slice_post_bytes(raw: bytes) -> Optional[bytes]:
+        """
+        원본 바이트에서 <title>과 se-main-container div만 잘라 붙임
+
+        Returns:
+            잘라낸 HTML 바이트 (컨테이너를 못 찾거나 끝이 맞지 않으면 None)
+        """
+        start_tag = MAIN_CONTAINER_BYTES_PATTERN.search(raw)
+        if start_tag is None:
+            return None
+        start = start_tag.start()
+
+        end = PostParser._find_div_end(raw, start_tag.end())
+        if end is None:
+            return None
+
+        # 문서 순서를 지켜 제목을 앞이나 뒤에 붙임 (컨테이너 안에 있으면 그대로)
+        container = raw[start:end]
+        title = TITLE_BYTES_PATTERN.search(raw)
+        if title is None or start <= title.start() < end:
+            return container
+        if title.start() < start:
+            return title.group(0) + b"\n" + container
+        return container + b"\n" + title.group(0)
+
+    @staticmethod
+    def _find_div_end(raw: bytes, pos: int) -> Optional[int]:
+        """
+        pos부터 시작하는 div 내용의 짝이 맞는 닫는 태그 끝 위치
+
+        Returns:
+            </div> 바로 다음 위치 (못 찾거나 <div/>가 있으면 None)
+        """
+        # 빠른 계산: </div 사이마다 <div 수를 세어(C 수준 count) 깊이가 0이 되는 </div가 끝
+        depth = 1
+        prev = pos
+        while True:
+            close = raw.find(b"</div", prev)
+            if close < 0:
+                return None
+            depth += raw.count(b"<div", prev, close) - 1
+            if depth == 0:
+                break
+            prev = close + len(b"</div")
+        tag_end = raw.find(b">", close)
+        if tag_end < 0:
+            return None
+        end = tag_end + 1
+
+        if not DIV_COUNT_UNSAFE_PATTERN.search(raw, pos, end):
+            return end
+
+        # 주석 / script 등이 있으면 태그 단위로 다시 셈
+        depth = 1
+        for match in DIV_SCAN_PATTERN.finditer(raw, pos):
+            open_tag = match.group("open")
+            if open_tag is not None:
+                if open_tag.endswith(b"/>"):
+                    # <div/>는 백엔드마다 해석이 달라(html.parser는 바로 닫고 HTML5 파서는 열어 둠) 전체 파싱
+                    return None
+                depth += 1
+            elif match.group(0)[1:2] == b"/":
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+        return None
+
+    def _extract_streaming(self, html: str) -> dict:
+        """html.parser / lxml 이벤트를 한 번 훑어 추출"""
+        collector = _PostCollector()
+        if self.backend == "lxml":
+            parser = lxml_etree.HTMLParser(target=_LxmlTarget(collector), recover=True)
+            try:
+                parser.feed(html)
+                parser.close()
+            except _StopParsing:
+                pass
+        else:
+            parser = _StreamingHTMLParser(collector)
+            try:
+                parser.feed(html)
+                parser.close()
+            except _StopParsing:
+                pass
+        collector.close()
+        return collector.result()
+
+    @staticmethod
+    def _post_result(title: str, blocks: PostBlocks, images: List[str]) -> dict:
+        """파싱 결과 {"title", "content"(= blocks.text), "images", "blocks"}"""
+        return {
+            "title": title,
+            "content": blocks.text,
+            "images": images,
+            "blocks": blocks,
         }
 
-        # 제목 추출
-        result["title"] = PostParser._extract_title(soup)
+    @staticmethod
+    def _fallback_blocks(texts: Iterable[str]) -> PostBlocks:
+        """컨테이너 없이 se-text 요소에서 모은 텍스트를 문단 블록으로"""
+        return PostBlocks(Block("paragraph", PostParser._clean_content(text)) for text in texts)
 
-        # 본문 추출
-        result["content"] = PostParser._extract_content(soup)
+    @staticmethod
+    def _clean_title(title: str) -> str:
+        """" : 네이버 블로그" 제거"""
+        return re.sub(r"\s*:\s*네이버\s*블로그.*$", "", title)
 
-        # 이미지 추출
-        result["images"] = PostParser._extract_images(soup)
+    @staticmethod
+    def _clean_content(content_text: str) -> str:
+        """특수 문자 제거 (zero-width space 등)"""
+        return re.sub(r'[\u200b\u200c\u200d\ufeff]', '', content_text)
 
-        return result
+    @staticmethod
+    def _is_image_url(src: str) -> bool:
+        """본문 이미지 URL인지 (블로그 이미지 서버)"""
+        return "blogthumb" in src or "postfiles" in src or "pstatic" in src
 
     @staticmethod
-    def _extract_title(soup: BeautifulSoup) -> str:
-        """제목 추출"""
-        title_elem = soup.find("title")
-        if title_elem:
-            title = title_elem.get_text(strip=True)
-            # " : 네이버 블로그" 제거
-            title = re.sub(r"\s*:\s*네이버\s*블로그.*$", "", title)
-            return title
-        return ""
+    def _original_image_url(src: str) -> str:
+        """썸네일이 아닌 원본 이미지 URL로 변환"""
+        if "type=w80" in src:
+            src = re.sub(r"\?type=w\d+.*$", "", src)
+        return src
+
+    # ------------------------------------------------------------------
+    # selectolax 백엔드 - C 파서의 선택자로 컨테이너만 찾아 같은 규칙으로 추출
+    # ------------------------------------------------------------------
 
     @staticmethod
-    def _extract_content(soup: BeautifulSoup) -> str:
-        """본문 추출"""
-        # 여러 선택자 시도
-        content_selectors = [
-            {"class_": "se-main-container"},
-            {"class_": "post_ct"},
-            {"id": "postViewArea"},
-            {"class_": "__se_component_area"}
-        ]
-
-        content_text = ""
-        for selector in content_selectors:
-            content_elem = soup.find("div", **selector)
-            if content_elem:
-                content_text = content_elem.get_text(separator="\n", strip=True)
+    def _selectolax_strings(node) -> Iterator[str]:
+        """텍스트 노드 수집 (script/style 등 제외, 문서 순서)"""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.tag == "-text":
+                yield current.text_content
+                continue
+            if current.tag in NON_TEXT_TAGS or current.tag.startswith("-"):
+                continue
+            children = list(current.iter(include_text=True))
+            stack.extend(reversed(children))
+
+    @staticmethod
+    def _selectolax_text(node, separator: str = "") -> str:
+        """공백을 제거한 텍스트 조각을 separator로 연결"""
+        stripped = (text.strip() for text in PostParser._selectolax_strings(node))
+        return separator.join(text for text in stripped if text)
+
+    def _extract_with_selectolax(self, html: str) -> dict:
+        """selectolax(lexbor)로 추출"""
+        tree = SelectolaxParser(html)
+
+        title = ""
+        title_elem = tree.css_first("title")
+        if title_elem is not None:
+            title = self._clean_title(self._selectolax_text(title_elem))
+
+        # 우선순위 순으로 첫 컨테이너
+        container = None
+        for attr, value in CONTENT_CONTAINERS:
+            selector = f"div.{value}" if attr == "class" else f"div#{value}"
+            container = tree.css_first(selector)
+            if container is not None:
                 break
 
-        # 대안: se-text 클래스들 수집
-        if not content_text:
-            text_elems = soup.find_all(class_=re.compile(r"se-text|se_textarea"))
-            if text_elems:
-                texts = [e.get_text(strip=True) for e in text_elems]
-                content_text = "\n".join(texts)
+        builder = self._selectolax_blocks(container) if container is not None else None
+        blocks = builder.finish() if builder else PostBlocks()
+        if builder:
+            images = blocks.images
+        else:
+            images = []
+            for img in tree.css("img"):
+                attrs = img.attributes
+                src = attrs.get("src") or attrs.get("data-src")
+                if src and self._is_image_url(src):
+                    images.append(self._original_image_url(src))
 
-        # 특수 문자 제거 (zero-width space 등)
-        content_text = re.sub(r'[\u200b\u200c\u200d\ufeff]', '', content_text)
+        if not (builder and builder.has_text):
+            texts = [
+                self._selectolax_text(elem) for elem in tree.css("[class]")
+                if TEXT_CLASS_PATTERN.search(elem.attributes.get("class") or "")
+            ]
+            if texts:
+                blocks = self._fallback_blocks(texts)
 
-        return content_text
+        return self._post_result(title, blocks, images)
 
     @staticmethod
-    def _extract_images(soup: BeautifulSoup) -> list:
-        """이미지 URL 추출"""
-        images = []
-        for img in soup.find_all("img"):
-            src = img.get("src") or img.get("data-src")
-            if src and ("blogthumb" in src or "postfiles" in src or "pstatic" in src):
-                # 썸네일이 아닌 원본 이미지 URL로 변환
-                if "type=w80" in src:
-                    src = re.sub(r"\?type=w\d+.*$", "", src)
-                images.append(src)
-        return images
+    def _selectolax_blocks(container) -> _BlockBuilder:
+        """컨테이너 트리를 문서 순서로 훑어 블록 생성 (_PostCollector와 같은 규칙)"""
+        builder = _BlockBuilder()
+        # None은 컴포넌트가 끝나는 지점 표시
+        stack = list(reversed(list(container.iter(include_text=True))))
+        while stack:
+            node = stack.pop()
+            if node is None:
+                builder.close_component()
+                continue
+            tag = node.tag
+            if tag == "-text":
+                text = node.text_content.strip()
+                if text:
+                    builder.add_text(text)
+                continue
+            if tag.startswith("-"):
+                continue
+
+            attrs = node.attributes
+            classes = (attrs.get("class") or "").split()
+            is_component = not builder.in_component and "se-component" in classes
+            if is_component:
+                builder.open_component(next((COMPONENT_TYPES[c] for c in classes if c in COMPONENT_TYPES), "other"))
+            if tag == "img":
+                src = attrs.get("src") or attrs.get("data-src")
+                if src and PostParser._is_image_url(src):
+                    builder.add_image(PostParser._original_image_url(src))
+            elif tag == "a" and attrs.get("href"):
+                builder.add_link(attrs["href"])
+
+            if is_component:
+                stack.append(None)
+            if tag not in NON_TEXT_TAGS:
+                stack.extend(reversed(list(node.iter(include_text=True))))
+        return builder
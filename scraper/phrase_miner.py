@@ -0,0 +1,145 @@
+"""
+구문(n-gram) 추출 모듈
+- 블로그 제목 / 요약 묶음에서 자주 함께 쓰이는 2~4단어 구문을 찾음
+- 조사 분리: "카페가", "부산에서" 처럼 붙어 있는 조사를 떼어 같은 단어로 집계
+- 빈도는 문서 빈도 (한 글에서 여러 번 나와도 1번)
+- 긴 구문과 빈도가 거의 같은 짧은 구문은 긴 구문에 포함된 것으로 보고 제거
+- 숫자만 있는 단어는 구문에 넣지 않고, 영문은 글 묶음에서 가장 많이 쓰인 대소문자 표기로 돌려줌
+"""
+
+import html
+import re
+from collections import Counter
+from typing import Iterable, List, Optional, Set, Tuple
+
+# 토큰 (한글 / 영문 / 숫자 연속)
+TOKEN_PATTERN = re.compile(r"[0-9A-Za-z가-힣]+")
+
+# 두 글자 이상 조사 - 남는 단어가 두 글자 이상이면 항상 분리
+LONG_PARTICLES = (
+    "에서는", "으로는", "에게서", "까지는", "부터는",
+    "에서", "으로", "에게", "까지", "부터", "처럼", "보다", "에는", "이랑", "한테",
+)
+
+# 한 글자 조사 - 단어의 일부일 수도 있으므로 (전문가, 회의) 떼어 낸 단어가 글 묶음에 따로 나올 때만 분리
+SHORT_PARTICLES = ("은", "는", "을", "를", "가", "의", "에", "와", "과")
+
+
+class PhraseMiner:
+    """제목 묶음 구문 추출기"""
+
+    def __init__(self, min_n: int = 2, max_n: int = 4, min_count: int = 2,
+                 stop_words: Iterable[str] = (), subsume_ratio: float = 0.8):
+        """
+        Args:
+            min_n: 최소 단어 수
+            max_n: 최대 단어 수
+            min_count: 최소 문서 빈도
+            stop_words: 구문의 처음 / 끝에 올 수 없는 단어
+            subsume_ratio: 짧은 구문 빈도 대비 긴 구문 빈도가 이 비율 이상이면 짧은 구문 제거
+        """
+        self.min_n = max(1, min_n)
+        self.max_n = max(self.min_n, max_n)
+        self.min_count = min_count
+        self.stop_words = frozenset(stop_words)
+        self.subsume_ratio = subsume_ratio
+
+    def mine(self, texts: Iterable[str], exclude: Iterable[str] = (),
+             limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        구문 추출
+
+        Args:
+            texts: 제목 / 요약 등 문서들
+            exclude: 구문에서 뺄 단어 (검색 키워드 등) - 이 단어를 사이에 둔 구문도 만들지 않음
+            limit: 최대 결과 수
+
+        Returns:
+            [(구문, 문서 빈도), ...] 빈도 높은 순 (같으면 긴 구문 먼저)
+        """
+        docs = [TOKEN_PATTERN.findall(html.unescape(text)) for text in texts]
+        exclude = {token for word in exclude for token in TOKEN_PATTERN.findall(word.lower())}
+
+        vocabulary = set()
+        for tokens in docs:
+            vocabulary.update(token.lower() for token in tokens)
+        stems = {}
+        # 원래 표기 그대로의 단어별 등장 횟수 (구문을 가장 많이 쓰인 표기로 보여 줄 때 씀)
+        surfaces = Counter()
+
+        counts = Counter()
+        for tokens in docs:
+            grams = set()
+            # 제외 단어 / 숫자만 있는 단어 자리에서 끊어 구문이 그 너머로 이어지지 않게 함
+            segment = []
+            for token in tokens:
+                lowered = token.lower()
+                stem = stems.get(lowered)
+                if stem is None:
+                    stem = stems[lowered] = self._strip_particle(lowered, vocabulary)
+                if stem in exclude or stem.isdigit():
+                    self._collect(segment, grams)
+                    segment = []
+                    continue
+                segment.append(stem)
+            self._collect(segment, grams)
+            counts.update(grams)
+            surfaces.update(tokens)
+
+        frequent = {gram: n for gram, n in counts.items() if n >= self.min_count}
+        phrases = self._remove_subsumed(frequent)
+        phrases.sort(key=lambda item: (-item[1], -len(item[0])))
+        if limit is not None:
+            phrases = phrases[:limit]
+        # 어간 → 표기별 횟수 (소문자 표기도 같이 세어 소문자가 다수면 소문자로 보임)
+        forms = {}
+        for token, n in surfaces.items():
+            stem = stems[token.lower()]
+            forms.setdefault(stem, Counter())[token[:len(stem)]] += n
+        display = {stem: counter.most_common(1)[0][0] for stem, counter in forms.items()}
+        return [(" ".join(display.get(stem, stem) for stem in gram), n) for gram, n in phrases]
+
+    def _collect(self, segment: List[str], grams: Set[tuple]):
+        """구간 하나의 n-gram 수집 (불용어로 시작 / 끝나는 구문, 한 글자 단어는 제외)"""
+        stop_words = self.stop_words
+        length = len(segment)
+        for start in range(length):
+            first = segment[start]
+            if first in stop_words:
+                continue
+            for n in range(self.min_n, min(self.max_n, length - start) + 1):
+                last = segment[start + n - 1]
+                if last in stop_words:
+                    continue
+                if n == 1 and len(first) < 2:
+                    continue
+                grams.add(tuple(segment[start:start + n]))
+
+    def _remove_subsumed(self, frequent: dict) -> List[Tuple[tuple, int]]:
+        """더 긴 구문에 거의 항상 포함되어 나오는 짧은 구문 제거"""
+        subsumed = set()
+        for gram, n in frequent.items():
+            if len(gram) < 2:
+                continue
+            # 바로 한 단어 짧은 앞 / 뒤 구문만 비교 (더 짧은 것은 그 구문이 다시 비교)
+            for part in (gram[:-1], gram[1:]):
+                count = frequent.get(part)
+                if count and n >= count * self.subsume_ratio:
+                    subsumed.add(part)
+        return [(gram, n) for gram, n in frequent.items() if gram not in subsumed]
+
+    @staticmethod
+    def _strip_particle(token: str, vocabulary: Set[str]) -> str:
+        """
+        토큰 끝의 조사 분리
+
+        Args:
+            token: 소문자 토큰
+            vocabulary: 글 묶음 전체 토큰 (한 글자 조사는 떼어 낸 단어가 여기 있을 때만 분리)
+        """
+        for particle in LONG_PARTICLES:
+            if token.endswith(particle) and len(token) - len(particle) >= 2:
+                return token[:-len(particle)]
+        if len(token) >= 3 and token[-1] in SHORT_PARTICLES and token[:-1] in vocabulary:
+            return token[:-1]
+        return token
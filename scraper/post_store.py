@@ -0,0 +1,76 @@
+"""
+블로그별 포스트 저장소 모듈
+- 지난 실행에서 수집한 포스트를 logNo 기준으로 보관
+- RSS의 pubDate / description이 그대로면 본문을 다시 받지 않고 재사용
+- RSS 피드에는 최근 글만 나오므로 저장할 때 최근 글(logNo가 큰 순) MAX_ENTRIES개만 남김
+"""
+
+import hashlib
+from typing import Optional
+
+from .cache import CACHE_DIR, JsonFileCache
+
+
+class PostStore:
+    """logNo 기준 포스트 저장소 (output/.cache/posts/{blog_id}.json)"""
+
+    # 블로그당 보관할 최대 포스트 수 (RSS 피드에 나오는 글 수보다 넉넉하게)
+    MAX_ENTRIES = 200
+
+    def __init__(self, blog_id: str, cache_dir: str = CACHE_DIR, max_entries: int = MAX_ENTRIES):
+        """
+        Args:
+            blog_id: 네이버 블로그 ID
+            cache_dir: 캐시 루트 폴더
+            max_entries: 보관할 최대 포스트 수 (넘으면 오래된 글부터 삭제)
+        """
+        self.blog_id = blog_id
+        self.max_entries = max_entries
+        self._cache = JsonFileCache("posts", cache_dir=cache_dir)
+        self.entries = self._cache.get(blog_id) or {}
+
+    @staticmethod
+    def fingerprint(post: dict) -> str:
+        """RSS 정보로 만든 변경 감지용 지문 (pubDate + description)"""
+        raw = f"{post.get('pubDate', '')}\n{post.get('description', '')}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get_unchanged(self, post: dict, include_images: bool = False,
+                      include_blocks: bool = False) -> Optional[dict]:
+        """
+        변경되지 않은 저장본 조회
+
+        Args:
+            post: RSS 포스트 정보
+            include_images: 이미지 URL이 필요한지 여부 (저장본에 없으면 다시 수집)
+            include_blocks: 본문 블록이 필요한지 여부 (저장본에 없으면 다시 수집)
+
+        Returns:
+            RSS 정보를 최신으로 덮어쓴 저장본 (새 글이거나 바뀐 글이면 None)
+        """
+        entry = self.entries.get(post.get("logNo", ""))
+        if not entry or entry.get("fingerprint") != self.fingerprint(post):
+            return None
+
+        stored = entry.get("post", {})
+        if "content" not in stored or (include_images and "images" not in stored) \
+                or (include_blocks and "blocks" not in stored):
+            return None
+        return {**stored, **post}
+
+    def put(self, post: dict):
+        """본문까지 수집된 포스트 저장 (save() 호출 시 파일에 기록)"""
+        log_no = post.get("logNo")
+        if not log_no or "content" not in post:
+            return
+        self.entries[log_no] = {"fingerprint": self.fingerprint(post), "post": post}
+
+    def save(self):
+        """저장소 파일에 기록 (최근 글 max_entries개만 남김)"""
+        if len(self.entries) > self.max_entries:
+            # logNo는 글을 쓴 순서대로 커지므로 큰 번호가 최근 글
+            recent = sorted(self.entries, key=lambda log_no: int(log_no) if log_no.isdigit() else 0,
+                            reverse=True)[:self.max_entries]
+            self.entries = {log_no: self.entries[log_no] for log_no in recent}
+        self._cache.set(self.blog_id, self.entries)
+
@@ -0,0 +1,146 @@
+"""
+요청 속도 제한 모듈
+- 호스트별 토큰 버킷으로 동시 요청 시에도 요청 간격 유지
+- 오류가 나면 속도를 절반으로 줄이고, 성공이 이어지면 원래 속도까지 천천히 회복 (AIMD)
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """토큰 버킷 (초당 rate개 충전, 최대 capacity개 보관)"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: 초당 충전되는 토큰 수
+            capacity: 버킷 최대 크기 (순간적으로 허용되는 연속 요청 수)
+        """
+        self.rate = rate
+        self.base_rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전"""
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def set_rate(self, rate: float):
+        """충전 속도 변경 (변경 전까지 쌓인 토큰은 유지)"""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def reserve(self) -> float:
+        """
+        토큰 1개 예약
+
+        Returns:
+            토큰을 쓰기 전에 기다려야 할 시간 (초)
+        """
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            # 부족한 토큰은 미리 차감해 두고 대기 시간만 돌려준다
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """토큰을 얻을 때까지 대기"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """호스트별 토큰 버킷 속도 제한기 (스레드 안전, 전체 요청 수 제한 선택)"""
+
+    # 오류 시 속도 감소 비율 / 최저 속도 (기본 속도 대비)
+    BACKOFF_FACTOR = 0.5
+    MIN_RATE_FACTOR = 0.1
+
+    # 성공 시 회복량 (기본 속도 대비)
+    RECOVERY_STEP = 0.1
+
+    def __init__(self, rate: float, burst: float = 1.0, global_rate: Optional[float] = None,
+                 global_burst: Optional[float] = None):
+        """
+        Args:
+            rate: 호스트당 초당 허용 요청 수
+            burst: 호스트당 연속 허용 요청 수
+            global_rate: 모든 호스트를 합친 초당 허용 요청 수 (None이면 제한 없음)
+            global_burst: 전체 연속 허용 요청 수 (None이면 global_rate와 동일)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.global_bucket = None
+        if global_rate:
+            self.global_bucket = TokenBucket(global_rate, global_burst or max(1.0, global_rate))
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_delay(cls, delay: float, burst: float = 1.0) -> Optional["RateLimiter"]:
+        """요청 간 딜레이(초)로 속도 제한기 생성 (딜레이가 0이면 None)"""
+        if not delay or delay <= 0:
+            return None
+        return cls(rate=1.0 / delay, burst=burst)
+
+    def _bucket(self, host: str) -> TokenBucket:
+        """호스트별 버킷 (없으면 생성)"""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url_or_host: str):
+        """
+        해당 호스트로 요청을 보낼 수 있을 때까지 대기
+
+        Args:
+            url_or_host: 요청 URL 또는 호스트명
+        """
+        if self.global_bucket:
+            self.global_bucket.acquire()
+        self._bucket(self._host(url_or_host)).acquire()
+
+    async def acquire_async(self, url_or_host: str):
+        """acquire()의 asyncio 버전 (이벤트 루프를 막지 않고 대기)"""
+        if self.global_bucket:
+            wait = self.global_bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        wait = self._bucket(self._host(url_or_host)).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record_error(self, url_or_host: str):
+        """오류(429, 5xx 등) 관측 - 해당 호스트 속도를 줄임"""
+        bucket = self._bucket(self._host(url_or_host))
+        new_rate = max(bucket.base_rate * self.MIN_RATE_FACTOR, bucket.rate * self.BACKOFF_FACTOR)
+        if new_rate < bucket.rate:
+            bucket.set_rate(new_rate)
+
+    def record_success(self, url_or_host: str):
+        """성공 관측 - 줄였던 속도를 조금씩 회복"""
+        bucket = self._bucket(self._host(url_or_host))
+        if bucket.rate < bucket.base_rate:
+            bucket.set_rate(min(bucket.base_rate, bucket.rate + bucket.base_rate * self.RECOVERY_STEP))
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        """URL에서 호스트 추출 (호스트명이면 그대로)"""
+        return urlsplit(url_or_host).netloc or url_or_host
@@ -0,0 +1,132 @@
+"""
+재시도 / 서킷 브레이커 모듈
+- 일시적 오류(429, 5xx, 연결 오류)는 지터를 섞은 지수 백오프로 재시도 (Retry-After 우선)
+- 호스트별 연속 실패가 쌓이면 일정 시간 요청을 차단해 장애 중인 엔드포인트를 보호
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+
+
+class CircuitOpenError(requests.RequestException):
+    """서킷이 열려 있어 요청을 보내지 않음 (기존 RequestException 처리로 함께 잡힘)"""
+
+
+class RetryPolicy:
+    """지터 지수 백오프 재시도 정책"""
+
+    # 재시도할 HTTP 상태 코드
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, max_retries: int = 3, backoff: float = 0.5, max_backoff: float = 30.0,
+                 max_retry_after: float = 120.0):
+        """
+        Args:
+            max_retries: 최대 재시도 횟수 (0이면 재시도 안 함)
+            backoff: 첫 재시도 대기 시간의 기준값 (초)
+            max_backoff: 백오프 대기 시간 상한 (초)
+            max_retry_after: Retry-After 헤더를 따를 최대 대기 시간 (초)
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """재시도 대상 상태 코드인지"""
+        return status_code in self.RETRY_STATUSES
+
+    def delay_for(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        재시도 전 대기 시간 (full jitter: 0 ~ backoff * 2^attempt 사이 무작위)
+
+        Args:
+            attempt: 지금까지 실패한 횟수 - 1 (첫 재시도는 0)
+            retry_after: 서버가 알려준 대기 시간 (초)
+        """
+        ceiling = min(self.max_backoff, self.backoff * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After 헤더 (초 또는 HTTP 날짜)를 초 단위로 변환"""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """호스트별 서킷 브레이커 (연속 실패 시 reset_timeout 동안 요청 차단)"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            reset_timeout: 서킷을 연 뒤 시험 요청을 허용하기까지의 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = {}
+        self._opened_at = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        return urlsplit(url_or_host).netloc or url_or_host
+
+    def before_request(self, url_or_host: str):
+        """
+        요청 전 확인
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있을 때
+        """
+        host = self._host(url_or_host)
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return
+            remaining = self.reset_timeout - (time.monotonic() - opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(f"{host} 요청 차단 중 (연속 실패, {remaining:.0f}초 후 재시도)")
+            # 반쯤 열림: 시험 요청 하나만 통과시키고, 실패하면 다시 reset_timeout 동안 차단
+            self._opened_at[host] = time.monotonic()
+
+    def record_success(self, url_or_host: str):
+        """요청 성공 기록 (서킷 닫기)"""
+        host = self._host(url_or_host)
+        with self._lock:
+            self._failures.pop(host, None)
+            if self._opened_at.pop(host, None) is not None:
+                print(f"[복구] {host} 요청 재개")
+
+    def record_failure(self, url_or_host: str):
+        """요청 실패 기록 (연속 실패가 임계값에 닿으면 서킷 열기)"""
+        host = self._host(url_or_host)
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures >= self.failure_threshold and host not in self._opened_at:
+                self._opened_at[host] = time.monotonic()
+                print(f"[경고] {host} 연속 {failures}회 실패 - {self.reset_timeout:.0f}초간 요청 중단")
+            elif host in self._opened_at:
+                self._opened_at[host] = time.monotonic()
@@ -0,0 +1,16 @@
+from scraper.phrase_miner import PhraseMiner
+
+
+def test_lowercase_majority_is_shown_in_lowercase():
+    titles = ["iphone 케이스 추천"] * 5 + ["IPhone 케이스 추천"]
+    assert PhraseMiner().mine(titles) == [("iphone 케이스 추천", 6)]
+
+
+def test_uppercase_majority_is_shown_in_uppercase():
+    titles = ["iphone 케이스 추천"] + ["IPhone 케이스 추천"] * 5
+    assert PhraseMiner().mine(titles) == [("IPhone 케이스 추천", 6)]
+
+
+def test_particle_is_stripped_from_surface_form():
+    titles = ["Galaxy를 케이스", "Galaxy 케이스 추천", "galaxy 케이스 후기", "GALAXY 케이스"]
+    assert PhraseMiner().mine(titles)[0] == ("Galaxy 케이스", 4)
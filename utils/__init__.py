@@ -1,3 +1,17 @@
-from .helpers import save_json, save_posts_to_files, save_youtube_to_files
+from .helpers import (
+    JsonlWriter,
+    iter_jsonl,
+    save_json,
+    save_posts_stream,
+    save_posts_to_files,
+    save_youtube_to_files,
+)
 
-__all__ = ["save_json", "save_posts_to_files", "save_youtube_to_files"]
+__all__ = [
+    "JsonlWriter",
+    "iter_jsonl",
+    "save_json",
+    "save_posts_stream",
+    "save_posts_to_files",
+    "save_youtube_to_files",
+]
@@ -16,9 +16,6 @@ import sys
 import io
 from pathlib import Path
 
-# Windows 콘솔 UTF-8 출력 설정
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
 # 프로젝트 루트 기준 경로
 ROOT = Path(__file__).parent.parent
 BLOGS_FILE = ROOT / "config" / "blogs.json"
@@ -83,6 +80,9 @@ def get_by_id(blogs, target_id):
 
 
 def main():
+    # Windows 콘솔 UTF-8 출력 설정 (다른 모듈에서 import할 때는 건드리지 않음)
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
     blogs = load_blogs()
 
     if len(sys.argv) < 2 or sys.argv[1] == "all":
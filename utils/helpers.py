@@ -5,6 +5,7 @@
 import json
 import os
 from datetime import datetime
+from typing import Iterable, Iterator
 
 
 def save_json(data: list | dict, filepath: str) -> str:
@@ -27,6 +28,92 @@ def save_json(data: list | dict, filepath: str) -> str:
     return filepath
 
 
+# 요약 파일의 분석 가이드 (/review 명령에서 참조)
+POSTS_SUMMARY_GUIDE = {
+    "출력규칙": "반드시 마크다운 표(|---|---|) 형식 사용. 각 섹션은 ### 헤더로 구분. 항목별 상세 설명 필수.",
+    "전체분석": {
+        "설명": "블로그 전체를 12가지 항목으로 종합 분석",
+        "형식": "각 항목마다 마크다운 표(항목|점수/100|분석내용) 사용",
+        "항목": ["콘텐츠장단점", "운영자문제점", "SEO개선점", "전략제안", "타겟독자", "브랜딩", "발행패턴", "제목패턴", "수익화", "경쟁환경", "AI대응력", "독자참여도"],
+        "필수": "각 항목 100점 만점 점수 + 장점/단점/개선안 구체적 서술"
+    },
+    "특정글분석": {
+        "설명": "posts 파일에서 index 번호로 지정된 글의 본문을 심층 분석",
+        "형식": [
+            "### 1. 콘텐츠 구조 분석 - 마크다운 표(구성요소|내용|평가) + 별점(★) 5점 만점",
+            "### 2. 강점 4가지 - 번호 매기고 각각 2-3문장으로 상세 설명",
+            "### 3. 약점 및 개선점 - 마크다운 표(약점|현재상태|개선방안) 3개 이상",
+            "### 4. SEO 분석 - 제목패턴, 핵심키워드 5개, 추천 메타설명 50자 이상",
+            "### 5. 독자 반응 예측 - 마크다운 표(반응유형|예상반응|근거) 4개 이상",
+            "### 6. 종합 평가 - 마크다운 표(평가항목|점수/100|코멘트) 정보성,가독성,SEO,독창성,실용성",
+            "### 7. 총평 - 3-4문장으로 글의 가치와 개선 방향 요약"
+        ]
+    },
+    "빠른요약": {
+        "설명": "블로그 전체를 3줄로 요약",
+        "형식": ["- **주제**: ...", "- **강점**: ...", "- **개선점**: ..."]
+    },
+    "제목분석": {
+        "설명": "제목 패턴과 SEO 분석",
+        "형식": ["제목패턴 분류표", "SEO 키워드 추출", "개선 필요 제목 3개 + 수정안"]
+    }
+}
+
+
+def _output_filenames(prefix: str, timestamp: str) -> tuple:
+    """(posts 파일명, summary 파일명) - prefix가 있으면 prefix_summary_날짜.json"""
+    if prefix:
+        return f"{prefix}_posts_{timestamp}.json", f"{prefix}_summary_{timestamp}.json"
+    return f"posts_{timestamp}.json", f"summary_{timestamp}.json"
+
+
+def _parse_pubdate(pub_date_str: str) -> str:
+    """pubDate에서 요일 추출"""
+    if not pub_date_str:
+        return ""
+    # "Tue, 27 Jan 2026 08:02:27 +0900" 형식
+    day_map = {"Mon": "월", "Tue": "화", "Wed": "수", "Thu": "목", "Fri": "금", "Sat": "토", "Sun": "일"}
+    parts = pub_date_str.split(",")
+    if parts:
+        day_abbr = parts[0].strip()
+        return day_map.get(day_abbr, day_abbr)
+    return ""
+
+
+def _build_post_summary(i: int, p: dict, prefix: str) -> dict:
+    """요약 파일의 포스트 항목"""
+    title = p.get("title", "")
+    content = p.get("content", "")
+    pub_date = p.get("pubDate", "")
+    log_no = p.get("logNo", "")
+    images = p.get("images", [])
+
+    return {
+        "index": f"{i:02d}",
+        "logNo": log_no,
+        "url": f"https://blog.naver.com/{prefix}/{log_no}" if prefix and log_no else "",
+        "title": title,
+        "title_length": len(title),
+        "pubDate": pub_date,
+        "day_of_week": _parse_pubdate(pub_date),
+        "has_content": bool(content),
+        "content_length": len(content) if content else 0,
+        "image_count": len(images)
+    }
+
+
+def _build_posts_summary(post_summaries: list, prefix: str) -> dict:
+    """요약 파일 내용"""
+    return {
+        "_guide": POSTS_SUMMARY_GUIDE,
+        "blog_id": prefix,
+        "blog_url": f"https://blog.naver.com/{prefix}" if prefix else "",
+        "total_posts": len(post_summaries),
+        "scraped_at": datetime.now().isoformat(),
+        "posts": post_summaries
+    }
+
+
 def save_posts_to_files(posts: list, output_dir: str = "output", prefix: str = "") -> dict:
     """
     포스트 데이터를 파일로 저장
@@ -42,96 +129,184 @@ def save_posts_to_files(posts: list, output_dir: str = "output", prefix: str = "
     os.makedirs(output_dir, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    # 파일명 생성 (prefix가 있으면 prefix_summary_날짜.json)
-    if prefix:
-        posts_filename = f"{prefix}_posts_{timestamp}.json"
-        summary_filename = f"{prefix}_summary_{timestamp}.json"
-    else:
-        posts_filename = f"posts_{timestamp}.json"
-        summary_filename = f"summary_{timestamp}.json"
+    posts_filename, summary_filename = _output_filenames(prefix, timestamp)
 
     # 전체 데이터 저장
     all_posts_file = os.path.join(output_dir, posts_filename)
     save_json(posts, all_posts_file)
 
     # 요약 정보 저장
-    def parse_pubdate(pub_date_str):
-        """pubDate에서 요일 추출"""
-        if not pub_date_str:
-            return ""
-        # "Tue, 27 Jan 2026 08:02:27 +0900" 형식
-        day_map = {"Mon": "월", "Tue": "화", "Wed": "수", "Thu": "목", "Fri": "금", "Sat": "토", "Sun": "일"}
-        parts = pub_date_str.split(",")
-        if parts:
-            day_abbr = parts[0].strip()
-            return day_map.get(day_abbr, day_abbr)
-        return ""
-
-    def build_post_summary(i, p):
-        title = p.get("title", "")
-        content = p.get("content", "")
-        pub_date = p.get("pubDate", "")
-        log_no = p.get("logNo", "")
-        images = p.get("images", [])
+    summary = _build_posts_summary([_build_post_summary(i, p, prefix) for i, p in enumerate(posts)], prefix)
 
-        return {
-            "index": f"{i:02d}",
-            "logNo": log_no,
-            "url": f"https://blog.naver.com/{prefix}/{log_no}" if prefix and log_no else "",
-            "title": title,
-            "title_length": len(title),
-            "pubDate": pub_date,
-            "day_of_week": parse_pubdate(pub_date),
-            "has_content": bool(content),
-            "content_length": len(content) if content else 0,
-            "image_count": len(images)
-        }
+    summary_file = os.path.join(output_dir, summary_filename)
+    save_json(summary, summary_file)
 
-    summary = {
-        "_guide": {
-            "출력규칙": "반드시 마크다운 표(|---|---|) 형식 사용. 각 섹션은 ### 헤더로 구분. 항목별 상세 설명 필수.",
-            "전체분석": {
-                "설명": "블로그 전체를 12가지 항목으로 종합 분석",
-                "형식": "각 항목마다 마크다운 표(항목|점수/100|분석내용) 사용",
-                "항목": ["콘텐츠장단점", "운영자문제점", "SEO개선점", "전략제안", "타겟독자", "브랜딩", "발행패턴", "제목패턴", "수익화", "경쟁환경", "AI대응력", "독자참여도"],
-                "필수": "각 항목 100점 만점 점수 + 장점/단점/개선안 구체적 서술"
-            },
-            "특정글분석": {
-                "설명": "posts 파일에서 index 번호로 지정된 글의 본문을 심층 분석",
-                "형식": [
-                    "### 1. 콘텐츠 구조 분석 - 마크다운 표(구성요소|내용|평가) + 별점(★) 5점 만점",
-                    "### 2. 강점 4가지 - 번호 매기고 각각 2-3문장으로 상세 설명",
-                    "### 3. 약점 및 개선점 - 마크다운 표(약점|현재상태|개선방안) 3개 이상",
-                    "### 4. SEO 분석 - 제목패턴, 핵심키워드 5개, 추천 메타설명 50자 이상",
-                    "### 5. 독자 반응 예측 - 마크다운 표(반응유형|예상반응|근거) 4개 이상",
-                    "### 6. 종합 평가 - 마크다운 표(평가항목|점수/100|코멘트) 정보성,가독성,SEO,독창성,실용성",
-                    "### 7. 총평 - 3-4문장으로 글의 가치와 개선 방향 요약"
-                ]
-            },
-            "빠른요약": {
-                "설명": "블로그 전체를 3줄로 요약",
-                "형식": ["- **주제**: ...", "- **강점**: ...", "- **개선점**: ..."]
-            },
-            "제목분석": {
-                "설명": "제목 패턴과 SEO 분석",
-                "형식": ["제목패턴 분류표", "SEO 키워드 추출", "개선 필요 제목 3개 + 수정안"]
-            }
-        },
-        "blog_id": prefix,
-        "blog_url": f"https://blog.naver.com/{prefix}" if prefix else "",
-        "total_posts": len(posts),
-        "scraped_at": datetime.now().isoformat(),
-        "posts": [build_post_summary(i, p) for i, p in enumerate(posts)]
+    return {
+        "posts_file": all_posts_file,
+        "summary_file": summary_file,
+        "total": len(posts)
     }
 
+
+class JsonlWriter:
+    """
+    한 줄에 JSON 객체 하나씩 기록하는 스트리밍 writer
+
+    첫 기록 시 파일을 열고, 기록할 때마다 flush하므로
+    중간에 프로세스가 죽어도 그때까지의 데이터는 파일에 남는다.
+    이어 쓰기로 열면 중단으로 잘린 마지막 줄을 먼저 정리한다.
+    """
+
+    def __init__(self, filepath: str, append: bool = False):
+        """
+        Args:
+            filepath: 저장 경로
+            append: 기존 파일 뒤에 이어 쓰기 여부
+        """
+        self.filepath = filepath
+        self.append = append
+        self.count = 0
+        self._file = None
+
+    def write(self, obj: dict):
+        """객체 한 줄 기록 후 flush"""
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.filepath) or ".", exist_ok=True)
+            if self.append and os.path.exists(self.filepath):
+                _repair_last_line(self.filepath)
+            self._file = open(self.filepath, "a" if self.append else "w", encoding="utf-8")
+        self._file.write(json.dumps(obj, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _repair_last_line(filepath: str):
+    """
+    중단으로 줄바꿈 없이 끝난 마지막 줄 정리 (이어 쓴 첫 객체가 그 줄에 붙지 않도록)
+
+    완전한 JSON이면 줄바꿈만 붙이고, 잘린 줄이면 잘라 낸다.
+    """
+    with open(filepath, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+        # 마지막 줄바꿈 위치를 뒤에서부터 찾음
+        start = end
+        while start > 0:
+            size = min(start, 65536)
+            f.seek(start - size)
+            index = f.read(size).rfind(b"\n")
+            if index >= 0:
+                start = start - size + index + 1
+                break
+            start -= size
+        f.seek(start)
+        try:
+            json.loads(f.read(end - start).decode("utf-8"))
+        except ValueError:
+            f.truncate(start)
+        else:
+            f.write(b"\n")
+
+
+def iter_jsonl(filepath: str) -> Iterator[dict]:
+    """
+    JSONL 파일을 한 줄씩 읽기
+
+    중단으로 잘린 마지막 줄은 조용히 무시하고,
+    중간에 읽을 수 없는 줄이 있으면 줄 번호와 함께 경고를 출력하고 건너뛴다.
+    """
+    broken = None
+    with open(filepath, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            # 읽지 못한 줄 뒤에 내용이 더 있으면 잘린 마지막 줄이 아니라 손상된 줄
+            if broken is not None:
+                print(f"[경고] {filepath}:{broken} 줄을 읽을 수 없어 건너뜁니다")
+                broken = None
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                broken = number
+
+
+def jsonl_to_json(jsonl_file: str, json_file: str) -> int:
+    """
+    JSONL 파일을 save_json()과 같은 형식의 JSON 배열로 변환 (전체를 메모리에 올리지 않음)
+
+    Returns:
+        변환된 항목 수
+    """
+    count = 0
+    tmp_file = f"{json_file}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as out:
+        out.write("[")
+        for obj in iter_jsonl(jsonl_file):
+            item = json.dumps(obj, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+            out.write(("," if count else "") + "\n  " + item)
+            count += 1
+        out.write("\n]" if count else "]")
+    os.replace(tmp_file, json_file)
+    return count
+
+
+def save_posts_stream(posts: Iterable[dict], output_dir: str = "output", prefix: str = "") -> dict:
+    """
+    포스트를 받는 대로 JSONL로 기록하고, 끝나면 posts/summary 파일 생성
+
+    수집 중에는 {prefix}_posts_{날짜}.jsonl에 포스트가 하나씩 추가되므로
+    중간에 중단되어도 그때까지의 포스트가 남고, 수집이 끝나기 전에도 읽을 수 있다.
+    완료되면 save_posts_to_files()와 같은 posts/summary 파일을 만들고 JSONL은 삭제한다.
+
+    Args:
+        posts: 포스트 iterable (예: NaverBlogScraper.iter_posts())
+        output_dir: 출력 디렉토리
+        prefix: 파일명 앞에 붙일 접두사 (예: 블로그 ID)
+
+    Returns:
+        저장 결과 정보 (포스트가 없으면 파일 경로는 None)
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    posts_filename, summary_filename = _output_filenames(prefix, timestamp)
+    all_posts_file = os.path.join(output_dir, posts_filename)
+    jsonl_file = f"{all_posts_file}l"
+
+    # 요약에 필요한 정보만 메모리에 유지
+    post_summaries = []
+    with JsonlWriter(jsonl_file) as writer:
+        for post in posts:
+            writer.write(post)
+            post_summaries.append(_build_post_summary(len(post_summaries), post, prefix))
+
+    if not post_summaries:
+        return {"posts_file": None, "summary_file": None, "total": 0}
+
+    jsonl_to_json(jsonl_file, all_posts_file)
+    os.remove(jsonl_file)
+
     summary_file = os.path.join(output_dir, summary_filename)
-    save_json(summary, summary_file)
+    save_json(_build_posts_summary(post_summaries, prefix), summary_file)
 
     return {
         "posts_file": all_posts_file,
         "summary_file": summary_file,
-        "total": len(posts)
+        "total": len(post_summaries)
     }
 
 